@@ -0,0 +1,117 @@
+"""
+Compare get_entries on a scanned calendar page against one parsed with a CalendarIndex.
+
+Usage (from backend/):
+    uv run python benchmarks/calendar_index.py [--years 50] [--entries-per-month 5] [--queries 500]
+
+Builds a synthetic calendar with every month and special day of each year and a few entries per
+month, renders it, and parses it back with and without index=True. Then times single-date,
+one-month and one-year queries on both pages, after checking that they return the same entries.
+"""
+
+import argparse
+import random
+import statistics
+import time
+from collections.abc import Callable
+
+from lorekeeper.obsidian_portal.calendar_parser import (
+    CALENDAR_ORDER,
+    MONTHS,
+    SPECIAL_DAYS,
+    CalendarDate,
+    CalendarPage,
+    add_entry,
+    get_entries,
+    is_leap_year,
+    parse_body,
+    render_body,
+)
+
+_FIRST_YEAR = 1350
+
+
+def _synthetic_calendar(years: int, entries_per_month: int, rng: random.Random) -> str:
+    page = parse_body("Calendar of Harptos\n\n")
+    for year in range(_FIRST_YEAR, _FIRST_YEAR + years):
+        for name in CALENDAR_ORDER:
+            if name == "Shieldmeet" and not is_leap_year(year):
+                continue
+            if name in SPECIAL_DAYS:
+                add_entry(page, CalendarDate(year=year, month_or_special_day=name), f"{name} {year}")
+                continue
+            for day in rng.sample(range(1, 31), entries_per_month):
+                add_entry(page, CalendarDate(year=year, month_or_special_day=name, day=day), f"{name} {day}, {year}")
+    return render_body(page)
+
+
+def _random_date(years: int, rng: random.Random) -> CalendarDate:
+    return CalendarDate(
+        year=rng.randrange(_FIRST_YEAR, _FIRST_YEAR + years),
+        month_or_special_day=rng.choice(MONTHS),
+        day=rng.randint(1, 30),
+    )
+
+
+def _one_month(date: CalendarDate) -> tuple[CalendarDate, CalendarDate]:
+    return date.model_copy(update={"day": 1}), date.model_copy(update={"day": 30})
+
+
+def _one_year(date: CalendarDate) -> tuple[CalendarDate, CalendarDate]:
+    return (
+        CalendarDate(year=date.year, month_or_special_day="Hammer", day=1),
+        CalendarDate(year=date.year, month_or_special_day="Nightal", day=30),
+    )
+
+
+def _time_ms(fn: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def _median_query_ms(page: CalendarPage, ranges: list[tuple[CalendarDate, CalendarDate]]) -> float:
+    return statistics.median(
+        _time_ms(lambda start=start, end=end: get_entries(page, start, end)) for start, end in ranges
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare calendar queries with and without a CalendarIndex.")
+    parser.add_argument("--years", type=int, default=50)
+    parser.add_argument("--entries-per-month", type=int, default=5)
+    parser.add_argument("--queries", type=int, default=500)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    raw = _synthetic_calendar(args.years, args.entries_per_month, rng)
+    print(f"Synthetic calendar: {args.years} years, {len(raw) / 1_000_000:.1f} MB")
+
+    parse_ms = statistics.median(_time_ms(lambda: parse_body(raw)) for _ in range(5))
+    index_parse_ms = statistics.median(_time_ms(lambda: parse_body(raw, index=True)) for _ in range(5))
+    scanned, indexed = parse_body(raw), parse_body(raw, index=True)
+    assert indexed.index is not None
+    print(f"parse_body: {parse_ms:.1f} ms, with index: {index_parse_ms:.1f} ms ({len(indexed.index.entries)} dates)")
+
+    dates = [_random_date(args.years, rng) for _ in range(args.queries)]
+    queries = {
+        "single date": [(date, date) for date in dates],
+        "one month": [_one_month(date) for date in dates],
+        "one year": [_one_year(date) for date in dates],
+    }
+    print(f"\nMedian get_entries latency over {args.queries} queries:")
+    print(f"  {'query':<14}{'scan':>12}{'index':>12}{'speedup':>10}{'break-even':>14}")
+    for label, ranges in queries.items():
+        for start, end in ranges[:20]:
+            assert get_entries(scanned, start, end) == get_entries(indexed, start, end)
+        scan_ms = _median_query_ms(scanned, ranges)
+        index_ms = _median_query_ms(indexed, ranges)
+        # Queries after which building the index has cost less than it saved
+        break_even = (index_parse_ms - parse_ms) / (scan_ms - index_ms)
+        print(
+            f"  {label:<14}{scan_ms:>10.3f}ms{index_ms:>10.3f}ms{scan_ms / index_ms:>9.0f}x{break_even:>6.0f} queries",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Compare fetcher embedding throughput: one embed call per document vs. batches across documents.
+
+Usage (from backend/, with a configured .env):
+    uv run python benchmarks/embedding_throughput.py [--docs 300] [--batch-size 256]
+
+The corpus is synthetic but shaped like a campaign wiki: mostly short pages and characters
+(1-3 chunks) with a few long adventure logs.
+"""
+
+import argparse
+import random
+import time
+
+from fastembed import TextEmbedding
+
+from lorekeeper.obsidian_portal.ingest import ChunkedDocument, chunk_document, embed_documents, plan_embedding_batches
+from lorekeeper.obsidian_portal.models import Page
+
+_VOCABULARY = (
+    "the party travelled north toward ruined keep where goblin raiders ambushed caravan dragon "
+    "wizard tower inn tavern merchant guild captain city gate temple priest sword shield spell "
+    "ancient tomb forest river bridge night dawn council queen knight thief map treasure"
+)
+_LONG_DOCUMENT_RATE = 0.05
+
+
+def _synthetic_corpus(num_docs: int, seed: int = 7) -> list[ChunkedDocument]:
+    rng = random.Random(seed)
+    words = _VOCABULARY.split()
+    corpus = []
+    for i in range(num_docs):
+        long_document = rng.random() < _LONG_DOCUMENT_RATE
+        paragraphs = rng.randint(60, 120) if long_document else rng.choice([1, 2, 3, 4, 6, 30])
+        body = "\n".join(" ".join(rng.choices(words, k=rng.randint(20, 60))) for _ in range(paragraphs))
+        page = Page.model_validate({
+            "id": f"{i:032x}",
+            "slug": f"page-{i}",
+            "type": "WikiPage",
+            "wiki_page_url": f"https://example.invalid/page-{i}",
+            "tags": [],
+            "is_game_master_only": False,
+            "created_at": "",
+            "updated_at": "",
+            "name": f"Page {i}",
+            "body": body,
+        })
+        corpus.append(chunk_document(page))
+    return corpus
+
+
+def _per_document(model: TextEmbedding, corpus: list[ChunkedDocument]) -> float:
+    start = time.perf_counter()
+    for chunked in corpus:
+        embed_documents([chunked], lambda: model)
+    return time.perf_counter() - start
+
+
+def _cross_document(model: TextEmbedding, corpus: list[ChunkedDocument], batch_size: int) -> float:
+    start = time.perf_counter()
+    for batch in plan_embedding_batches(corpus, batch_size):
+        embed_documents(batch, lambda: model, batch_size=batch_size)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare per-document and cross-document embedding throughput.")
+    parser.add_argument("--docs", type=int, default=300)
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--model", default="BAAI/bge-base-en-v1.5")
+    args = parser.parse_args()
+
+    corpus = _synthetic_corpus(args.docs)
+    total_chunks = sum(len(chunked.chunks) for chunked in corpus)
+    model = TextEmbedding(args.model)
+    list(model.embed(["warm-up"]))
+
+    print(f"Corpus: {args.docs} documents, {total_chunks} chunks, model {args.model}")
+    per_doc = _per_document(model, corpus)
+    print(f"per-document:   {total_chunks / per_doc:8.1f} chunks/s ({per_doc:.1f}s)")
+    cross_doc = _cross_document(model, corpus, args.batch_size)
+    print(f"cross-document: {total_chunks / cross_doc:8.1f} chunks/s ({cross_doc:.1f}s, batch size {args.batch_size})")
+
+
+if __name__ == "__main__":
+    main()
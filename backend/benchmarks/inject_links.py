@@ -0,0 +1,118 @@
+"""
+Compare inject_links against the previous implementation, which rescanned the text once per mention.
+
+Usage (from backend/):
+    uv run python benchmarks/inject_links.py [--mentions 500] [--kb 100] [--runs 5]
+
+Builds a synthetic session log of about --kb kilobytes that mentions a random subset of --mentions
+names (some of them already linked, some case-shifted, some overlapping like "Grey" and "Allandra
+Grey"), then times both implementations on it after checking they return the same result.
+"""
+
+import argparse
+import random
+import re
+import statistics
+import time
+from collections.abc import Callable
+
+from lorekeeper.obsidian_portal.link_injector import inject_links
+
+_WIKI_LINK_REGEX = re.compile(r"\[\[[^]]*]]")
+_SYLLABLES = ["al", "an", "dra", "gor", "eth", "mir", "th", "is", "ka", "vel", "or", "un", "zar", "ien", "bel"]
+_FILLER = ["the", "party", "rested", "by", "the", "road", "and", "spoke", "of", "old", "wars", "at", "night"]
+# Share of words that are a name (of which some in upper case) and a name already linked
+_MENTION_RATE, _UPPER_CASE_RATE, _LINKED_RATE = 0.05, 0.1, 0.005
+_TWO_WORD_NAME_RATE = 0.3
+
+
+def _inject_links_sequential(body: str, entity_links: dict[str, str]) -> tuple[str, list[str], list[str]]:
+    """inject_links as it was: one search of the whole (growing) text per mention."""
+    applied: list[str] = []
+    skipped: list[str] = []
+    for mention, raw_target in entity_links.items():
+        target = raw_target.strip().removeprefix("[[").removesuffix("]]")
+        link = f"[[{target} | {mention}]]"
+        already_linked = re.search(r"\[\[\s*" + re.escape(target) + r"\s*\|[^]]*]]", body, re.IGNORECASE)
+        if already_linked:
+            skipped.append(mention)
+            continue
+        protected = [(m.start(), m.end()) for m in _WIKI_LINK_REGEX.finditer(body)]
+        prefix = r"\b" if mention[0].isalnum() or mention[0] == "_" else ""
+        suffix = r"\b" if mention[-1].isalnum() or mention[-1] == "_" else ""
+        mention_re = re.compile(prefix + re.escape(mention) + suffix, re.IGNORECASE)
+        for match in mention_re.finditer(body):
+            if not any(start <= match.start() < end for start, end in protected):
+                body = body[: match.start()] + link + body[match.end() :]
+                applied.append(mention)
+                break
+        else:
+            skipped.append(mention)
+    return body, applied, skipped
+
+
+def _name(rng: random.Random) -> str:
+    return "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4))).capitalize()
+
+
+def _synthetic_log(mentions: int, kb: int, rng: random.Random) -> tuple[str, dict[str, str]]:
+    names: list[str] = []
+    while len(names) < mentions:
+        name = f"{_name(rng)} {_name(rng)}" if rng.random() < _TWO_WORD_NAME_RATE else _name(rng)
+        if name not in names:
+            names.append(name)
+    # Some mentions are part of longer ones, to exercise overlaps
+    for i in range(0, mentions, 25):
+        if " " in names[i]:
+            names[i + 1] = names[i].split()[1]
+    entity_links = {name: f":{name.lower().replace(' ', '-')}" for name in names}
+
+    # Only mention about two thirds of the names, so some are skipped
+    mentioned = rng.sample(names, k=mentions * 2 // 3)
+    words: list[str] = []
+    size = 0
+    while size < kb * 1000:
+        roll = rng.random()
+        if roll < _MENTION_RATE:
+            name = rng.choice(mentioned)
+            word = name.upper() if rng.random() < _UPPER_CASE_RATE else name
+        elif roll < _MENTION_RATE + _LINKED_RATE:
+            name = rng.choice(mentioned)
+            word = f"[[{entity_links[name]} | {name}]]"
+        else:
+            word = rng.choice(_FILLER)
+        words.append(word)
+        size += len(word) + 1
+    return " ".join(words), entity_links
+
+
+def _time_ms(fn: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare inject_links against the one-search-per-mention version.")
+    parser.add_argument("--mentions", type=int, default=500)
+    parser.add_argument("--kb", type=int, default=100)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    body, entity_links = _synthetic_log(args.mentions, args.kb, random.Random(7))
+    expected = _inject_links_sequential(body, entity_links)
+    assert inject_links(body, entity_links) == expected
+    print(f"Synthetic log: {len(body) / 1000:.0f} KB, {len(entity_links)} mentions")
+    print(f"  {len(expected[1])} linked, {len(expected[2])} skipped")
+
+    sequential_ms = statistics.median(
+        _time_ms(lambda: _inject_links_sequential(body, entity_links)) for _ in range(args.runs)
+    )
+    single_pass_ms = statistics.median(_time_ms(lambda: inject_links(body, entity_links)) for _ in range(args.runs))
+    print(f"\nMedian over {args.runs} runs:")
+    print(f"  {'per mention':<14}{sequential_ms:>10.1f} ms")
+    print(f"  {'single pass':<14}{single_pass_ms:>10.1f} ms{sequential_ms / single_pass_ms:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Measure filter latency of the retrieval tools' queries with and without payload indexes.
+
+Usage (from backend/, with a configured .env and a running Qdrant at QDRANT_URL):
+    uv run python benchmarks/payload_index_filters.py [--points 10000 100000] [--queries 200]
+
+Each size builds a throwaway collection of synthetic chunks (about 10 per document), times the
+filters used by the fetcher and the extended MCP tools, then adds PAYLOAD_INDEXES and times them
+again. Qdrant's local in-memory mode ignores payload indexes, so this needs a real server.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import (
+    Distance,
+    FieldCondition,
+    Filter,
+    MatchAny,
+    MatchValue,
+    PointStruct,
+    Range,
+    VectorParams,
+)
+
+from lorekeeper.config import settings
+from lorekeeper.obsidian_portal.ingest import ensure_payload_indexes, point_id
+
+_COLLECTION = "benchmark_payload_indexes"
+_CHUNKS_PER_DOCUMENT = 10
+_TYPES = ["WikiPage", "Post", "Character"]
+_TAGS = [f"tag-{i}" for i in range(50)]
+_GM_ONLY_RATE = 0.1
+_UPSERT_BATCH_SIZE = 1000
+_VECTOR_SIZE = 8  # filters don't depend on the vectors, so keep them tiny
+
+
+def _synthetic_points(num_points: int, rng: random.Random) -> list[PointStruct]:
+    points = []
+    for i in range(num_points):
+        doc_id = f"{i // _CHUNKS_PER_DOCUMENT:032x}"
+        chunk_index = i % _CHUNKS_PER_DOCUMENT
+        metadata = {
+            "id": doc_id,
+            "type": rng.choice(_TYPES),
+            "tags": rng.sample(_TAGS, k=3),
+            "gm_only": rng.random() < _GM_ONLY_RATE,
+            "chunk_index": chunk_index,
+            "total_chunks": _CHUNKS_PER_DOCUMENT,
+        }
+        points.append(
+            PointStruct(
+                id=point_id(doc_id, chunk_index),
+                vector=[rng.random() for _ in range(_VECTOR_SIZE)],
+                payload={"document": f"chunk {i}", "metadata": metadata, "content_hash": doc_id},
+            ),
+        )
+    return points
+
+
+def _filters(num_documents: int, rng: random.Random) -> dict[str, Filter]:
+    doc_id = f"{rng.randrange(num_documents):032x}"
+    by_doc = FieldCondition(key="metadata.id", match=MatchValue(value=doc_id))
+    return {
+        "document chunks": Filter(must=[by_doc]),
+        "expand-context window": Filter(
+            must=[by_doc, FieldCondition(key="metadata.chunk_index", range=Range(gte=3, lte=7))],
+        ),
+        "chunk 0 of all docs": Filter(must=[FieldCondition(key="metadata.chunk_index", match=MatchValue(value=0))]),
+        "type + gm_only": Filter(
+            must=[
+                FieldCondition(key="metadata.type", match=MatchValue(value="Character")),
+                FieldCondition(key="metadata.gm_only", match=MatchValue(value=True)),
+            ],
+        ),
+        "tags": Filter(must=[FieldCondition(key="metadata.tags", match=MatchAny(any=rng.sample(_TAGS, k=2)))]),
+    }
+
+
+async def _time_filters(client: AsyncQdrantClient, num_documents: int, queries: int) -> dict[str, float]:
+    """Return the median latency in milliseconds of each filter, scrolling up to 100 points."""
+    rng = random.Random(11)
+    latencies: dict[str, list[float]] = {}
+    for _ in range(queries):
+        for name, scroll_filter in _filters(num_documents, rng).items():
+            start = time.perf_counter()
+            await client.scroll(_COLLECTION, scroll_filter=scroll_filter, limit=100, with_vectors=False)
+            latencies.setdefault(name, []).append((time.perf_counter() - start) * 1000)
+    return {name: statistics.median(values) for name, values in latencies.items()}
+
+
+async def _benchmark(client: AsyncQdrantClient, num_points: int, queries: int) -> None:
+    if await client.collection_exists(_COLLECTION):
+        await client.delete_collection(_COLLECTION)
+    await client.create_collection(_COLLECTION, vectors_config=VectorParams(size=_VECTOR_SIZE, distance=Distance.DOT))
+    try:
+        points = _synthetic_points(num_points, random.Random(7))
+        for start in range(0, len(points), _UPSERT_BATCH_SIZE):
+            await client.upsert(_COLLECTION, points=points[start : start + _UPSERT_BATCH_SIZE], wait=True)
+
+        num_documents = num_points // _CHUNKS_PER_DOCUMENT
+        unindexed = await _time_filters(client, num_documents, queries)
+        await ensure_payload_indexes(client, _COLLECTION)
+        indexed = await _time_filters(client, num_documents, queries)
+    finally:
+        await client.delete_collection(_COLLECTION)
+
+    print(f"\n{num_points} points, median of {queries} queries:")
+    print(f"  {'filter':<24}{'no index':>12}{'indexed':>12}")
+    for name, latency in unindexed.items():
+        print(f"  {name:<24}{latency:>10.2f}ms{indexed[name]:>10.2f}ms")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare filter latency with and without payload indexes.")
+    parser.add_argument("--points", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    client = AsyncQdrantClient(url=settings.qdrant_url)
+    for num_points in args.points:
+        await _benchmark(client, num_points, args.queries)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,184 @@
+"""
+Compare recall, search latency and vector memory of the VECTOR_QUANTIZATION modes.
+
+Usage (from backend/, with a configured .env and a running Qdrant at QDRANT_URL):
+    uv run python benchmarks/quantization.py [--points 20000] [--queries 200] [--oversampling 2.0]
+
+Vectors are copied from the live collection when it exists, otherwise synthetic unit vectors are
+used (recall on those is pessimistic; real embeddings cluster and quantize better). Each mode gets a
+throwaway collection built with quantization_config, once with vectors in RAM and once on disk,
+and is searched with quantization_search_params. Recall@10 is measured against exact cosine
+search in numpy. Memory is estimated from the vector size rather than read from the server, which
+doesn't report per-collection RAM usage.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import cast
+
+import numpy as np
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import (
+    CollectionStatus,
+    Distance,
+    PointStruct,
+    SearchParams,
+    VectorParams,
+)
+
+from lorekeeper.config import VectorQuantization, settings
+from lorekeeper.obsidian_portal.ingest import quantization_config, quantization_search_params
+
+_COLLECTION = "benchmark_quantization"
+_MODES: list[VectorQuantization] = ["none", "scalar", "binary"]
+_VECTOR_SIZE = 768
+_TOP_K = 10
+_UPSERT_BATCH_SIZE = 1000
+_SCROLL_BATCH_SIZE = 1000
+_INDEX_POLL_SECONDS = 0.5
+# Bytes per dimension of the copy searched in RAM: float32 originals, int8 scalar, 1 bit binary
+_BYTES_PER_DIMENSION: dict[VectorQuantization, float] = {"none": 4, "scalar": 1, "binary": 1 / 8}
+
+
+async def _live_vectors(client: AsyncQdrantClient, limit: int) -> np.ndarray | None:
+    if not await client.collection_exists(settings.campaign().collection_name):
+        return None
+    vectors: list[list[float]] = []
+    offset = None
+    while len(vectors) < limit:
+        records, offset = await client.scroll(
+            settings.campaign().collection_name,
+            limit=min(_SCROLL_BATCH_SIZE, limit - len(vectors)),
+            offset=offset,
+            with_payload=False,
+            with_vectors=[settings.vector_name],
+        )
+        for record in records:
+            assert isinstance(record.vector, dict)  # named vectors, as requested
+            vectors.append(cast("list[float]", record.vector[settings.vector_name]))  # dense, not a multivector
+        if offset is None:
+            break
+    return np.asarray(vectors, dtype=np.float32) if vectors else None
+
+
+def _synthetic_vectors(num_points: int, rng: np.random.Generator) -> np.ndarray:
+    vectors = rng.standard_normal((num_points, _VECTOR_SIZE), dtype=np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+async def _wait_until_indexed(client: AsyncQdrantClient) -> None:
+    while (await client.get_collection(_COLLECTION)).status != CollectionStatus.GREEN:
+        await asyncio.sleep(_INDEX_POLL_SECONDS)
+
+
+async def _search(
+    client: AsyncQdrantClient,
+    queries: np.ndarray,
+    search_params: SearchParams | None,
+) -> tuple[list[set[int]], list[float]]:
+    results: list[set[int]] = []
+    latencies: list[float] = []
+    for query in queries:
+        start = time.perf_counter()
+        response = await client.query_points(
+            _COLLECTION,
+            query=query.tolist(),
+            using=settings.vector_name,
+            limit=_TOP_K,
+            search_params=search_params,
+            with_payload=False,
+        )
+        latencies.append((time.perf_counter() - start) * 1000)
+        results.append({int(point.id) for point in response.points})
+    return results, latencies
+
+
+async def _benchmark(  # noqa: PLR0913
+    client: AsyncQdrantClient,
+    vectors: np.ndarray,
+    queries: np.ndarray,
+    *,
+    mode: VectorQuantization,
+    on_disk: bool,
+    oversampling: float,
+) -> tuple[list[set[int]], list[float]]:
+    if await client.collection_exists(_COLLECTION):
+        await client.delete_collection(_COLLECTION)
+    await client.create_collection(
+        _COLLECTION,
+        vectors_config={
+            settings.vector_name: VectorParams(size=vectors.shape[1], distance=Distance.COSINE, on_disk=on_disk),
+        },
+        quantization_config=quantization_config(mode),
+    )
+    try:
+        for start in range(0, len(vectors), _UPSERT_BATCH_SIZE):
+            points = [
+                PointStruct(id=i, vector={settings.vector_name: vectors[i].tolist()})
+                for i in range(start, min(start + _UPSERT_BATCH_SIZE, len(vectors)))
+            ]
+            await client.upsert(_COLLECTION, points=points, wait=True)
+        await _wait_until_indexed(client)
+        return await _search(client, queries, quantization_search_params(mode, oversampling))
+    finally:
+        await client.delete_collection(_COLLECTION)
+
+
+def _exact_top_k(vectors: np.ndarray, queries: np.ndarray) -> list[set[int]]:
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    scores = queries @ normalized.T
+    return [set(np.argpartition(-row, _TOP_K)[:_TOP_K].tolist()) for row in scores]
+
+
+def _recall(found: list[set[int]], truth: list[set[int]]) -> float:
+    return statistics.mean(len(f & t) / len(t) for f, t in zip(found, truth, strict=True) if t)
+
+
+def _ram_megabytes(mode: VectorQuantization, *, on_disk: bool, num_points: int, dimensions: int) -> float:
+    quantized = 0.0 if mode == "none" else _BYTES_PER_DIMENSION[mode]
+    originals = 0.0 if on_disk else _BYTES_PER_DIMENSION["none"]
+    return (quantized + originals) * dimensions * num_points / 1_000_000
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare recall, latency and memory of vector quantization modes.")
+    parser.add_argument("--points", type=int, default=20_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--oversampling", type=float, default=settings.quantization_oversampling)
+    args = parser.parse_args()
+
+    client = AsyncQdrantClient(url=settings.qdrant_url)
+    rng = np.random.default_rng(7)
+    vectors = await _live_vectors(client, args.points + args.queries)
+    if vectors is None or len(vectors) <= args.queries:
+        print(f"No usable collection '{settings.campaign().collection_name}'; using synthetic vectors")
+        vectors = _synthetic_vectors(args.points + args.queries, rng)
+    else:
+        print(f"Using {len(vectors)} vectors from collection '{settings.campaign().collection_name}'")
+    order = rng.permutation(len(vectors))
+    queries, vectors = vectors[order[: args.queries]], vectors[order[args.queries :]]
+    num_points, dimensions = vectors.shape
+
+    truth = _exact_top_k(vectors, queries)
+    print(f"\n{num_points} points x {dimensions} dims, {len(queries)} queries, oversampling {args.oversampling}:")
+    print(f"  {'mode':<10}{'on disk':<10}{'recall@10':>10}{'p50':>10}{'p95':>10}{'vector RAM':>14}")
+    for mode in _MODES:
+        for on_disk in (False, True):
+            found, latencies = await _benchmark(
+                client,
+                vectors,
+                queries,
+                mode=mode,
+                on_disk=on_disk,
+                oversampling=args.oversampling,
+            )
+            p50 = statistics.median(latencies)
+            p95 = statistics.quantiles(latencies, n=20)[-1]
+            ram = _ram_megabytes(mode, on_disk=on_disk, num_points=num_points, dimensions=dimensions)
+            print(f"  {mode:<10}{on_disk!s:<10}{_recall(found, truth):>10.3f}{p50:>8.2f}ms{p95:>8.2f}ms{ram:>11.1f} MB")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
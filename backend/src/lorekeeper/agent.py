@@ -151,10 +151,11 @@ class LoreKeeperAgent:
         self._active_skills[session_id] = result
         return f"Start the {skill_name} workflow for: {args}"
 
-    def _build_instructions(self, session_id: str) -> str:
-        """Return system prompt, with active skill injected if one is running."""
+    def _build_instructions(self, session_id: str, campaign_id: str | None) -> str:
+        """Return system prompt for the campaign, with active skill injected if one is running."""
+        prompt = system_prompt(campaign_id)
         active = self._active_skills.get(session_id)
-        return f"{SYSTEM_PROMPT}\n\n---\n\n{active}" if active else SYSTEM_PROMPT
+        return f"{prompt}\n\n---\n\n{active}" if active else prompt
 
     def _get_history(self, session_id: str) -> list[ModelMessage] | None:
         """Return trimmed message history for this session."""
@@ -175,7 +176,7 @@ class LoreKeeperAgent:
             self._active_skills.pop(session_id, None)
 
     @asynccontextmanager
-    async def chat_stream(
+    async def chat_stream(  # noqa: PLR0913
         self,
         session_id: str,
         message: str,
@@ -183,6 +184,7 @@ class LoreKeeperAgent:
         model: OpenAIResponsesModel,
         model_settings: OpenAIResponsesModelSettings,
         event_stream_handler: EventStreamHandler = None,
+        campaign_id: str | None = None,
     ) -> AsyncIterator[Any]:
         """Stream a chat response, handling skill dispatch and history management."""
         async with create_agent().run_stream(
@@ -190,7 +192,7 @@ class LoreKeeperAgent:
             message_history=self._get_history(session_id),
             model=model,
             model_settings=model_settings,
-            instructions=self._build_instructions(session_id),
+            instructions=self._build_instructions(session_id, campaign_id),
             event_stream_handler=event_stream_handler,
         ) as stream:
             try:
@@ -211,17 +213,19 @@ def build_model(choice: ModelChoice) -> OpenAIResponsesModel:
     return OpenAIResponsesModel(choice.value, provider=OpenAIProvider(openai_client=client))
 
 
+# Formatted with the campaign_id of the conversation; see system_prompt()
 SYSTEM_PROMPT = (
     "You are LoreKeeper, the lore keeper of a Dungeons & Dragons campaign.\n"
     "Answer ONLY from retrieved context. No outside knowledge. No guessing. No making up information.\n"
-    f"The ID of the main campaign is {settings.campaign_id}.\n"
+    "The ID of the campaign is {campaign_id}. Pass it as campaign_id to every tool that takes one.\n"
     "IDs are 32-character hex strings from Obsidian Portal (found in metadata), NOT names or slugs.\n\n"
     "EXCEPTION - NO RETRIEVAL NEEDED: If the user is clearly just testing connectivity or greeting you "
     "(e.g. 'hello', 'hi', 'test', 'are you working?', 'ping', etc.), respond briefly and naturally "
     "WITHOUT calling any tools or performing any searches.\n\n"
     "MANDATORY RETRIEVAL RULES - follow these EVERY time:\n"
     "1. SEARCH FIRST: Before answering ANY question, call qdrant-find with relevant keywords. "
-    "Try multiple search queries with different phrasings to maximize coverage.\n"
+    "Try multiple search queries with different phrasings to maximize coverage; pass them together to "
+    "qdrant-find-many to run them in one call.\n"
     "2. EXPAND INCOMPLETE RESULTS: After qdrant-find, check metadata.chunk_index and metadata.total_chunks "
     "for EACH result. If the result has multiple chunks, call qdrant-expand-context with that document_id and "
     "chunk_index to get the full surrounding content.\n"
@@ -229,7 +233,7 @@ SYSTEM_PROMPT = (
     "or if you need comprehensive information from a document, call qdrant-get-document-chunks "
     "with the document_id from metadata to retrieve the entire document.\n"
     "4. CROSS-REFERENCE: Search for related entities mentioned in results (character names, locations, events) "
-    "with additional qdrant-find calls.\n"
+    "with additional qdrant-find or qdrant-find-many calls.\n"
     "5. EXPANDING INFO: NEVER say 'no other details were provided' or 'no additional information is available' "
     "without FIRST expanding context on every relevant result and trying alternative search queries.\n\n"
     "If after exhausting all retrieval steps you still cannot find the answer, say so honestly.\n"
@@ -254,6 +258,11 @@ SYSTEM_PROMPT = (
 )
 
 
+def system_prompt(campaign_id: str | None = None) -> str:
+    """Return SYSTEM_PROMPT for campaign_id, or for the default campaign when it is None."""
+    return SYSTEM_PROMPT.format(campaign_id=settings.campaign(campaign_id).campaign_id)
+
+
 def create_agent() -> Agent:
     qdrant_mcp = MCPServerStreamableHTTP(
         url=os.environ.get("QDRANT_MCP_URL", "http://127.0.0.1:8000/mcp"),
@@ -292,7 +301,7 @@ async def main() -> None:
                 message_history=(
                     history[-(MAX_HISTORY_TURNS * 2) :] if history and len(history) > MAX_HISTORY_TURNS * 2 else history
                 ),
-                instructions=SYSTEM_PROMPT,
+                instructions=system_prompt(),
             )
             # CLI scratch loop — agent API uses trim_history instead
             history = strip_tool_messages(result.all_messages())
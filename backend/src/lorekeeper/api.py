@@ -7,7 +7,7 @@ from collections.abc import AsyncGenerator, AsyncIterable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
@@ -73,6 +73,7 @@ class ChatRequest(BaseModel):
     session_id: str = ""
     model: ModelChoice = ModelChoice.GPT54_NANO
     reasoning_effort: ReasoningEffort = ReasoningEffort.NONE
+    campaign_id: str | None = None  # the default campaign when omitted
 
 
 @app.get("/api/models")
@@ -85,6 +86,11 @@ async def get_reasoning_levels() -> list[dict[str, str]]:
     return [{"id": r.value, **REASONING_METADATA[r]} for r in ReasoningEffort]
 
 
+@app.get("/api/campaigns")
+async def get_campaigns() -> list[dict[str, str]]:
+    return [{"id": c.campaign_id, "name": c.name or c.campaign_id} for c in settings.campaigns]
+
+
 @app.get("/api/skills")
 async def get_skills() -> list[dict[str, str]]:
     return [
@@ -296,6 +302,7 @@ async def _run_agent_task(  # noqa: PLR0913
     message: str,
     run_model: OpenAIResponsesModel,
     run_settings: OpenAIResponsesModelSettings,
+    campaign_id: str,
 ) -> None:
     """Drive agent stream to completion; puts SSE payloads on queue, sentinel in finally."""
 
@@ -312,6 +319,7 @@ async def _run_agent_task(  # noqa: PLR0913
             model=run_model,
             model_settings=run_settings,
             event_stream_handler=_handler,
+            campaign_id=campaign_id,
         ) as stream:
             stream_ref = stream
             async for delta in stream.stream_text(delta=True):
@@ -335,6 +343,10 @@ async def _run_agent_task(  # noqa: PLR0913
 
 @app.post("/api/chat")
 async def chat(req: ChatRequest) -> StreamingResponse:
+    try:
+        campaign = settings.campaign(req.campaign_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
     session_id = req.session_id or str(uuid.uuid4())
     run_model = build_model(req.model)
     run_settings = OpenAIResponsesModelSettings(
@@ -355,6 +367,7 @@ async def chat(req: ChatRequest) -> StreamingResponse:
                 message=req.message,
                 run_model=run_model,
                 run_settings=run_settings,
+                campaign_id=campaign.campaign_id,
             ),
         )
         error_occurred = False
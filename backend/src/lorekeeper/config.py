@@ -1,8 +1,21 @@
 from pathlib import Path
+from typing import Literal, Self
 
-from pydantic import Field
+from pydantic import BaseModel, Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+VectorQuantization = Literal["none", "scalar", "binary"]
+
+
+class CampaignSettings(BaseModel):
+    """One Obsidian Portal campaign served by this deployment, with its own Qdrant collection."""
+
+    campaign_id: str
+    name: str = ""
+    quest_log_page_id: str
+    calendar_page_id: str
+    collection_name: str  # alias served to readers; full rebuilds go to versioned collections behind it
+
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
@@ -17,15 +30,32 @@ class Settings(BaseSettings):
     request_token_url: str
     access_token_url: str
     authorize_url: str
-    campaign_id: str
-    quest_log_page_id: str
-    calendar_page_id: str
+    # Single-campaign shorthand, used when CAMPAIGNS is not set
+    campaign_id: str = ""
+    quest_log_page_id: str = ""
+    calendar_page_id: str = ""
+    # JSON list of CampaignSettings objects served side by side; the first one is the default campaign
+    campaigns: list[CampaignSettings] = []
     obsidian_portal_oauth_token: str = ""
     obsidian_portal_oauth_token_secret: str = ""
+    portal_max_concurrency: int = Field(default=8, ge=1)  # max in-flight Portal requests when fetching characters
+    portal_max_retries: int = Field(default=5, ge=0)  # retries of a rate-limited (429) Portal request
+    portal_retry_backoff_seconds: float = 1  # first wait after a 429 without Retry-After, doubled on each retry
+    portal_max_connections: int = 16  # connection pool size of the shared Portal client
+    portal_timeout_seconds: float = 30
+    page_catalog_ttl_seconds: float = 300  # wiki page catalog kept by the Obsidian MCP server; 0 disables the cache
+    character_catalog_ttl_seconds: float = 300  # refreshed in the background once expired; 0 disables the cache
 
     # Qdrant
     qdrant_url: str
-    collection_name: str
+    collection_name: str = ""  # collection of the single campaign, when CAMPAIGNS is not set
+    collection_versions_to_keep: int = 1  # previous versions kept for rollback after a full rebuild
+    query_embedding_cache_size: int = 1024  # query embeddings kept by the Qdrant MCP server; 0 disables the cache
+    query_embedding_cache_ttl_seconds: float = 3600
+    # Applied when the fetcher creates a collection, so changes take effect on the next full rebuild
+    vector_quantization: VectorQuantization = "none"
+    vectors_on_disk: bool = False  # keep original vectors on disk; quantized vectors stay in RAM
+    quantization_oversampling: float = 2.0  # candidates re-scored with original vectors, relative to the limit
 
     # Ollama
     ollama_url: str
@@ -48,6 +78,9 @@ class Settings(BaseSettings):
     # Misc
     data_dir: Path = Field(default=Path("."))
     vector_name: str = "fast-bge-base-en-v1.5"
+    sparse_vector_name: str = "bm25"  # sparse vector fused with the dense one in hybrid search
+    sparse_model_name: str = "Qdrant/bm25"
+    embed_batch_size: int = Field(default=256, ge=1)  # chunks per embedding call in the fetcher, across documents
 
     # OpenObserve / OpenTelemetry
     open_observe_url: str = ""
@@ -57,5 +90,33 @@ class Settings(BaseSettings):
     # Sentry
     sentry_dsn: str = ""
 
+    @model_validator(mode="after")
+    def _default_campaigns(self) -> Self:
+        if not self.campaigns:
+            if not (self.campaign_id and self.collection_name):
+                raise ValueError("Set either CAMPAIGNS or CAMPAIGN_ID and COLLECTION_NAME")
+            self.campaigns = [
+                CampaignSettings(
+                    campaign_id=self.campaign_id,
+                    quest_log_page_id=self.quest_log_page_id,
+                    calendar_page_id=self.calendar_page_id,
+                    collection_name=self.collection_name,
+                ),
+            ]
+        collection_names = [campaign.collection_name for campaign in self.campaigns]
+        if len(set(collection_names)) != len(collection_names):
+            raise ValueError("Every campaign needs its own collection_name")
+        return self
+
+    def campaign(self, campaign_id: str | None = None) -> CampaignSettings:
+        """Return the settings of campaign_id, or of the default campaign when it is None."""
+        if campaign_id is None:
+            return self.campaigns[0]
+        for campaign in self.campaigns:
+            if campaign.campaign_id == campaign_id:
+                return campaign
+        known = ", ".join(campaign.campaign_id for campaign in self.campaigns)
+        raise ValueError(f"Unknown campaign ID '{campaign_id}'. Configured campaigns: {known}")
+
 
 settings = Settings()  # type: ignore[call-arg]  # ty: ignore[missing-argument]
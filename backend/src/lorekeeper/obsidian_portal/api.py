@@ -1,9 +1,27 @@
 import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from types import TracebackType
 
-from requests_oauthlib import OAuth1Session
+import httpx
 
-from lorekeeper.obsidian_portal.models import Character, CharacterRequest, Page, Quest, QuestStatus, QuestType
+from lorekeeper.config import settings
+from lorekeeper.obsidian_portal.models import (
+    Character,
+    CharacterCatalog,
+    CharacterRequest,
+    Page,
+    PageSummary,
+    Quest,
+    QuestStatus,
+    QuestType,
+    QuestUpdate,
+)
+from lorekeeper.obsidian_portal.page_cache import PageCache
 from lorekeeper.obsidian_portal.quest_parser import (
+    apply_quest_changes,
     extract_quests,
     insert_quest,
     parse_body,
@@ -12,95 +30,354 @@ from lorekeeper.obsidian_portal.quest_parser import (
 )
 
 
-async def fetch_wiki_pages(session: OAuth1Session, campaign_id: str) -> list[Page]:
+async def fetch_wiki_pages(client: httpx.AsyncClient, campaign_id: str) -> list[Page]:
+    raw = await _fetch_wiki_page_list(client, campaign_id)
+    print("Transforming and ingesting documents...")
+    return [Page.model_validate(item) for item in raw]
+
+
+async def fetch_page_summaries(client: httpx.AsyncClient, campaign_id: str) -> list[PageSummary]:
+    """Like fetch_wiki_pages, but keeps only each page's id, slug and title instead of validating full pages."""
+    raw = await _fetch_wiki_page_list(client, campaign_id)
+    return [PageSummary(id=item["id"], slug=item["slug"], title=item["name"]) for item in raw]
+
+
+async def _fetch_wiki_page_list(client: httpx.AsyncClient, campaign_id: str) -> list[dict]:
     url = f"https://api.obsidianportal.com/v1/campaigns/{campaign_id}/wikis.json"
     print(f"Fetching wiki pages from Obsidian Portal API: {url}")
-    response = await asyncio.to_thread(session.get, url)
+    response = await client.get(url)
     print(f"API response status: {response.status_code}")
-    raw = await asyncio.to_thread(response.json)
+    raw = response.json()
     print(f"Fetched {len(raw)} wiki pages.")
+    return raw
 
-    print("Transforming and ingesting documents...")
-    return [Page.model_validate(item) for item in raw]
 
-
-async def fetch_wiki_page(session: OAuth1Session, campaign_id: str, page_id: str) -> Page:
-    url = f"https://api.obsidianportal.com/v1/campaigns/{campaign_id}/wikis/{page_id}.json"
+async def fetch_wiki_page(
+    client: httpx.AsyncClient,
+    campaign_id: str,
+    page_id: str,
+    *,
+    page_cache: PageCache | None = None,
+) -> Page:
+    """With a page_cache, send a conditional request and reuse the cached page if it hasn't changed."""
+    url = _wiki_page_url(campaign_id, page_id)
     print(f"Fetching wiki page {page_id} from Obsidian Portal API: {url}")
-    response = await asyncio.to_thread(session.get, url)
+    if page_cache is None:
+        response = await client.get(url)
+        print(f"API response status: {response.status_code}")
+        return Page.model_validate(response.json())
+    response = await client.get(url, headers=page_cache.request_headers(url))
     print(f"API response status: {response.status_code}")
-    raw = await asyncio.to_thread(response.json)
-    return Page.model_validate(raw)
+    return page_cache.resolve(url, response)
 
 
 async def update_wiki_page(
-    session: OAuth1Session,
+    client: httpx.AsyncClient,
     campaign_id: str,
     page_id: str,
     *,
     body: str,
+    page_cache: PageCache | None = None,
 ) -> None:
-    url = f"https://api.obsidianportal.com/v1/campaigns/{campaign_id}/wikis/{page_id}.json"
+    url = _wiki_page_url(campaign_id, page_id)
     data = {"wiki_page": {"body": body}}
     print(f"Updating wiki page {page_id}: {url}")
-    response = await asyncio.to_thread(session.put, url, json=data)
+    response = await client.put(url, json=data)
     print(f"API response status: {response.status_code}")
+    if page_cache is not None:
+        page_cache.invalidate(url)
     response.raise_for_status()
 
 
-async def fetch_characters(session: OAuth1Session, campaign_id: str, enrich: bool = False) -> list[Character]:
+def _wiki_page_url(campaign_id: str, page_id: str) -> str:
+    return f"https://api.obsidianportal.com/v1/campaigns/{campaign_id}/wikis/{page_id}.json"
+
+
+async def fetch_parsed_page[P](
+    client: httpx.AsyncClient,
+    campaign_id: str,
+    page_id: str,
+    *,
+    parse: Callable[[str], P],
+    page_cache: PageCache | None = None,
+) -> P:
+    """
+    Fetch a wiki page and parse its body; with a page_cache, only parse it again if it changed.
+
+    With a page_cache, waits for an edit of the page in progress, whose changes to the shared parsed page
+    may not be saved yet. The result is shared with other callers: read it before the next await.
+    """
+    if page_cache is None:
+        page = await fetch_wiki_page(client, campaign_id, page_id)
+        return parse(page.body)
+    async with page_cache.lock(page_id):
+        page = await fetch_wiki_page(client, campaign_id, page_id, page_cache=page_cache)
+        return page_cache.parsed(page, parse)
+
+
+def edit_parsed_page[P](  # noqa: PLR0913
+    client: httpx.AsyncClient,
+    campaign_id: str,
+    page_id: str,
+    *,
+    parse: Callable[[str], P],
+    render: Callable[[P], str],
+    page_cache: PageCache | None = None,
+) -> AbstractAsyncContextManager[P]:
+    """
+    Fetch and parse a wiki page, let the caller change the parsed page in place, then render and save it.
+
+    Nothing is saved if the page renders unchanged.
+
+    With a page_cache, the saved parsed page stays cached, so the next fetch doesn't parse the page again.
+    If the block or the save fails, the cached parsed page may hold unsaved changes and is dropped.
+    """
+    return _ParsedPageEdit(client, campaign_id, page_id, parse=parse, render=render, page_cache=page_cache)
+
+
+class _ParsedPageEdit[P]:
+    # A class rather than an @asynccontextmanager generator, which type checkers can't bind P through
+
+    def __init__(  # noqa: PLR0913
+        self,
+        client: httpx.AsyncClient,
+        campaign_id: str,
+        page_id: str,
+        *,
+        parse: Callable[[str], P],
+        render: Callable[[P], str],
+        page_cache: PageCache | None,
+    ) -> None:
+        self._client = client
+        self._campaign_id = campaign_id
+        self._page_id = page_id
+        self._parse = parse
+        self._render = render
+        self._page_cache = page_cache
+        self._lock = page_cache.lock(page_id) if page_cache is not None else None
+
+    async def __aenter__(self) -> P:
+        if self._lock is not None:
+            await self._lock.acquire()
+        try:
+            self._page = await fetch_wiki_page(
+                self._client,
+                self._campaign_id,
+                self._page_id,
+                page_cache=self._page_cache,
+            )
+            if self._page_cache is None:
+                self._parsed = self._parse(self._page.body)
+            else:
+                self._parsed = self._page_cache.parsed(self._page, self._parse)
+        except BaseException:
+            self._release()
+            raise
+        return self._parsed
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        try:
+            if exc is not None:
+                self._discard_parsed()
+                return
+            try:
+                body = self._render(self._parsed)
+                if body == self._page.body:
+                    return
+                await update_wiki_page(
+                    self._client,
+                    self._campaign_id,
+                    self._page_id,
+                    body=body,
+                    page_cache=self._page_cache,
+                )
+            except BaseException:
+                self._discard_parsed()
+                raise
+            if self._page_cache is not None:
+                self._page_cache.store_written(self._page_id, self._parse, self._parsed, body=body)
+        finally:
+            self._release()
+
+    def _discard_parsed(self) -> None:
+        if self._page_cache is not None:
+            self._page_cache.discard_parsed(self._page_id, self._parse)
+
+    def _release(self) -> None:
+        if self._lock is not None:
+            self._lock.release()
+
+
+async def fetch_characters(
+    client: httpx.AsyncClient,
+    campaign_id: str,
+    enrich: bool = False,
+    *,
+    max_concurrency: int = settings.portal_max_concurrency,
+) -> list[Character]:
+    characters_raw = await _fetch_character_list(client, campaign_id)
+    if not enrich:
+        return [Character.model_validate(character_raw) for character_raw in characters_raw]
+    tasks = _enrich_characters(client, campaign_id, characters_raw, max_concurrency=max_concurrency)
+    try:
+        return list(await asyncio.gather(*tasks))
+    finally:
+        # gather doesn't cancel the other requests when one fails
+        for task in tasks:
+            task.cancel()
+
+
+async def fetch_character_catalog(client: httpx.AsyncClient, campaign_id: str) -> list[CharacterCatalog]:
+    """Like fetch_characters, but keeps only the fields of CharacterCatalog instead of validating full characters."""
+    characters_raw = await _fetch_character_list(client, campaign_id)
+    return [
+        CharacterCatalog(
+            id=raw["id"],
+            slug=raw["slug"],
+            name=raw["name"],
+            is_player_character=raw["is_player_character"],
+        )
+        for raw in characters_raw
+    ]
+
+
+async def iter_characters(
+    client: httpx.AsyncClient,
+    campaign_id: str,
+    enrich: bool = False,
+    *,
+    max_concurrency: int = settings.portal_max_concurrency,
+) -> AsyncIterator[Character]:
+    """Yield the campaign's characters as they become available; enrich re-fetches each one for its bio/description."""
+    characters_raw = await _fetch_character_list(client, campaign_id)
+    if not enrich:
+        for character_raw in characters_raw:
+            yield Character.model_validate(character_raw)
+        return
+
+    tasks = _enrich_characters(client, campaign_id, characters_raw, max_concurrency=max_concurrency)
+    try:
+        for next_character in asyncio.as_completed(tasks):
+            yield await next_character
+    finally:
+        # The consumer may stop early or fail; don't leave requests running in the background
+        for task in tasks:
+            task.cancel()
+
+
+async def _fetch_character_list(client: httpx.AsyncClient, campaign_id: str) -> list[dict]:
     characters_url = f"https://api.obsidianportal.com/v1/campaigns/{campaign_id}/characters.json"
     print(f"Fetching characters from Obsidian Portal API: {characters_url}")
-    characters_response = await asyncio.to_thread(session.get, characters_url)
+    characters_response = await client.get(characters_url)
     print(f"API response status: {characters_response.status_code}")
-    characters_raw = await asyncio.to_thread(characters_response.json)
+    characters_raw = characters_response.json()
     print(f"Fetched {len(characters_raw)} characters.")
+    return characters_raw
+
+
+def _enrich_characters(
+    client: httpx.AsyncClient,
+    campaign_id: str,
+    characters_raw: list[dict],
+    *,
+    max_concurrency: int,
+) -> list[asyncio.Task[Character]]:
+    """Start fetching every character's full record, with at most max_concurrency requests in flight."""
+    semaphore = asyncio.Semaphore(max_concurrency)
 
-    if enrich:
-        return [await fetch_character(session, campaign_id, character_raw["id"]) for character_raw in characters_raw]
-    return [Character.model_validate(item) for item in characters_raw]
+    async def enrich(character_id: str) -> Character:
+        async with semaphore:
+            return await fetch_character(client, campaign_id, character_id)
 
+    return [asyncio.create_task(enrich(character_raw["id"])) for character_raw in characters_raw]
 
-async def fetch_character(session: OAuth1Session, campaign_id: str, character_id: str) -> Character:
+
+async def fetch_character(client: httpx.AsyncClient, campaign_id: str, character_id: str) -> Character:
     url = f"https://api.obsidianportal.com/v1/campaigns/{campaign_id}/characters/{character_id}.json"
     print(f"Fetching character {character_id} from Obsidian Portal API: {url}")
-    response = await asyncio.to_thread(session.get, url)
+    response = await _get_respecting_rate_limit(client, url)
     print(f"API response status: {response.status_code}")
-    raw = await asyncio.to_thread(response.json)
-    return Character.model_validate(raw)
+    response.raise_for_status()
+    return Character.model_validate(response.json())
+
 
+async def _get_respecting_rate_limit(client: httpx.AsyncClient, url: str) -> httpx.Response:
+    """GET url, waiting and retrying up to portal_max_retries times while the Portal answers 429 Too Many Requests."""
+    response = await client.get(url)
+    for attempt in range(settings.portal_max_retries):
+        if response.status_code != httpx.codes.TOO_MANY_REQUESTS:
+            break
+        delay = _retry_delay(response, attempt)
+        print(f"Rate limited by the Portal, retrying {url} in {delay:.1f}s")
+        await asyncio.sleep(delay)
+        response = await client.get(url)
+    return response
 
-async def create_character(session: OAuth1Session, campaign_id: str, character: CharacterRequest) -> Character:
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying a 429: its Retry-After (in seconds or as a date), else exponential backoff."""
+    retry_after = response.headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, (parsedate_to_datetime(retry_after) - datetime.now(UTC)).total_seconds())
+        except (TypeError, ValueError):
+            pass
+    return settings.portal_retry_backoff_seconds * 2**attempt
+
+
+async def create_character(client: httpx.AsyncClient, campaign_id: str, character: CharacterRequest) -> Character:
     """We don't return any value because for some reason the API returns 500 even on success, fun!"""
     url = f"https://api.obsidianportal.com/v1/campaigns/{campaign_id}/characters.json"
     data = {"character": character.model_dump(by_alias=True)}
     print(f"Creating character in Obsidian Portal API: {url} with data: {data}")
-    response = await asyncio.to_thread(session.post, url, json=data)
+    response = await client.post(url, json=data)
     print(f"API response status: {response.status_code} with body: {response.text}")
-    raw = await asyncio.to_thread(response.json)
+    raw = response.json()
     return Character.model_validate(raw)
 
 
-async def fetch_quests(session: OAuth1Session, campaign_id: str, quest_page_id: str) -> list[Quest]:
-    page = await fetch_wiki_page(session, campaign_id, quest_page_id)
-    return extract_quests(parse_body(page.body))
+async def fetch_quests(
+    client: httpx.AsyncClient,
+    campaign_id: str,
+    quest_page_id: str,
+    *,
+    page_cache: PageCache | None = None,
+) -> list[Quest]:
+    parsed = await fetch_parsed_page(client, campaign_id, quest_page_id, parse=parse_body, page_cache=page_cache)
+    # Copies, as the parsed page may be shared through the page_cache
+    return [quest.model_copy() for quest in extract_quests(parsed)]
 
 
 async def create_quest(
-    session: OAuth1Session,
+    client: httpx.AsyncClient,
     campaign_id: str,
     quest_page_id: str,
     *,
     quest: Quest,
+    page_cache: PageCache | None = None,
 ) -> None:
-    page = await fetch_wiki_page(session, campaign_id, quest_page_id)
-    parsed = parse_body(page.body)
-    insert_quest(parsed, quest)
-    await update_wiki_page(session, campaign_id, quest_page_id, body=render_body(parsed))
+    async with edit_parsed_page(
+        client,
+        campaign_id,
+        quest_page_id,
+        parse=parse_body,
+        render=render_body,
+        page_cache=page_cache,
+    ) as parsed:
+        insert_quest(parsed, quest)
 
 
 async def update_quest(  # noqa: PLR0913
-    session: OAuth1Session,
+    client: httpx.AsyncClient,
     campaign_id: str,
     quest_page_id: str,
     *,
@@ -110,17 +387,50 @@ async def update_quest(  # noqa: PLR0913
     new_status: QuestStatus | None = None,
     new_phase: str | None = None,
     new_quest_type: QuestType | None = None,
+    page_cache: PageCache | None = None,
 ) -> str:
-    page = await fetch_wiki_page(session, campaign_id, quest_page_id)
-    parsed = parse_body(page.body)
-    summary = update_quest_data(
-        parsed,
-        title,
-        new_title=new_title,
-        new_content=new_content,
-        new_status=new_status,
-        new_phase=new_phase,
-        new_quest_type=new_quest_type,
-    )
-    await update_wiki_page(session, campaign_id, quest_page_id, body=render_body(parsed))
+    async with edit_parsed_page(
+        client,
+        campaign_id,
+        quest_page_id,
+        parse=parse_body,
+        render=render_body,
+        page_cache=page_cache,
+    ) as parsed:
+        summary = update_quest_data(
+            parsed,
+            title,
+            new_title=new_title,
+            new_content=new_content,
+            new_status=new_status,
+            new_phase=new_phase,
+            new_quest_type=new_quest_type,
+        )
     return summary
+
+
+async def update_quests(  # noqa: PLR0913
+    client: httpx.AsyncClient,
+    campaign_id: str,
+    quest_page_id: str,
+    *,
+    inserts: list[Quest],
+    updates: list[QuestUpdate],
+    page_cache: PageCache | None = None,
+) -> list[str]:
+    """
+    Create and update several quests with a single fetch and save of the Quest Log page.
+
+    All changes are validated together: if any fails, a ValueError lists them all and nothing is saved.
+    Returns the change summary of each update.
+    """
+    async with edit_parsed_page(
+        client,
+        campaign_id,
+        quest_page_id,
+        parse=parse_body,
+        render=render_body,
+        page_cache=page_cache,
+    ) as parsed:
+        summaries = apply_quest_changes(parsed, inserts=inserts, updates=updates)
+    return summaries
@@ -2,12 +2,13 @@ import asyncio
 import json
 import os
 
+import httpx
 from pydantic import BaseModel, Field
 from requests_oauthlib import OAuth1Session
 
 from lorekeeper.config import settings
+from lorekeeper.obsidian_portal.client import USER_AGENT, create_portal_client
 
-USER_AGENT = "ObsidianPortalOAuthTest/1.0"
 TOKEN_PATH = os.path.join(os.path.dirname(__file__), ".op_token.json")
 
 
@@ -16,26 +17,20 @@ class AccessToken(BaseModel):
     secret: str = Field(validation_alias="oauth_token_secret")
 
 
-async def get_authenticated_session_async() -> OAuth1Session:
-    return await asyncio.to_thread(get_authenticated_session)
+async def get_portal_client() -> httpx.AsyncClient:
+    """Return a Portal client authenticated with the stored access token, authorizing the app first if needed."""
+    token = await asyncio.to_thread(get_access_token)
+    return create_portal_client(token=token.token, token_secret=token.secret)
 
 
-def get_authenticated_session() -> OAuth1Session:
+def get_access_token() -> AccessToken:
     token = _load_token()
     if token is None:
         request_token = _get_request_token()
         verifier = _authorize_user(request_token)
         token = _get_access_token(request_token, verifier)
         _save_token(token)
-
-    session = OAuth1Session(
-        settings.consumer_key,
-        client_secret=settings.consumer_secret,
-        resource_owner_key=token.token,
-        resource_owner_secret=token.secret,
-    )
-    session.headers.update({"User-Agent": USER_AGENT})
-    return session
+    return token
 
 
 def _load_token() -> AccessToken | None:
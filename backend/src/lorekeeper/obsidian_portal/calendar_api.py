@@ -2,20 +2,40 @@
 
 from __future__ import annotations
 
-from requests_oauthlib import OAuth1Session
+from collections.abc import Callable
+from functools import partial
 
-from lorekeeper.config import settings
-from lorekeeper.obsidian_portal.api import fetch_wiki_page, update_wiki_page
-from lorekeeper.obsidian_portal.calendar_parser import CalendarDate, add_entry, get_entries, parse_body, render_body
+import httpx
 
+from lorekeeper.obsidian_portal.api import edit_parsed_page, fetch_parsed_page
+from lorekeeper.obsidian_portal.calendar_parser import (
+    CalendarDate,
+    CalendarPage,
+    add_entries,
+    add_entry,
+    get_entries,
+    parse_body,
+    render_body,
+)
+from lorekeeper.obsidian_portal.models import CalendarEntryRequest, CalendarEntryResult
+from lorekeeper.obsidian_portal.page_cache import PageCache
 
-async def fetch_calendar_entries(
-    session: OAuth1Session,
+# A cached calendar is queried many times, so it is worth indexing once
+_parse_indexed_body = partial(parse_body, index=True)
+
+
+def _calendar_parser(page_cache: PageCache | None) -> Callable[[str], CalendarPage]:
+    return _parse_indexed_body if page_cache is not None else parse_body
+
+
+async def fetch_calendar_entries(  # noqa: PLR0913
+    client: httpx.AsyncClient,
     start: CalendarDate,
     end: CalendarDate | None = None,
     *,
-    campaign_id: str = settings.campaign_id,
-    page_id: str = settings.calendar_page_id,
+    campaign_id: str,
+    page_id: str,
+    page_cache: PageCache | None = None,
 ) -> list[tuple[CalendarDate, list[str]]]:
     """
     Fetch calendar entries for a date or date range.
@@ -23,20 +43,26 @@ async def fetch_calendar_entries(
     Returns a list of (date, [summary_titles]) for every date in the range that has entries.
     Results are in chronological order. Dates with no entries are omitted.
     """
-    page_data = await fetch_wiki_page(session, campaign_id, page_id)
-    calendar = parse_body(page_data.body)
+    calendar = await fetch_parsed_page(
+        client,
+        campaign_id,
+        page_id,
+        parse=_calendar_parser(page_cache),
+        page_cache=page_cache,
+    )
     return get_entries(calendar, start, end)
 
 
 async def add_calendar_entry(  # noqa: PLR0913
-    session: OAuth1Session,
+    client: httpx.AsyncClient,
     *,
     month_or_special_day: str,
     day: int | None,
     title: str,
     year: int | None = None,
-    campaign_id: str = settings.campaign_id,
-    page_id: str = settings.calendar_page_id,
+    campaign_id: str,
+    page_id: str,
+    page_cache: PageCache | None = None,
 ) -> int:
     """
     Add a summary link to the specified calendar date and persist the change.
@@ -46,12 +72,60 @@ async def add_calendar_entry(  # noqa: PLR0913
 
     Raises ValueError for invalid date combinations (e.g. Shieldmeet in a non-leap year).
     """
-    page_data = await fetch_wiki_page(session, campaign_id, page_id)
-    calendar = parse_body(page_data.body)
+    async with edit_parsed_page(
+        client,
+        campaign_id,
+        page_id,
+        parse=_calendar_parser(page_cache),
+        render=render_body,
+        page_cache=page_cache,
+    ) as calendar:
+        resolved_year = year if year is not None else calendar.years[0].year
+        date = CalendarDate(year=resolved_year, month_or_special_day=month_or_special_day, day=day)
+        add_entry(calendar, date, title)
+    return resolved_year
 
-    resolved_year = year if year is not None else calendar.years[0].year
 
-    date = CalendarDate(year=resolved_year, month_or_special_day=month_or_special_day, day=day)
-    add_entry(calendar, date, title)
-    await update_wiki_page(session, campaign_id, page_id, body=render_body(calendar))
-    return resolved_year
+async def add_calendar_entries(
+    client: httpx.AsyncClient,
+    entries: list[CalendarEntryRequest],
+    *,
+    campaign_id: str,
+    page_id: str,
+    page_cache: PageCache | None = None,
+) -> list[CalendarEntryResult]:
+    """
+    Add several summary links to the calendar with a single fetch and save of the page.
+
+    Entries without a year go to the most recent year in the calendar. An invalid entry is reported in
+    its result and does not stop the others; the page is not saved if no entry was added.
+    """
+    async with edit_parsed_page(
+        client,
+        campaign_id,
+        page_id,
+        parse=_calendar_parser(page_cache),
+        render=render_body,
+        page_cache=page_cache,
+    ) as calendar:
+        latest_year = calendar.years[0].year if calendar.years else None
+        results = [
+            CalendarEntryResult(
+                month_or_special_day=entry.month_or_special_day,
+                summary_title=entry.summary_title,
+                day=entry.day,
+                year=entry.year if entry.year is not None else latest_year,
+            )
+            for entry in entries
+        ]
+        dated: list[tuple[CalendarEntryResult, CalendarDate]] = []
+        for result in results:
+            if result.year is None:
+                result.error = "The calendar has no years yet; specify the year."
+                continue
+            date = CalendarDate(year=result.year, month_or_special_day=result.month_or_special_day, day=result.day)
+            dated.append((result, date))
+        errors = add_entries(calendar, [(date, result.summary_title) for result, date in dated])
+        for (result, _), error in zip(dated, errors, strict=True):
+            result.error = error
+    return results
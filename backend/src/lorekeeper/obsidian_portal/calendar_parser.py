@@ -5,7 +5,7 @@ The page body uses h2 year headings, accordion markup for months/special-days,
 and HTML tables for day cells. This module handles:
 - Parsing the body into structured objects
 - Serialising back to the original markup format (round-trip invariant)
-- Querying entries by date range
+- Querying entries by date range, optionally through a prebuilt date index
 - Inserting new wiki-link entries on a specific date
 
 Round-trip invariant: render_body(parse_body(raw)) == raw
@@ -15,6 +15,7 @@ Round-trip invariant: render_body(parse_body(raw)) == raw
 from __future__ import annotations
 
 import re
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
 
 from pydantic import BaseModel
@@ -70,6 +71,7 @@ CALENDAR_ORDER: list[str] = [
 _MONTHS_SET: frozenset[str] = frozenset(MONTHS)
 _SPECIAL_DAYS_SET: frozenset[str] = frozenset(SPECIAL_DAYS)
 _CALENDAR_ORDER_IDX: dict[str, int] = {name: i for i, name in enumerate(CALENDAR_ORDER)}
+DAYS_PER_MONTH = 30
 
 # ── Data model ─────────────────────────────────────────────────────────────────
 
@@ -82,6 +84,10 @@ class CalendarDate(BaseModel):
     day: int | None = None  # None for special days (Midwinter, Greengrass, etc.)
 
 
+type DateOrdinal = tuple[int, int, int]  # see _date_to_ordinal
+type CalendarEntry = tuple[CalendarDate, list[str]]  # a date and the wiki-link titles on it
+
+
 @dataclass
 class MonthBlock:
     """One month's accordion-item, including the full 30-day table."""
@@ -108,6 +114,33 @@ class YearBlock:
     raw_post_sections: str = ""  # text after last [end-accordion-item] (includes [end-accordion] and trailing)
 
 
+@dataclass
+class CalendarIndex:
+    """
+    Every date of a calendar that has entries, sorted chronologically, for binary-searching date ranges.
+
+    Built once by parse_body(raw, index=True) and kept up to date by add_entry. ordinals[i] is the
+    _date_to_ordinal of entries[i][0].
+    """
+
+    ordinals: list[DateOrdinal] = field(default_factory=list)
+    entries: list[CalendarEntry] = field(default_factory=list)
+
+    def query(self, start_ord: DateOrdinal, end_ord: DateOrdinal) -> list[CalendarEntry]:
+        lo = bisect_left(self.ordinals, start_ord)
+        hi = bisect_right(self.ordinals, end_ord, lo=lo)
+        return [(date, list(links)) for date, links in self.entries[lo:hi]]
+
+    def replace_section(self, year: int, name: str, entries: list[CalendarEntry]) -> None:
+        """Replace the entries of one month or special day of a year, e.g. after adding an entry to it."""
+        order = _calendar_order_key(name)
+        lo = bisect_left(self.ordinals, (year, order, 0))
+        hi = bisect_left(self.ordinals, (year, order + 1, 0), lo=lo)
+        entries = sorted(entries, key=lambda entry: _date_to_ordinal(entry[0]))
+        self.ordinals[lo:hi] = [_date_to_ordinal(date) for date, _ in entries]
+        self.entries[lo:hi] = entries
+
+
 @dataclass
 class CalendarPage:
     """The full parsed calendar page."""
@@ -115,6 +148,7 @@ class CalendarPage:
     pre: str  # content before the first h2
     years: list[YearBlock] = field(default_factory=list)  # most recent year first
     hidden_div: str = ""  # <div style="visibility: hidden;">...</div> at end of page
+    index: CalendarIndex | None = None  # built by parse_body(raw, index=True); not rendered
 
 
 # ── Compiled patterns ──────────────────────────────────────────────────────────
@@ -137,8 +171,13 @@ _HIDDEN_DIV_MARKER = '<div style="visibility: hidden;">'
 # ── Parse ──────────────────────────────────────────────────────────────────────
 
 
-def parse_body(raw: str) -> CalendarPage:
-    """Parse the calendar wiki page body into a structured CalendarPage."""
+def parse_body(raw: str, *, index: bool = False) -> CalendarPage:
+    """
+    Parse the calendar wiki page body into a structured CalendarPage.
+
+    With index=True, also build a CalendarIndex of all entries, so get_entries only touches the
+    dates in range instead of re-scanning every month. Worth it when the page is queried repeatedly.
+    """
     # Split off the hidden div template at the end (contains example accordion items)
     hidden_idx = raw.find(_HIDDEN_DIV_MARKER)
     if hidden_idx != -1:
@@ -152,10 +191,12 @@ def parse_body(raw: str) -> CalendarPage:
     pre = parts[0]
     year_texts = [p for p in parts[1:] if p]
 
+    years = [_parse_year(yt) for yt in year_texts]
     return CalendarPage(
         pre=pre,
-        years=[_parse_year(yt) for yt in year_texts],
+        years=years,
         hidden_div=hidden_div,
+        index=_build_index(years) if index else None,
     )
 
 
@@ -218,7 +259,7 @@ def _calendar_order_key(name: str) -> int:
     return _CALENDAR_ORDER_IDX.get(name, 999)
 
 
-def _date_to_ordinal(date: CalendarDate) -> tuple[int, int, int]:
+def _date_to_ordinal(date: CalendarDate) -> DateOrdinal:
     """Return a tuple suitable for chronological comparison."""
     return (date.year, _calendar_order_key(date.month_or_special_day), date.day or 0)
 
@@ -246,10 +287,37 @@ def _get_special_day_entries(block: SpecialDayBlock) -> list[str]:
     return _extract_wiki_links(m.group(2))
 
 
+def _section_name(section: MonthBlock | SpecialDayBlock) -> str:
+    return section.month if isinstance(section, MonthBlock) else section.name
+
+
+def _section_day_links(section: MonthBlock | SpecialDayBlock) -> list[tuple[int | None, list[str]]]:
+    """Return (day_number, [wiki_link_titles]) for every day of a section with entries; day is None for special days."""
+    if isinstance(section, SpecialDayBlock):
+        links = _get_special_day_entries(section)
+        return [(None, links)] if links else []
+    return [(day_num, links) for day_num, links in sorted(_get_month_day_entries(section), key=lambda x: x[0]) if links]
+
+
+def _section_index_entries(year: int, sections: list[MonthBlock | SpecialDayBlock]) -> list[CalendarEntry]:
+    return [
+        (CalendarDate(year=year, month_or_special_day=_section_name(section), day=day_num), links)
+        for section in sections
+        for day_num, links in _section_day_links(section)
+    ]
+
+
+def _build_index(years: list[YearBlock]) -> CalendarIndex:
+    entries = [entry for year_block in years for entry in _section_index_entries(year_block.year, year_block.sections)]
+    # Stable, so duplicate sections or cells keep their page order
+    entries.sort(key=lambda entry: _date_to_ordinal(entry[0]))
+    return CalendarIndex(ordinals=[_date_to_ordinal(date) for date, _ in entries], entries=entries)
+
+
 # ── Public query API ───────────────────────────────────────────────────────────
 
 
-def get_entries(  # noqa: C901
+def get_entries(
     page: CalendarPage,
     start: CalendarDate,
     end: CalendarDate | None = None,
@@ -260,6 +328,7 @@ def get_entries(  # noqa: C901
     If end is None, returns entries for start only.
     Results are in chronological order.
     Dates with no entries are omitted.
+    Uses page.index when the page was parsed with one.
     """
     if end is None:
         end = start
@@ -270,6 +339,9 @@ def get_entries(  # noqa: C901
     if start_ord > end_ord:
         raise ValueError(f"start date {start} must be before or equal to end date {end}")
 
+    if page.index is not None:
+        return page.index.query(start_ord, end_ord)
+
     results: list[tuple[CalendarDate, list[str]]] = []
 
     # Page stores years newest-first; iterate in reverse for chronological output
@@ -287,17 +359,14 @@ def get_entries(  # noqa: C901
         )
 
         for section in sorted_sections:
-            if isinstance(section, SpecialDayBlock):
-                date = CalendarDate(year=year, month_or_special_day=section.name, day=None)
-                if start_ord <= _date_to_ordinal(date) <= end_ord:
-                    links = _get_special_day_entries(section)
-                    if links:
-                        results.append((date, links))
-            else:
-                for day_num, links in sorted(_get_month_day_entries(section), key=lambda x: x[0]):
-                    date = CalendarDate(year=year, month_or_special_day=section.month, day=day_num)
-                    if start_ord <= _date_to_ordinal(date) <= end_ord and links:
-                        results.append((date, links))
+            name = _section_name(section)
+            order = _calendar_order_key(name)
+            # Skip sections entirely outside the range without scanning their cells
+            if (year, order, 99) < start_ord or (year, order, 0) > end_ord:
+                continue
+            for day_num, links in _section_day_links(section):
+                if start_ord <= (year, order, day_num or 0) <= end_ord:
+                    results.append((CalendarDate(year=year, month_or_special_day=name, day=day_num), links))
 
     return results
 
@@ -375,10 +444,10 @@ def _new_month_accordion_item(month: str) -> str:
         "            </div>\n"
         "        </td>"
     )
-    cells = [cell_template.format(day=d) for d in range(1, 31)]
+    cells = [cell_template.format(day=d) for d in range(1, DAYS_PER_MONTH + 1)]
 
     rows: list[str] = []
-    for row_start in range(0, 30, 10):
+    for row_start in range(0, DAYS_PER_MONTH, 10):
         row_cells = "\n".join(cells[row_start : row_start + 10])
         rows.append(f"    <tr>\n{row_cells}\n    </tr>")
 
@@ -466,6 +535,11 @@ def add_entry(page: CalendarPage, date: CalendarDate, title: str) -> None:
     - Shieldmeet is requested for a non-leap year
     - A regular month day is requested without a day number
     - A special day is requested with a day number
+    - A regular month day is outside 1-30
+    - The month block of an existing month has no cell for the day
+
+    The page is left unchanged when it raises: every check that doesn't need the month block is done
+    before the year or section is created, and a created month block has a cell for every day.
     """
     name = date.month_or_special_day
 
@@ -478,8 +552,11 @@ def add_entry(page: CalendarPage, date: CalendarDate, title: str) -> None:
     if name in _SPECIAL_DAYS_SET and date.day is not None:
         raise ValueError(f"{name} is a special day and does not have a day number; omit day.")
 
-    if name in _MONTHS_SET and date.day is None:
-        raise ValueError(f"{name} is a regular month; a day number (1-30) must be specified.")
+    if name in _MONTHS_SET:
+        if date.day is None:
+            raise ValueError(f"{name} is a regular month; a day number (1-30) must be specified.")
+        if not 1 <= date.day <= DAYS_PER_MONTH:
+            raise ValueError(f"Day {date.day} does not exist; {name} has days 1-30.")
 
     link = f"[[{title} | {title}]]"
     year_block = _get_or_create_year(page, date.year)
@@ -489,3 +566,25 @@ def add_entry(page: CalendarPage, date: CalendarDate, title: str) -> None:
         section.raw_accordion_item = _insert_link_in_special_day(section.raw_accordion_item, link)
     else:
         section.raw_accordion_item = _insert_link_in_month(section.raw_accordion_item, date.day, link)  # type: ignore[arg-type]  # ty: ignore[invalid-argument-type]
+
+    if page.index is not None:
+        same_sections = [s for y in page.years if y.year == date.year for s in y.sections if _section_name(s) == name]
+        page.index.replace_section(date.year, name, _section_index_entries(date.year, same_sections))
+
+
+def add_entries(page: CalendarPage, entries: list[tuple[CalendarDate, str]]) -> list[str | None]:
+    """
+    Add several wiki-link entries, as add_entry does for each (date, title) in order.
+
+    An invalid entry does not stop the others. Returns, for each entry, the error message of the
+    ValueError add_entry raised for it, or None if it was added.
+    """
+    errors: list[str | None] = []
+    for date, title in entries:
+        try:
+            add_entry(page, date, title)
+        except ValueError as e:
+            errors.append(str(e))
+        else:
+            errors.append(None)
+    return errors
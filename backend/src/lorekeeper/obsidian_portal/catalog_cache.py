@@ -0,0 +1,81 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+
+class CatalogCache[T]:
+    """
+    In-memory cache of one catalog per campaign (e.g. its wiki page summaries), kept for ttl_seconds.
+
+    Concurrent reads of a missing or expired catalog share a single load. Tools that change the
+    catalog on the Portal call invalidate() so the next read fetches it again, or update() when they
+    can apply the change to the cached catalog themselves.
+
+    With refresh_in_background, an expired catalog is still returned while a reload runs in the
+    background, so only the first read of a campaign waits for the Portal. A ttl_seconds of 0 or less
+    disables caching, so every read loads the catalog, in the background or not.
+    """
+
+    def __init__(
+        self,
+        load: Callable[[str], Awaitable[T]],
+        *,
+        ttl_seconds: float,
+        refresh_in_background: bool = False,
+    ) -> None:
+        self._load = load
+        self._ttl_seconds = ttl_seconds
+        self._refresh_in_background = refresh_in_background
+        self._entries: dict[str, tuple[float, T]] = {}  # campaign ID -> (expires_at, catalog)
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._generations: dict[str, int] = {}  # bumped whenever the catalog changes outside of a load
+        self._refreshes: dict[str, asyncio.Task[None]] = {}
+
+    async def get(self, campaign_id: str) -> T:
+        entry = self._entries.get(campaign_id)
+        if entry is not None:
+            expires_at, catalog = entry
+            if time.monotonic() < expires_at:
+                return catalog
+            if self._refresh_in_background and self._ttl_seconds > 0:
+                self._start_refresh(campaign_id)
+                return catalog
+        return await self._load_once(campaign_id)
+
+    def invalidate(self, campaign_id: str) -> None:
+        self._entries.pop(campaign_id, None)
+        self._generations[campaign_id] = self._generations.get(campaign_id, 0) + 1
+
+    def update(self, campaign_id: str, apply: Callable[[T], None]) -> None:
+        """Apply an in-place change to the cached catalog, if there is one, e.g. after creating an entry."""
+        entry = self._entries.get(campaign_id)
+        if entry is not None:
+            apply(entry[1])
+        # A load already in flight may have missed the change
+        self._generations[campaign_id] = self._generations.get(campaign_id, 0) + 1
+
+    async def _load_once(self, campaign_id: str) -> T:
+        async with self._locks.setdefault(campaign_id, asyncio.Lock()):
+            # Another caller may have loaded it while we waited for the lock
+            entry = self._entries.get(campaign_id)
+            if entry is not None and time.monotonic() < entry[0]:
+                return entry[1]
+            generation = self._generations.get(campaign_id, 0)
+            catalog = await self._load(campaign_id)
+            # A write during the load may not be reflected in what we got, so only use it for this call
+            if self._generations.get(campaign_id, 0) == generation:
+                self._entries[campaign_id] = (time.monotonic() + self._ttl_seconds, catalog)
+            return catalog
+
+    def _start_refresh(self, campaign_id: str) -> None:
+        if campaign_id in self._refreshes:
+            return
+        task = asyncio.create_task(self._refresh(campaign_id))
+        self._refreshes[campaign_id] = task
+        task.add_done_callback(lambda _: self._refreshes.pop(campaign_id, None))
+
+    async def _refresh(self, campaign_id: str) -> None:
+        try:
+            await self._load_once(campaign_id)
+        except Exception as e:
+            print(f"Background refresh of the catalog of campaign {campaign_id} failed, keeping the old one: {e}")
@@ -0,0 +1,48 @@
+from bisect import bisect_left, insort
+
+from lorekeeper.obsidian_portal.models import CharacterCatalog
+
+
+class CharacterIndex:
+    """
+    A campaign's character catalog with a case-insensitive substring index over names and slugs.
+
+    Every suffix of every lowercased name and slug is kept in a sorted list (a suffix array), so the
+    characters containing a string are those with a suffix starting with it, found with a binary search
+    instead of scanning the whole catalog.
+    """
+
+    def __init__(self, characters: list[CharacterCatalog]) -> None:
+        self._characters: list[CharacterCatalog] = []
+        self._suffixes: list[tuple[str, int]] = []  # (suffix, position in self._characters)
+        for character in characters:
+            self._suffixes.extend(self._append(character))
+        self._suffixes.sort()
+
+    @property
+    def characters(self) -> list[CharacterCatalog]:
+        return list(self._characters)
+
+    def add(self, character: CharacterCatalog) -> None:
+        """Add a character, e.g. one just created on the Portal, keeping the index sorted."""
+        for suffix in self._append(character):
+            insort(self._suffixes, suffix)
+
+    def search(self, text: str) -> list[CharacterCatalog]:
+        """Characters whose name or slug contains text (case-insensitive), in catalog order."""
+        needle = text.lower()
+        matches: set[int] = set()
+        i = bisect_left(self._suffixes, (needle,))
+        while i < len(self._suffixes) and self._suffixes[i][0].startswith(needle):
+            matches.add(self._suffixes[i][1])
+            i += 1
+        return [self._characters[position] for position in sorted(matches)]
+
+    def _append(self, character: CharacterCatalog) -> list[tuple[str, int]]:
+        position = len(self._characters)
+        self._characters.append(character)
+        return [
+            (key[start:], position)
+            for key in {character.name.lower(), character.slug.lower()}
+            for start in range(len(key))
+        ]
@@ -0,0 +1,98 @@
+"""Pure helpers for splitting documents into overlapping chunks and stitching them back together."""
+
+OVERLAP_CHARS = 150
+GAP_MARKER = "[...]"
+TRUNCATION_MARKER = " [truncated]"
+CHARS_PER_TOKEN = 4  # rough average for English prose
+
+
+def chunk_text(text: str, max_chars: int = 800, overlap_chars: int = OVERLAP_CHARS) -> list[str]:
+    """
+    Split text into paragraphs, then group paragraphs until they reach max_chars.
+    Add overlap (in characters) between chunks for better context retention.
+    """
+    paragraphs = [p.strip() for p in text.split("\n") if p.strip()]
+    chunks = []
+    current = ""
+    last_chunk = ""
+
+    for p in paragraphs:
+        if len(current) + len(p) + 1 <= max_chars:
+            current = f"{current}\n{p}" if current else p
+        else:
+            if current:
+                chunks.append(current)
+                # Add overlap: take the last overlap_chars from the current chunk
+                last_chunk = current[-overlap_chars:] if overlap_chars > 0 else ""
+            # Start new chunk with overlap
+            current = (last_chunk + "\n" + p).strip() if last_chunk else p
+
+    if current:
+        chunks.append(current)
+
+    return chunks
+
+
+def strip_overlap(previous: str, chunk: str, overlap_chars: int = OVERLAP_CHARS) -> str:
+    """
+    Remove the text chunk_text() repeats from previous at the start of chunk, the next chunk in the same document.
+
+    Returns chunk unchanged if it does not start with that overlap.
+    """
+    overlap = previous[-overlap_chars:].strip() if overlap_chars > 0 else ""
+    if overlap and chunk.startswith(overlap + "\n"):
+        return chunk[len(overlap) + 1 :]
+    return chunk
+
+
+def merge_chunks(chunks: list[tuple[int, str]], overlap_chars: int = OVERLAP_CHARS) -> str:
+    """
+    Join (chunk_index, text) pairs of one document into a single text, in chunk order.
+
+    Overlap between consecutive chunks is removed; GAP_MARKER marks skipped chunks between non-consecutive ones.
+    """
+    parts: list[str] = []
+    previous: tuple[int, str] | None = None
+    for index, text in sorted(chunks):
+        if previous is None:
+            parts.append(text)
+        elif index == previous[0] + 1:
+            parts.append(strip_overlap(previous[1], text, overlap_chars))
+        elif index != previous[0]:
+            parts.extend((GAP_MARKER, text))
+        else:
+            continue
+        previous = (index, text)
+    return "\n".join(parts)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for budgeting tool output, without depending on the model's tokenizer."""
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def pack_chunks(chunks: dict[int, str], priority: list[int], max_tokens: int) -> dict[int, str]:
+    """
+    Pick chunks in priority order until max_tokens is spent and return them in chunk order.
+
+    Text repeated from a selected previous chunk is stripped and not counted. If not even the first
+    chunk fits, it is cut to the budget and ends with TRUNCATION_MARKER.
+    """
+    selected: set[int] = set()
+    used = 0
+    for index in priority:
+        text = chunks[index]
+        if index - 1 in selected:
+            text = strip_overlap(chunks[index - 1], text)
+        cost = estimate_tokens(text)
+        if used + cost > max_tokens:
+            if not selected:
+                return {index: text[: max(0, max_tokens) * CHARS_PER_TOKEN] + TRUNCATION_MARKER}
+            break
+        selected.add(index)
+        used += cost
+
+    packed: dict[int, str] = {}
+    for index in sorted(selected):
+        packed[index] = strip_overlap(chunks[index - 1], chunks[index]) if index - 1 in selected else chunks[index]
+    return packed
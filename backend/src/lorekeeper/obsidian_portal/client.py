@@ -0,0 +1,52 @@
+"""Async HTTP client for the Obsidian Portal API, with OAuth1-signed requests over a pooled connection."""
+
+from collections.abc import Generator
+
+import httpx
+from oauthlib.oauth1 import Client as OAuth1Client
+
+from lorekeeper.config import settings
+
+USER_AGENT = "ObsidianPortalOAuthTest/1.0"
+
+
+class OAuth1Auth(httpx.Auth):
+    """Signs every request with OAuth1 HMAC-SHA1 in the Authorization header."""
+
+    def __init__(self, *, client_key: str, client_secret: str, token: str, token_secret: str) -> None:
+        self._signer = OAuth1Client(
+            client_key,
+            client_secret=client_secret,
+            resource_owner_key=token,
+            resource_owner_secret=token_secret,
+        )
+
+    def auth_flow(self, request: httpx.Request) -> Generator[httpx.Request, httpx.Response]:
+        # The Portal API takes JSON bodies, which (unlike form bodies) are not part of the OAuth1 signature
+        _, headers, _ = self._signer.sign(str(request.url), http_method=request.method)
+        request.headers["Authorization"] = headers["Authorization"]
+        yield request
+
+
+def create_portal_client(*, token: str, token_secret: str) -> httpx.AsyncClient:
+    """
+    Return an async client for the Portal API; share one per process and close it with aclose().
+
+    Connections are kept alive and reused across concurrent requests (over HTTP/2 when the server
+    negotiates it), so callers don't need a thread per request.
+    """
+    return httpx.AsyncClient(
+        auth=OAuth1Auth(
+            client_key=settings.consumer_key,
+            client_secret=settings.consumer_secret,
+            token=token,
+            token_secret=token_secret,
+        ),
+        headers={"User-Agent": USER_AGENT},
+        http2=True,
+        timeout=httpx.Timeout(settings.portal_timeout_seconds),
+        limits=httpx.Limits(
+            max_connections=settings.portal_max_connections,
+            max_keepalive_connections=settings.portal_max_connections,
+        ),
+    )
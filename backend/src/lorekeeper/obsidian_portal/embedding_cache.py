@@ -0,0 +1,59 @@
+import hashlib
+import sqlite3
+from collections.abc import Sequence
+from pathlib import Path
+
+import numpy as np
+
+# Keys per SELECT, kept well below SQLite's limit on bound parameters
+_LOOKUP_BATCH_SIZE = 500
+
+
+class EmbeddingCache:
+    """
+    On-disk store of chunk embeddings keyed by a hash of the model name, chunking version and chunk text.
+
+    Lets the fetcher skip the embedding model for chunks it has already embedded, e.g. the
+    untouched paragraphs of an edited page or every chunk of a full rebuild. Embeddings of another
+    model or CHUNKING_VERSION are never returned. Keeps running hit/miss totals for the fetcher to report.
+    """
+
+    def __init__(self, path: Path, *, model_name: str, chunking_version: int) -> None:
+        # The fetcher embeds from worker threads, one batch at a time
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)")
+        self._key_prefix = f"{model_name}\0{chunking_version}\0"
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, chunk: str) -> str:
+        return hashlib.sha256(f"{self._key_prefix}{chunk}".encode()).hexdigest()
+
+    def get_many(self, chunks: Sequence[str]) -> list[np.ndarray | None]:
+        """Return the cached vector of each chunk, or None where it has not been embedded before."""
+        keys = [self._key(chunk) for chunk in chunks]
+        found: dict[str, np.ndarray] = {}
+        for start in range(0, len(keys), _LOOKUP_BATCH_SIZE):
+            batch = keys[start : start + _LOOKUP_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            rows = self._connection.execute(
+                f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                batch,
+            )
+            found.update((key, np.frombuffer(vector, dtype=np.float32)) for key, vector in rows)
+        vectors = [found.get(key) for key in keys]
+        hits = sum(vector is not None for vector in vectors)
+        self.hits += hits
+        self.misses += len(vectors) - hits
+        return vectors
+
+    def put_many(self, chunks: Sequence[str], vectors: Sequence[np.ndarray]) -> None:
+        rows = [
+            (self._key(chunk), np.asarray(vector, dtype=np.float32).tobytes())
+            for chunk, vector in zip(chunks, vectors, strict=True)
+        ]
+        with self._connection:
+            self._connection.executemany("INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)", rows)
+
+    def close(self) -> None:
+        self._connection.close()
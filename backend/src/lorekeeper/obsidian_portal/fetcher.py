@@ -1,91 +1,325 @@
+import argparse
 import asyncio
+import functools
 import json
 import logging
+import re
 import time
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 
-from fastembed import TextEmbedding
+import httpx
+from fastembed import SparseTextEmbedding, TextEmbedding
 from qdrant_client import AsyncQdrantClient
-from qdrant_client.models import Distance, VectorParams
+from qdrant_client.models import (
+    CreateAlias,
+    CreateAliasOperation,
+    DeleteAlias,
+    DeleteAliasOperation,
+    Distance,
+    Modifier,
+    SparseVectorParams,
+    VectorParams,
+)
 
-from lorekeeper.config import settings
+from lorekeeper.config import CampaignSettings, settings
 from lorekeeper.observability import setup_observability
-from lorekeeper.obsidian_portal.api import fetch_characters, fetch_wiki_pages
-from lorekeeper.obsidian_portal.auth import get_authenticated_session_async
-from lorekeeper.obsidian_portal.ingest import prepare_document_points, upsert_points
+from lorekeeper.obsidian_portal.api import fetch_wiki_pages, iter_characters
+from lorekeeper.obsidian_portal.auth import get_portal_client
+from lorekeeper.obsidian_portal.embedding_cache import EmbeddingCache
+from lorekeeper.obsidian_portal.ingest import (
+    CHUNKING_VERSION,
+    delete_documents,
+    ensure_payload_indexes,
+    fetch_stored_documents,
+    quantization_config,
+)
 from lorekeeper.obsidian_portal.models import Document
+from lorekeeper.obsidian_portal.pipeline import IngestPipeline, IngestStats
 
 logger = logging.getLogger(__name__)
 
+_EMBEDDING_MODEL_NAME = "BAAI/bge-base-en-v1.5"
+
 _tracer, _meter = setup_observability("lorekeeper-fetcher")
-_doc_counter = _meter.create_counter("lorekeeper.ingest.documents", description="Documents ingested per run")
+_doc_counter = _meter.create_counter(
+    "lorekeeper.ingest.documents",
+    description="Documents processed per run, by status (ingested/unchanged/deleted)",
+)
 _chunk_counter = _meter.create_counter("lorekeeper.ingest.chunks", description="Chunks stored per run")
 _ingest_duration = _meter.create_histogram(
     "lorekeeper.ingest.duration_seconds",
     description="Wall time for a full fetch-ingest run",
 )
+_embedding_cache_counter = _meter.create_counter(
+    "lorekeeper.ingest.embedding_cache_lookups",
+    description="Chunk embedding cache lookups per run, by result (hit/miss)",
+)
+_embed_throughput = _meter.create_histogram(
+    "lorekeeper.ingest.embed_chunks_per_second",
+    description="Embedding throughput of the fetcher, in chunks per second of embedding time",
+)
 
 
-async def main() -> None:
+async def main(*, full_rebuild: bool = False, campaign_id: str | None = None) -> None:
     start = time.monotonic()
     with _tracer.start_as_current_span("fetcher.main"):
         fetched_at = datetime.now(UTC)
-        qdrant_client = await _setup_qdrant()
-        print("Setting up authenticated session...")
-        session = await get_authenticated_session_async()
-        docs: list[Document] = []
-        docs += await fetch_wiki_pages(session, settings.campaign_id)
-        docs += await fetch_characters(session, settings.campaign_id, enrich=True)
-        embed_model = _load_embedding_model()
-        total_chunks = await _ingest_documents(docs, embed_model, qdrant_client)
+        campaigns = [settings.campaign(campaign_id)] if campaign_id else settings.campaigns
+        print("Initializing Qdrant client...")
+        qdrant_client = AsyncQdrantClient(url=settings.qdrant_url)
+        print("Setting up authenticated Portal client...")
+        portal_client = await get_portal_client()
+        embedding_cache = EmbeddingCache(
+            settings.data_dir / "embedding_cache.sqlite3",
+            model_name=_EMBEDDING_MODEL_NAME,
+            chunking_version=CHUNKING_VERSION,
+        )
+        try:
+            for campaign in campaigns:
+                await _ingest_campaign(
+                    qdrant_client,
+                    portal_client,
+                    campaign,
+                    embedding_cache=embedding_cache,
+                    full_rebuild=full_rebuild,
+                    fetched_at=fetched_at,
+                )
+        finally:
+            embedding_cache.close()
+            await portal_client.aclose()
+
         (settings.data_dir / "last_fetched.json").write_text(
             json.dumps({"fetched_at": fetched_at.isoformat()}),
             encoding="utf-8",
         )
         print("Wrote last_fetched.json")
-        elapsed = time.monotonic() - start
-        _ingest_duration.record(elapsed)
-        _doc_counter.add(len(docs))
-        _chunk_counter.add(total_chunks)
-        logger.info("Ingest complete: %d docs, %d chunks in %.1fs", len(docs), total_chunks, elapsed)
+        _report_embedding(embedding_cache)
+        _ingest_duration.record(time.monotonic() - start)
+
+
+async def _ingest_campaign(  # noqa: PLR0913
+    qdrant_client: AsyncQdrantClient,
+    portal_client: httpx.AsyncClient,
+    campaign: CampaignSettings,
+    *,
+    embedding_cache: EmbeddingCache,
+    full_rebuild: bool,
+    fetched_at: datetime,
+) -> None:
+    start = time.monotonic()
+    with _tracer.start_as_current_span("fetcher.ingest_campaign", attributes={"campaign_id": campaign.campaign_id}):
+        print(f"Ingesting campaign '{campaign.campaign_id}' into '{campaign.collection_name}'...")
+        alias = campaign.collection_name
+        live_collection = await _get_live_collection(qdrant_client, alias)
+        rebuild = full_rebuild or live_collection is None
+        if (
+            live_collection is not None
+            and not rebuild
+            and not await _has_sparse_vectors(qdrant_client, live_collection)
+        ):
+            print(f"Live collection '{live_collection}' has no sparse vectors for hybrid search, rebuilding.")
+            rebuild = True
+        if rebuild:
+            # Build next to the live collection so search keeps working until the alias is switched
+            collection_name = await _create_versioned_collection(qdrant_client, alias, fetched_at)
+            stored = {}
+        else:
+            assert live_collection is not None
+            collection_name = live_collection
+            print(f"Using live collection '{collection_name}' for incremental ingest.")
+            # Collections built before the indexes existed get them on their next incremental run
+            await ensure_payload_indexes(qdrant_client, collection_name)
+            stored = await fetch_stored_documents(qdrant_client, collection_name)
+
+        try:
+            pipeline = IngestPipeline(
+                qdrant_client,
+                collection_name=collection_name,
+                stored=stored,
+                load_embed_model=_load_embedding_model,
+                batch_size=settings.embed_batch_size,
+                embedding_cache=embedding_cache,
+                load_sparse_model=_load_sparse_model,
+            )
+            stats = await pipeline.run([
+                _iter_wiki_pages(portal_client, campaign.campaign_id),
+                iter_characters(portal_client, campaign.campaign_id, enrich=True),
+            ])
+            removed_ids = sorted(stored.keys() - stats.seen_ids)
+            await delete_documents(qdrant_client, collection_name, removed_ids)
+        except Exception:
+            if rebuild:
+                print(f"Ingest failed, dropping unfinished collection '{collection_name}'.")
+                await qdrant_client.delete_collection(collection_name)
+            raise
 
+        if rebuild:
+            await _switch_alias(qdrant_client, alias, collection_name)
+            await _prune_collection_versions(qdrant_client, alias, previous_collection=live_collection)
+        _report_run(campaign, stats, removed_ids, elapsed=time.monotonic() - start)
 
-async def _setup_qdrant() -> AsyncQdrantClient:
-    print("Initializing Qdrant client...")
+
+async def rollback(campaign_id: str | None = None) -> None:
+    """Point the campaign's alias back at the newest collection version older than the live one."""
+    alias = settings.campaign(campaign_id).collection_name
     qdrant_client = AsyncQdrantClient(url=settings.qdrant_url)
-    print("Setting up Qdrant collection...")
-    if await qdrant_client.collection_exists(settings.collection_name):
-        await qdrant_client.delete_collection(settings.collection_name)
-        print("Deleted existing collection.")
+    live_collection = await _get_live_collection(qdrant_client, alias)
+    previous = [
+        name for name in await _list_collection_versions(qdrant_client, alias) if name < (live_collection or "")
+    ]
+    if not previous:
+        raise RuntimeError(f"No collection version older than '{live_collection}' to roll back to.")
+    await _switch_alias(qdrant_client, alias, previous[-1])
+
 
+async def _get_live_collection(qdrant_client: AsyncQdrantClient, alias: str) -> str | None:
+    """Return the collection currently served under alias, or None if there is none."""
+    for existing in (await qdrant_client.get_aliases()).aliases:
+        if existing.alias_name == alias:
+            return existing.collection_name
+    if await qdrant_client.collection_exists(alias):
+        # Deployments from before the alias swap store the data directly in a collection with this name
+        return alias
+    return None
+
+
+async def _list_collection_versions(qdrant_client: AsyncQdrantClient, alias: str) -> list[str]:
+    """Return the versioned collections behind alias, oldest first."""
+    version_re = re.compile(re.escape(alias) + r"_\d{14}")
+    collections = (await qdrant_client.get_collections()).collections
+    return sorted(c.name for c in collections if version_re.fullmatch(c.name))
+
+
+async def _create_versioned_collection(qdrant_client: AsyncQdrantClient, alias: str, fetched_at: datetime) -> str:
+    collection_name = f"{alias}_{fetched_at:%Y%m%d%H%M%S}"
+    print(f"Creating Qdrant collection '{collection_name}'...")
     await qdrant_client.create_collection(
-        collection_name=settings.collection_name,
+        collection_name=collection_name,
         vectors_config={
-            settings.vector_name: VectorParams(size=768, distance=Distance.COSINE),
+            settings.vector_name: VectorParams(size=768, distance=Distance.COSINE, on_disk=settings.vectors_on_disk),
         },
+        quantization_config=quantization_config(settings.vector_quantization),
+        # BM25 scores need the collection-wide IDF, which Qdrant computes at query time
+        sparse_vectors_config={settings.sparse_vector_name: SparseVectorParams(modifier=Modifier.IDF)},
     )
+    await ensure_payload_indexes(qdrant_client, collection_name)
     print("Qdrant collection is ready.")
-    return qdrant_client
+    return collection_name
 
 
-def _load_embedding_model() -> TextEmbedding:
-    print("Loading fastembed model BAAI/bge-base-en-v1.5...")
-    return TextEmbedding("BAAI/bge-base-en-v1.5")
+async def _has_sparse_vectors(qdrant_client: AsyncQdrantClient, collection_name: str) -> bool:
+    sparse_vectors = (await qdrant_client.get_collection(collection_name)).config.params.sparse_vectors
+    return settings.sparse_vector_name in (sparse_vectors or {})
 
 
-async def _ingest_documents(
-    docs: list[Document],
-    embed_model: TextEmbedding,
+async def _switch_alias(qdrant_client: AsyncQdrantClient, alias: str, collection_name: str) -> None:
+    """Atomically point alias at collection_name."""
+    live_collection = await _get_live_collection(qdrant_client, alias)
+    operations: list[CreateAliasOperation | DeleteAliasOperation] = []
+    if live_collection == alias:
+        # An alias cannot share its name with a collection, so the pre-alias collection has to go first.
+        # This is a one-time migration and the only moment search is briefly unavailable.
+        await qdrant_client.delete_collection(alias)
+        print(f"Deleted pre-alias collection '{alias}'.")
+    elif live_collection is not None:
+        operations.append(DeleteAliasOperation(delete_alias=DeleteAlias(alias_name=alias)))
+    operations.append(
+        CreateAliasOperation(create_alias=CreateAlias(collection_name=collection_name, alias_name=alias)),
+    )
+    await qdrant_client.update_collection_aliases(change_aliases_operations=operations)
+    print(f"Alias '{alias}' now points to '{collection_name}' (was '{live_collection}').")
+
+
+async def _prune_collection_versions(
     qdrant_client: AsyncQdrantClient,
-) -> int:
-    total_chunks = 0
-    for i, doc in enumerate(docs):
-        print(f"Processing document {i + 1}")
-        points = await asyncio.to_thread(prepare_document_points, doc, embed_model)
-        total_chunks += len(points)
-        await upsert_points(qdrant_client, collection_name=settings.collection_name, points=points)
-    return total_chunks
+    alias: str,
+    *,
+    previous_collection: str | None,
+) -> None:
+    """
+    Delete old versions behind alias, keeping the live one plus collection_versions_to_keep for rollback.
+
+    previous_collection, the version that was live before the alias switch, is kept first even if it is
+    not among the newest: after a --rollback the newer versions are the ones that were rolled back from.
+    """
+    live_collection = await _get_live_collection(qdrant_client, alias)
+    versions = [name for name in await _list_collection_versions(qdrant_client, alias) if name != live_collection]
+    if previous_collection in versions:
+        versions.remove(previous_collection)
+        versions.append(previous_collection)
+    keep = settings.collection_versions_to_keep
+    for name in versions[: max(0, len(versions) - keep)]:
+        await qdrant_client.delete_collection(name)
+        print(f"Deleted old collection version '{name}'.")
+
+
+def _report_run(campaign: CampaignSettings, stats: IngestStats, removed_ids: list[str], *, elapsed: float) -> None:
+    unchanged = len(stats.seen_ids) - stats.ingested
+    attributes = {"campaign_id": campaign.campaign_id}
+    _doc_counter.add(stats.ingested, {**attributes, "status": "ingested"})
+    _doc_counter.add(unchanged, {**attributes, "status": "unchanged"})
+    _doc_counter.add(len(removed_ids), {**attributes, "status": "deleted"})
+    _chunk_counter.add(stats.chunks, attributes)
+    if stats.embed_seconds > 0:
+        chunks_per_second = stats.chunks / stats.embed_seconds
+        _embed_throughput.record(chunks_per_second, attributes)
+        print(f"Embedding throughput: {chunks_per_second:.1f} chunks/s over {stats.embed_seconds:.1f}s")
+    logger.info(
+        "Ingest of campaign %s complete: %d docs (%d re-embedded, %d unchanged, %d removed), %d chunks in %.1fs",
+        campaign.campaign_id,
+        len(stats.seen_ids),
+        stats.ingested,
+        unchanged,
+        len(removed_ids),
+        stats.chunks,
+        elapsed,
+    )
+
+
+def _report_embedding(embedding_cache: EmbeddingCache) -> None:
+    _embedding_cache_counter.add(embedding_cache.hits, {"result": "hit"})
+    _embedding_cache_counter.add(embedding_cache.misses, {"result": "miss"})
+    print(f"Embedding cache: {embedding_cache.hits} hits, {embedding_cache.misses} misses")
+
+
+# Cached so every campaign of a run shares one copy of each model
+@functools.cache
+def _load_embedding_model() -> TextEmbedding:
+    print(f"Loading fastembed model {_EMBEDDING_MODEL_NAME}...")
+    return TextEmbedding(_EMBEDDING_MODEL_NAME)
+
+
+@functools.cache
+def _load_sparse_model() -> SparseTextEmbedding:
+    print(f"Loading fastembed sparse model {settings.sparse_model_name}...")
+    return SparseTextEmbedding(settings.sparse_model_name)
+
+
+async def _iter_wiki_pages(portal_client: httpx.AsyncClient, campaign_id: str) -> AsyncIterator[Document]:
+    for page in await fetch_wiki_pages(portal_client, campaign_id):
+        yield page
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Fetch the campaign from Obsidian Portal and ingest it into Qdrant.")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--full",
+        action="store_true",
+        help="Rebuild into a fresh collection version instead of only re-embedding new and changed documents.",
+    )
+    mode.add_argument(
+        "--rollback",
+        action="store_true",
+        help="Point the collection alias back at the previous collection version and exit.",
+    )
+    parser.add_argument(
+        "--campaign",
+        help="Only fetch this campaign ID instead of every configured one; with --rollback defaults to the first.",
+    )
+    args = parser.parse_args()
+    if args.rollback:
+        asyncio.run(rollback(args.campaign))
+    else:
+        asyncio.run(main(full_rebuild=args.full, campaign_id=args.campaign))
@@ -1,51 +1,177 @@
-from uuid import uuid4
+import hashlib
+import json
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import NamedTuple
+from uuid import UUID, uuid5
 
-from fastembed import TextEmbedding
+import numpy as np
+from fastembed import SparseEmbedding, SparseTextEmbedding, TextEmbedding
 from qdrant_client import AsyncQdrantClient
-from qdrant_client.models import PointStruct
+from qdrant_client.models import (
+    BinaryQuantization,
+    BinaryQuantizationConfig,
+    FieldCondition,
+    Filter,
+    MatchAny,
+    MatchValue,
+    PayloadSchemaType,
+    PointStruct,
+    QuantizationSearchParams,
+    Range,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
+    SparseVector,
+    Vector,
+)
 
-from lorekeeper.config import settings
+from lorekeeper.config import VectorQuantization, settings
+from lorekeeper.obsidian_portal.chunking import chunk_text
+from lorekeeper.obsidian_portal.embedding_cache import EmbeddingCache
 from lorekeeper.obsidian_portal.models import Document
 
+# Bump whenever chunk_text or build_document_points changes what gets stored, so every document is re-ingested
+CHUNKING_VERSION = 1
+_POINT_ID_NAMESPACE = UUID("ae481c0e-a7ec-46c2-924f-9a4ce4bf4944")
 
-def chunk_text(text: str, max_chars: int = 800, overlap_chars: int = 150) -> list[str]:
-    """
-    Split text into paragraphs, then group paragraphs until they reach max_chars.
-    Add overlap (in characters) between chunks for better context retention.
+# Payload fields the fetcher and the retrieval tools filter on
+PAYLOAD_INDEXES: dict[str, PayloadSchemaType] = {
+    "metadata.id": PayloadSchemaType.KEYWORD,
+    "metadata.chunk_index": PayloadSchemaType.INTEGER,
+    "metadata.type": PayloadSchemaType.KEYWORD,
+    "metadata.gm_only": PayloadSchemaType.BOOL,
+    "metadata.tags": PayloadSchemaType.KEYWORD,
+    "content_hash": PayloadSchemaType.KEYWORD,
+}
+
+
+class StoredDocument(NamedTuple):
+    """What Qdrant currently holds for a document, used to decide whether it needs re-embedding."""
+
+    updated_at: str
+    content_hash: str
+
+
+def document_hash(doc: Document) -> str:
+    """Hash of the document's content and metadata; changes whenever anything we store for it changes."""
+    raw = json.dumps(
+        {"chunking_version": CHUNKING_VERSION, "content": doc.content, "metadata": doc.metadata},
+        sort_keys=True,
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def is_document_unchanged(doc: Document, stored: StoredDocument | None) -> bool:
+    return stored is not None and stored == StoredDocument(updated_at=doc.updated_at, content_hash=document_hash(doc))
+
+
+@dataclass
+class ChunkedDocument:
+    doc: Document
+    chunks: list[str]
+    content_hash: str
+
+
+def chunk_document(doc: Document) -> ChunkedDocument:
+    print(f"Chunking document ID: {doc.id}, Type: {doc.type}")
+    return ChunkedDocument(doc=doc, chunks=chunk_text(doc.content), content_hash=document_hash(doc))
+
+
+def plan_embedding_batches(docs: list[ChunkedDocument], batch_size: int) -> list[list[ChunkedDocument]]:
     """
-    paragraphs = [p.strip() for p in text.split("\n") if p.strip()]
-    chunks = []
-    current = ""
-    last_chunk = ""
-
-    for p in paragraphs:
-        if len(current) + len(p) + 1 <= max_chars:
-            current = f"{current}\n{p}" if current else p
-        else:
-            if current:
-                chunks.append(current)
-                # Add overlap: take the last overlap_chars from the current chunk
-                last_chunk = current[-overlap_chars:] if overlap_chars > 0 else ""
-            # Start new chunk with overlap
-            current = (last_chunk + "\n" + p).strip() if last_chunk else p
+    Group documents into batches of roughly batch_size chunks each.
 
+    Documents are never split across batches, so a batch can exceed batch_size when a single
+    document is larger than that; the embedding model sub-batches it internally.
+    """
+    batches: list[list[ChunkedDocument]] = []
+    current: list[ChunkedDocument] = []
+    current_chunks = 0
+    for chunked in docs:
+        if current and current_chunks + len(chunked.chunks) > batch_size:
+            batches.append(current)
+            current, current_chunks = [], 0
+        current.append(chunked)
+        current_chunks += len(chunked.chunks)
     if current:
-        chunks.append(current)
+        batches.append(current)
+    return batches
 
-    return chunks
 
+class EmbeddedDocuments(NamedTuple):
+    points: list[list[PointStruct]]  # each document's points, in the order of the documents
+    embed_seconds: float  # time spent in the embedding models, without cache lookups or model loading
+
+
+def embed_documents(
+    docs: list[ChunkedDocument],
+    load_embed_model: Callable[[], TextEmbedding],
+    batch_size: int = settings.embed_batch_size,
+    *,
+    cache: EmbeddingCache | None = None,
+    sparse_model: SparseTextEmbedding | None = None,
+) -> EmbeddedDocuments:
+    """
+    Embed the chunks of all docs in one pass and return each document's points.
+
+    With a cache, chunks embedded before are looked up instead, and only the rest go through the model,
+    which is only loaded if there are any. With a sparse model, points also get a sparse (BM25) vector
+    for hybrid search.
+    """
+    all_chunks = [chunk for chunked in docs for chunk in chunked.chunks]
+    cached: list[np.ndarray | None] = cache.get_many(all_chunks) if cache is not None else [None] * len(all_chunks)
+    missing = [i for i, vector in enumerate(cached) if vector is None]
+    embed_seconds = 0.0
+    if missing:
+        embed_model = load_embed_model()
+        missing_chunks = [all_chunks[i] for i in missing]
+        start = time.monotonic()
+        new_vectors = list(embed_model.embed(missing_chunks, batch_size=batch_size))
+        embed_seconds += time.monotonic() - start
+        if cache is not None:
+            cache.put_many(missing_chunks, new_vectors)
+        for i, vector in zip(missing, new_vectors, strict=True):
+            cached[i] = vector
+    vectors = [vector for vector in cached if vector is not None]
 
-def prepare_document_points(doc: Document, embed_model: TextEmbedding) -> list[PointStruct]:
-    print(f"Ingesting document ID: {doc.id}, Type: {doc.type}")
-    chunks = chunk_text(doc.content)
-    for i, chunk in enumerate(chunks):
-        print(f"Chunk {i + 1}/{len(chunks)} (Length: {len(chunk)} chars)")
+    sparse_vectors = None
+    if sparse_model is not None:
+        start = time.monotonic()
+        sparse_vectors = list(sparse_model.embed(all_chunks, batch_size=batch_size))
+        embed_seconds += time.monotonic() - start
 
-    vectors = list(embed_model.embed(chunks))
+    points: list[list[PointStruct]] = []
+    offset = 0
+    for chunked in docs:
+        end = offset + len(chunked.chunks)
+        points.append(
+            build_document_points(
+                chunked,
+                vectors[offset:end],
+                sparse_vectors[offset:end] if sparse_vectors is not None else None,
+            ),
+        )
+        offset = end
+    return EmbeddedDocuments(points=points, embed_seconds=embed_seconds)
+
+
+def point_id(doc_id: str, chunk_index: int) -> str:
+    """Stable ID of a chunk's point, so re-ingesting a document overwrites its points in place."""
+    return str(uuid5(_POINT_ID_NAMESPACE, f"{CHUNKING_VERSION}:{doc_id}:{chunk_index}"))
+
+
+def build_document_points(
+    chunked: ChunkedDocument,
+    vectors: Sequence[np.ndarray],
+    sparse_vectors: Sequence[SparseEmbedding] | None = None,
+) -> list[PointStruct]:
+    chunks = chunked.chunks
     points = []
-    for i, (chunk, vector) in enumerate(zip(chunks, vectors, strict=False)):
-        point_id = str(uuid4())
-        metadata = doc.metadata.copy()
+    for i, (chunk, vector) in enumerate(zip(chunks, vectors, strict=True)):
+        metadata = chunked.doc.metadata.copy()
         metadata.update({
             "chunk_index": i,
             "total_chunks": len(chunks),
@@ -53,13 +179,111 @@ def prepare_document_points(doc: Document, embed_model: TextEmbedding) -> list[P
         payload = {
             "document": chunk,
             "metadata": metadata,
+            # Kept outside metadata so it is not echoed back to the agent in search results
+            "content_hash": chunked.content_hash,
         }
-        points.append(PointStruct(id=point_id, vector={settings.vector_name: vector.tolist()}, payload=payload))
-        print(f"Prepared Point ID: {point_id} with payload keys: {list(payload.keys())}")
+        vector_by_name: dict[str, Vector] = {settings.vector_name: vector.tolist()}
+        if sparse_vectors is not None:
+            sparse = sparse_vectors[i]
+            vector_by_name[settings.sparse_vector_name] = SparseVector(
+                indices=sparse.indices.tolist(),
+                values=sparse.values.tolist(),
+            )
+        points.append(PointStruct(id=point_id(chunked.doc.id, i), vector=vector_by_name, payload=payload))
     return points
 
 
+def quantization_config(mode: VectorQuantization) -> ScalarQuantization | BinaryQuantization | None:
+    """Quantization for the dense vectors; the quantized copy is kept in RAM even with vectors on disk."""
+    if mode == "scalar":
+        return ScalarQuantization(scalar=ScalarQuantizationConfig(type=ScalarType.INT8, quantile=0.99, always_ram=True))
+    if mode == "binary":
+        return BinaryQuantization(binary=BinaryQuantizationConfig(always_ram=True))
+    return None
+
+
+def quantization_search_params(mode: VectorQuantization, oversampling: float) -> SearchParams | None:
+    """Search over the quantized vectors, then re-score the oversampled candidates with the originals."""
+    if mode == "none":
+        return None
+    return SearchParams(quantization=QuantizationSearchParams(rescore=True, oversampling=oversampling))
+
+
+async def ensure_payload_indexes(client: AsyncQdrantClient, collection_name: str) -> None:
+    """Create any missing PAYLOAD_INDEXES so filters don't scan the whole collection."""
+    existing = (await client.get_collection(collection_name)).payload_schema
+    for field_name, field_schema in PAYLOAD_INDEXES.items():
+        if field_name in existing:
+            continue
+        print(f"Creating {field_schema.value} payload index on '{field_name}' in collection '{collection_name}'")
+        await client.create_payload_index(collection_name, field_name=field_name, field_schema=field_schema, wait=True)
+
+
 async def upsert_points(client: AsyncQdrantClient, collection_name: str, points: list[PointStruct]) -> None:
     print(f"Upserting {len(points)} points into collection '{collection_name}'")
     await client.upsert(collection_name=collection_name, points=points)
     print("Upsert completed.")
+
+
+async def fetch_stored_documents(client: AsyncQdrantClient, collection_name: str) -> dict[str, StoredDocument]:
+    """Return the stored version of every document in the collection, keyed by document ID."""
+    stored: dict[str, StoredDocument] = {}
+    offset = None
+    while True:
+        # Every document has a chunk 0, so one point per document is enough
+        records, offset = await client.scroll(
+            collection_name=collection_name,
+            scroll_filter=Filter(must=[FieldCondition(key="metadata.chunk_index", match=MatchValue(value=0))]),
+            limit=256,
+            offset=offset,
+            with_payload=["metadata.id", "metadata.updated_at", "content_hash"],
+            with_vectors=False,
+        )
+        for record in records:
+            assert record.payload is not None
+            metadata = record.payload.get("metadata", {})
+            stored[metadata["id"]] = StoredDocument(
+                updated_at=metadata.get("updated_at", ""),
+                content_hash=record.payload.get("content_hash", ""),
+            )
+        if offset is None:
+            break
+    print(f"Found {len(stored)} documents already stored in collection '{collection_name}'")
+    return stored
+
+
+async def delete_stale_document_points(
+    client: AsyncQdrantClient,
+    collection_name: str,
+    *,
+    doc_id: str,
+    total_chunks: int,
+    content_hash: str,
+) -> None:
+    """
+    Delete points of a document left over from its previous version.
+
+    Chunks below total_chunks were overwritten in place by the upsert, so only trailing chunks past the
+    new end remain. Points under other IDs (written before IDs were deterministic, or by an older
+    CHUNKING_VERSION) still carry an old content_hash and are deleted too.
+    """
+    await client.delete(
+        collection_name=collection_name,
+        points_selector=Filter(
+            must=[FieldCondition(key="metadata.id", match=MatchValue(value=doc_id))],
+            should=[
+                FieldCondition(key="metadata.chunk_index", range=Range(gte=total_chunks)),
+                Filter(must_not=[FieldCondition(key="content_hash", match=MatchValue(value=content_hash))]),
+            ],
+        ),
+    )
+
+
+async def delete_documents(client: AsyncQdrantClient, collection_name: str, doc_ids: list[str]) -> None:
+    if not doc_ids:
+        return
+    print(f"Deleting {len(doc_ids)} removed documents from collection '{collection_name}'")
+    await client.delete(
+        collection_name=collection_name,
+        points_selector=Filter(must=[FieldCondition(key="metadata.id", match=MatchAny(any=doc_ids))]),
+    )
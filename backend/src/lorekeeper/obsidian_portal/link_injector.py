@@ -1,8 +1,18 @@
 """Pure utility for injecting Obsidian Portal wiki-link syntax into text."""
 
 import re
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
 
 _WIKI_LINK_REGEX = re.compile(r"\[\[[^]]*]]")
+# Target of every [[target | text]] link, including ones starting inside a malformed link
+_LINK_TARGET_REGEX = re.compile(r"(?=\[\[\s*([^|\]]*?)\s*\|[^]]*]])")
+# Characters re.IGNORECASE matches differently from str.lower() (e.g. final sigma matches sigma, "İ"
+# matches "i" but lowercases to two characters), plus capital sigma, which lowercases to final sigma at
+# the end of a word; no cased characters lie beyond U+1FFFF
+_CASE_FOLDS_UNLIKE_LOWER = frozenset(
+    c for c in map(chr, range(0x20000)) if len(c.lower()) != 1 or c.upper().lower() != c.lower()
+) | {"Σ"}
 
 
 def inject_links(body: str, entity_links: dict[str, str]) -> tuple[str, list[str], list[str]]:
@@ -12,6 +22,14 @@ def inject_links(body: str, entity_links: dict[str, str]) -> tuple[str, list[str
     Only the first occurrence of each mention is linked. Entities already linked anywhere
     in the text are skipped entirely. Text inside existing [[...]] is never modified.
 
+    Mentions are resolved in the order of entity_links, as if each were linked in turn: a later
+    mention never matches text linked for an earlier one, and is skipped if an earlier one already
+    linked its target. All mentions are found in a single pass over the text (Aho-Corasick) and the
+    links spliced in with a second one, so the cost no longer grows with mentions x text length.
+    Text where an inserted link could change what counts as linked (an unclosed [[, or brackets and
+    pipes in mentions or targets), or with characters like "ς" that ignore-case regexes match unlike
+    lowercasing, is linked one mention at a time instead, as it used to be.
+
     Args:
         body: The source text to inject links into.
         entity_links: Mapping of exact mention text to bare link target (no [[ or ]]).
@@ -21,32 +39,197 @@ def inject_links(body: str, entity_links: dict[str, str]) -> tuple[str, list[str
         Tuple of (modified_body, applied, skipped) where applied and skipped contain
         the mention strings that were linked or skipped respectively.
     """
+    protected = [(m.start(), m.end()) for m in _WIKI_LINK_REGEX.finditer(body)]
+    if not _single_pass_is_exact(body, entity_links, protected):
+        return _inject_links_one_by_one(body, entity_links)
+
     applied: list[str] = []
     skipped: list[str] = []
 
+    linked_targets = {target.lower() for target in _LINK_TARGET_REGEX.findall(body)}
+    occurrences = _Automaton({mention.lower() for mention in entity_links if mention}).find_all(body.lower())
+    chosen: list[tuple[int, int, str]] = []  # (start, end, link) of the mentions to link, sorted
+
     for mention, raw_target in entity_links.items():
-        target = raw_target.strip().removeprefix("[[").removesuffix("]]")
+        target = _link_target(raw_target)
         link = f"[[{target} | {mention}]]"
 
-        already_linked = bool(
-            re.search(r"\[\[\s*" + re.escape(target) + r"\s*\|[^]]*]]", body, re.IGNORECASE),
-        )
-        if already_linked:
+        if not mention or target.strip().lower() in linked_targets:
+            skipped.append(mention)
+            continue
+
+        span = _first_free_match(body, mention, occurrences[mention.lower()], protected=protected, chosen=chosen)
+        if span is None:
             skipped.append(mention)
             continue
+        insort(chosen, (*span, link))
+        linked_targets.update(target.lower() for target in _LINK_TARGET_REGEX.findall(link))
+        applied.append(mention)
+
+    return _splice(body, chosen), applied, skipped
+
+
+def _link_target(raw_target: str) -> str:
+    return raw_target.strip().removeprefix("[[").removesuffix("]]")
+
+
+def _single_pass_is_exact(body: str, entity_links: dict[str, str], protected: list[tuple[int, int]]) -> bool:
+    """
+    Whether linking all mentions at once gives the same result as linking them one by one.
 
+    An inserted link closes an unclosed [[ before it, protecting the text in between, and brackets or
+    pipes in a link let it combine with the text around it into links the original text didn't have.
+    The single pass also matches by lowercasing, which only agrees with re.IGNORECASE on most characters.
+    """
+    if not _CASE_FOLDS_UNLIKE_LOWER.isdisjoint(body):
+        return False
+    if any(not _starts_inside(protected, m.start()) for m in re.finditer(r"\[\[", body)):
+        return False
+    for mention, raw_target in entity_links.items():
+        target = _link_target(raw_target)
+        if any(c in mention or c in target for c in "[]|") or target != target.strip():
+            return False
+        if not _CASE_FOLDS_UNLIKE_LOWER.isdisjoint(mention + target):
+            return False
+    return True
+
+
+def _inject_links_one_by_one(body: str, entity_links: dict[str, str]) -> tuple[str, list[str], list[str]]:
+    """inject_links with one search of the whole (growing) text per mention, for text it can't do in one pass."""
+    applied: list[str] = []
+    skipped: list[str] = []
+    for mention, raw_target in entity_links.items():
+        target = _link_target(raw_target)
+        link = f"[[{target} | {mention}]]"
+        already_linked = re.search(r"\[\[\s*" + re.escape(target) + r"\s*\|[^]]*]]", body, re.IGNORECASE)
+        if not mention or already_linked:
+            skipped.append(mention)
+            continue
         protected = [(m.start(), m.end()) for m in _WIKI_LINK_REGEX.finditer(body)]
-        prefix = r"\b" if mention[0].isalnum() or mention[0] == "_" else r""
-        suffix = r"\b" if mention[-1].isalnum() or mention[-1] == "_" else r""
+        prefix = r"\b" if _is_word_char(mention[0]) else ""
+        suffix = r"\b" if _is_word_char(mention[-1]) else ""
         mention_re = re.compile(prefix + re.escape(mention) + suffix, re.IGNORECASE)
-        replaced = False
         for match in mention_re.finditer(body):
-            if not any(start <= match.start() < end for start, end in protected):
+            if not _starts_inside(protected, match.start()):
                 body = body[: match.start()] + link + body[match.end() :]
                 applied.append(mention)
-                replaced = True
                 break
-        if not replaced:
+        else:
             skipped.append(mention)
-
     return body, applied, skipped
+
+
+def _is_word_char(c: str) -> bool:
+    # What \b considers a word character
+    return c.isalnum() or c == "_"
+
+
+class _Automaton:
+    """Aho-Corasick automaton finding every occurrence of a set of patterns in one pass over a text."""
+
+    def __init__(self, patterns: set[str]) -> None:
+        self._patterns = patterns
+        # Trie of the patterns; _outputs[state] are the patterns ending at that state
+        self._goto: list[dict[str, int]] = [{}]
+        self._outputs: list[list[str]] = [[]]
+        for pattern in patterns:
+            state = 0
+            for c in pattern:
+                if c not in self._goto[state]:
+                    self._goto[state][c] = len(self._goto)
+                    self._goto.append({})
+                    self._outputs.append([])
+                state = self._goto[state][c]
+            self._outputs[state].append(pattern)
+        self._fail = self._failure_links()
+
+    def _failure_links(self) -> list[int]:
+        # The state of the longest proper suffix that is also a trie path, built breadth-first
+        fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for c, child in self._goto[state].items():
+                queue.append(child)
+                suffix = fail[state]
+                while suffix and c not in self._goto[suffix]:
+                    suffix = fail[suffix]
+                fail[child] = self._goto[suffix].get(c, 0)
+                self._outputs[child] += self._outputs[fail[child]]
+        return fail
+
+    def find_all(self, text: str) -> dict[str, list[int]]:
+        """Start index of every occurrence of every pattern in text, in order."""
+        found: dict[str, list[int]] = {pattern: [] for pattern in self._patterns}
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        state = 0
+        for i, c in enumerate(text):
+            while state and c not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(c, 0)
+            for pattern in outputs[state]:
+                found[pattern].append(i - len(pattern) + 1)
+        return found
+
+
+def _first_free_match(
+    body: str,
+    mention: str,
+    starts: list[int],
+    *,
+    protected: list[tuple[int, int]],
+    chosen: list[tuple[int, int, str]],
+) -> tuple[int, int] | None:
+    """
+    Return the first match of mention that is outside existing links and earlier mentions' links.
+
+    Matches are taken like re.finditer with \\b around word-character ends would on the text with the
+    earlier mentions already linked: leftmost first and non-overlapping. Text replaced by a link is gone
+    from that text, so matches overlapping one are ignored, and a link's brackets are not word characters.
+    """
+    check_start = _is_word_char(mention[0])
+    check_end = _is_word_char(mention[-1])
+    last_end = 0
+    for start in starts:
+        end = start + len(mention)
+        if start < last_end or _overlaps(chosen, start, end):
+            continue
+        if check_start and start > 0 and _is_word_char(body[start - 1]) and not _ends_at(chosen, start):
+            continue
+        if check_end and end < len(body) and _is_word_char(body[end]) and not _starts_at(chosen, end):
+            continue
+        last_end = end
+        if not _starts_inside(protected, start):
+            return start, end
+    return None
+
+
+def _starts_inside(spans: list[tuple[int, int]], position: int) -> bool:
+    i = bisect_right(spans, position, key=lambda span: span[0]) - 1
+    return i >= 0 and position < spans[i][1]
+
+
+def _overlaps(spans: list[tuple[int, int, str]], start: int, end: int) -> bool:
+    i = bisect_left(spans, start, key=lambda span: span[0])
+    return (i > 0 and spans[i - 1][1] > start) or (i < len(spans) and spans[i][0] < end)
+
+
+def _starts_at(spans: list[tuple[int, int, str]], position: int) -> bool:
+    i = bisect_left(spans, position, key=lambda span: span[0])
+    return i < len(spans) and spans[i][0] == position
+
+
+def _ends_at(spans: list[tuple[int, int, str]], position: int) -> bool:
+    i = bisect_left(spans, position, key=lambda span: span[0])
+    return i > 0 and spans[i - 1][1] == position
+
+
+def _splice(body: str, links: list[tuple[int, int, str]]) -> str:
+    parts: list[str] = []
+    position = 0
+    for start, end, link in links:
+        parts.append(body[position:start])
+        parts.append(link)
+        position = end
+    parts.append(body[position:])
+    return "".join(parts)
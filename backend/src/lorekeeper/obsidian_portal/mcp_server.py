@@ -1,7 +1,7 @@
 import asyncio
 
+import httpx
 from fastmcp import FastMCP
-from requests_oauthlib import OAuth1Session
 
 from lorekeeper.config import settings
 from lorekeeper.observability import setup_observability
@@ -9,18 +9,22 @@ from lorekeeper.obsidian_portal.api import (
     create_character,
     create_quest,
     fetch_character,
-    fetch_characters,
+    fetch_character_catalog,
+    fetch_page_summaries,
     fetch_quests,
     fetch_wiki_page,
-    fetch_wiki_pages,
     update_quest,
+    update_quests,
     update_wiki_page,
 )
-from lorekeeper.obsidian_portal.auth import get_authenticated_session_async
-from lorekeeper.obsidian_portal.calendar_api import add_calendar_entry, fetch_calendar_entries
+from lorekeeper.obsidian_portal.auth import get_portal_client
+from lorekeeper.obsidian_portal.calendar_api import add_calendar_entries, add_calendar_entry, fetch_calendar_entries
 from lorekeeper.obsidian_portal.calendar_parser import CalendarDate
+from lorekeeper.obsidian_portal.catalog_cache import CatalogCache
+from lorekeeper.obsidian_portal.character_index import CharacterIndex
 from lorekeeper.obsidian_portal.link_injector import inject_links
 from lorekeeper.obsidian_portal.models import (
+    CalendarEntryRequest,
     Character,
     CharacterCatalog,
     CharacterRequest,
@@ -29,11 +33,9 @@ from lorekeeper.obsidian_portal.models import (
     Quest,
     QuestStatus,
     QuestType,
+    QuestUpdate,
 )
-
-_CAMPAIGN_ID: str = settings.campaign_id
-_QUEST_LOG_PAGE_ID: str = settings.quest_log_page_id
-_CALENDAR_PAGE_ID: str = settings.calendar_page_id
+from lorekeeper.obsidian_portal.page_cache import PageCache
 
 setup_observability("lorekeeper-obsidian-mcp")
 
@@ -48,19 +50,45 @@ mcp = FastMCP(
 )
 
 
-_session: OAuth1Session | None = None
+# One pooled client shared by all tool calls; the lock keeps concurrent first calls from creating several
+_client: httpx.AsyncClient | None = None
+_client_lock = asyncio.Lock()
+
+
+async def _get_client() -> httpx.AsyncClient:
+    global _client  # noqa: PLW0603
+    async with _client_lock:
+        if _client is None:
+            _client = await get_portal_client()
+    return _client
+
+
+async def _load_page_catalog(campaign_id: str) -> list[PageSummary]:
+    return await fetch_page_summaries(await _get_client(), campaign_id)
+
 
+# Page summaries per campaign; tools that write wiki pages invalidate their campaign's entry
+_page_catalog = CatalogCache(_load_page_catalog, ttl_seconds=settings.page_catalog_ttl_seconds)
+
+
+async def _load_character_catalog(campaign_id: str) -> CharacterIndex:
+    return CharacterIndex(await fetch_character_catalog(await _get_client(), campaign_id))
+
+
+# Characters per campaign, indexed for name_filter; create_character_tool adds new characters in place
+_character_catalog = CatalogCache(
+    _load_character_catalog,
+    ttl_seconds=settings.character_catalog_ttl_seconds,
+    refresh_in_background=True,
+)
 
-async def _get_session() -> OAuth1Session:
-    global _session  # noqa: PLW0603
-    if _session is None:
-        _session = await get_authenticated_session_async()
-    return _session
+# Last fetched and parsed quest log and calendar pages, which every quest/calendar tool call reads
+_page_cache = PageCache()
 
 
 @mcp.tool(tags={"WikiPage", "Post"})
 async def fetch_wiki_pages_tool(
-    campaign_id: str = _CAMPAIGN_ID,
+    campaign_id: str | None = None,
     title_filter: str | None = None,
 ) -> list[PageSummary]:
     """
@@ -73,24 +101,23 @@ async def fetch_wiki_pages_tool(
     it returns only matching results and avoids loading the full catalog.
 
     Args:
-        campaign_id (str): The campaign ID — pre-filled, do not supply.
+        campaign_id (str | None): The campaign ID from your instructions; omit for the default campaign.
         title_filter (str | None): If provided, return only pages whose title contains
             this string (case-insensitive). Omit to return all pages.
 
     Returns:
         list[PageSummary]: Matching wiki pages with id, slug, and title.
     """
-    session = await _get_session()
-    pages = await fetch_wiki_pages(session, campaign_id)
-    summaries = [PageSummary.model_validate(p.model_dump(by_alias=False)) for p in pages]
+    campaign = settings.campaign(campaign_id)
+    summaries = await _page_catalog.get(campaign.campaign_id)
     if title_filter:
         needle = title_filter.lower()
-        summaries = [s for s in summaries if needle in s.title.lower()]
-    return summaries
+        return [s for s in summaries if needle in s.title.lower()]
+    return list(summaries)
 
 
 @mcp.tool(tags={"WikiPage", "Post"})
-async def fetch_wiki_page_tool(page_id: str, campaign_id: str = _CAMPAIGN_ID) -> Page:
+async def fetch_wiki_page_tool(page_id: str, campaign_id: str | None = None) -> Page:
     """
     Fetch a specific wiki page from Obsidian Portal for the specified campaign ID by page ID.
 
@@ -100,20 +127,21 @@ async def fetch_wiki_page_tool(page_id: str, campaign_id: str = _CAMPAIGN_ID) ->
 
     Args:
         page_id (str): The ID of the wiki page to fetch.
-        campaign_id (str): The campaign ID — pre-filled, do not supply.
+        campaign_id (str | None): The campaign ID from your instructions; omit for the default campaign.
 
     Returns:
         Page: The wiki page.
     """
-    session = await _get_session()
-    return await fetch_wiki_page(session, campaign_id, page_id)
+    campaign = settings.campaign(campaign_id)
+    client = await _get_client()
+    return await fetch_wiki_page(client, campaign.campaign_id, page_id)
 
 
 @mcp.tool(tags={"WikiPage", "AdventureLog"})
 async def inject_adventure_log_links_tool(
     page_id: str,
     entity_links: dict[str, str],
-    campaign_id: str = _CAMPAIGN_ID,
+    campaign_id: str | None = None,
 ) -> str:
     """
     Inject wiki-link syntax into an adventure log entry for the first appearance of each entity.
@@ -143,20 +171,22 @@ async def inject_adventure_log_links_tool(
             {"Allandra": ":allandra-grey",
              "the inn": "The Rusty Flagon",
              "Steel Dragon": "Steel Dragon inn, the"}
-        campaign_id (str): The campaign ID — pre-filled, do not supply.
+        campaign_id (str | None): The campaign ID from your instructions; omit for the default campaign.
 
     Returns:
         str: Summary of links applied and any skipped entities.
     """
-    session = await _get_session()
-    page = await fetch_wiki_page(session, campaign_id, page_id)
+    campaign = settings.campaign(campaign_id)
+    client = await _get_client()
+    page = await fetch_wiki_page(client, campaign.campaign_id, page_id)
 
     new_body, applied, skipped = inject_links(page.body, entity_links)
 
     if not applied:
         return "No links were applied. Entities may already be linked or not found in text."
 
-    await update_wiki_page(session, campaign_id, page_id, body=new_body)
+    await update_wiki_page(client, campaign.campaign_id, page_id, body=new_body)
+    _page_catalog.invalidate(campaign.campaign_id)
 
     result = f"Applied {len(applied)} link(s):\n" + "\n".join(
         f'"{m}" → [[{entity_links[m].strip().removeprefix("[[").removesuffix("]]")} | {m}]]' for m in applied
@@ -168,7 +198,7 @@ async def inject_adventure_log_links_tool(
 
 @mcp.tool(tags={"Character"})
 async def fetch_characters_tool(
-    campaign_id: str = _CAMPAIGN_ID,
+    campaign_id: str | None = None,
     name_filter: str | None = None,
 ) -> list[CharacterCatalog]:
     """
@@ -182,24 +212,20 @@ async def fetch_characters_tool(
     it returns only matching results and avoids loading the full catalog.
 
     Args:
-        campaign_id (str): The campaign ID — pre-filled, do not supply.
-        name_filter (str | None): If provided, return only characters whose name contains
+        campaign_id (str | None): The campaign ID from your instructions; omit for the default campaign.
+        name_filter (str | None): If provided, return only characters whose name or slug contains
             this string (case-insensitive). Omit to return all characters.
 
     Returns:
         list[CharacterCatalog]: Matching characters with id, slug, name, is_player_character.
     """
-    session = await _get_session()
-    characters = await fetch_characters(session, campaign_id)
-    catalog = [CharacterCatalog.model_validate(c.model_dump()) for c in characters]
-    if name_filter:
-        needle = name_filter.lower()
-        catalog = [c for c in catalog if needle in c.name.lower()]
-    return catalog
+    campaign = settings.campaign(campaign_id)
+    index = await _character_catalog.get(campaign.campaign_id)
+    return index.search(name_filter) if name_filter else index.characters
 
 
 @mcp.tool(tags={"Character"})
-async def fetch_character_tool(character_id: str, campaign_id: str = _CAMPAIGN_ID) -> Character:
+async def fetch_character_tool(character_id: str, campaign_id: str | None = None) -> Character:
     """
     Fetch a specific character from Obsidian Portal for the specified campaign ID by character ID.
 
@@ -207,13 +233,14 @@ async def fetch_character_tool(character_id: str, campaign_id: str = _CAMPAIGN_I
 
     Args:
         character_id (str): The ID of the character to fetch.
-        campaign_id (str): The campaign ID — pre-filled, do not supply.
+        campaign_id (str | None): The campaign ID from your instructions; omit for the default campaign.
 
     Returns:
         Character: The character.
     """
-    session = await _get_session()
-    return await fetch_character(session, campaign_id, character_id)
+    campaign = settings.campaign(campaign_id)
+    client = await _get_client()
+    return await fetch_character(client, campaign.campaign_id, character_id)
 
 
 @mcp.tool(tags={"Character"})
@@ -223,7 +250,7 @@ async def create_character_tool(  # noqa: PLR0913, PLR0917
     bio: str | None = None,
     tagline: str | None = None,
     tags: set[str] | None = None,
-    campaign_id: str = _CAMPAIGN_ID,
+    campaign_id: str | None = None,
 ) -> Character:
     """
     Create a new character in Obsidian Portal for the specified campaign ID.
@@ -249,14 +276,15 @@ async def create_character_tool(  # noqa: PLR0913, PLR0917
             [[:slug | Display Name]] for characters, [[Page Title | Display Name]] for pages.
         tagline (str): A SHORT one sentence description of the character, suitable for use as a tagline or quick reference.
         tags (set[str]): A list of tags to associate with the character. For dead characters MAKE SURE to include the "Dead" tag.
-        campaign_id (str): The campaign ID — pre-filled, do not supply.
+        campaign_id (str | None): The campaign ID from your instructions; omit for the default campaign.
 
     Returns:
         None
     """  # noqa: E501
     tags: set[str] = tags or set()
     tags.add("AI Generated")
-    session = await _get_session()
+    campaign = settings.campaign(campaign_id)
+    client = await _get_client()
     character_request = CharacterRequest(
         name=name,
         description=description,
@@ -264,11 +292,21 @@ async def create_character_tool(  # noqa: PLR0913, PLR0917
         tagline=tagline,
         tags=list(tags),
     )
-    return await create_character(session, campaign_id, character_request)
+    try:
+        character = await create_character(client, campaign.campaign_id, character_request)
+    except Exception:
+        # The Portal sometimes creates the character and still fails the request, so reload the catalog
+        _character_catalog.invalidate(campaign.campaign_id)
+        raise
+    _character_catalog.update(
+        campaign.campaign_id,
+        lambda index: index.add(CharacterCatalog.model_validate(character.model_dump())),
+    )
+    return character
 
 
 @mcp.tool(tags={"WikiPage", "Quest"})
-async def fetch_quests_tool(campaign_id: str = _CAMPAIGN_ID, page_id: str = _QUEST_LOG_PAGE_ID) -> list[Quest]:
+async def fetch_quests_tool(campaign_id: str | None = None, page_id: str | None = None) -> list[Quest]:
     """
     Fetch all quests from the Quest Log wiki page, parsed into structured objects.
 
@@ -277,15 +315,21 @@ async def fetch_quests_tool(campaign_id: str = _CAMPAIGN_ID, page_id: str = _QUE
     The Personal Quests section is excluded from results.
 
     Args:
-        campaign_id (str): The campaign ID — pre-filled, do not supply.
-        page_id (str): The Quest Log wiki page ID — pre-filled, do not supply.
+        campaign_id (str | None): The campaign ID from your instructions; omit for the default campaign.
+        page_id (str | None): The Quest Log wiki page ID — defaults to the campaign's, do not supply.
 
     Returns:
         list[Quest]: All quests with their title, content, status (open/completed/failed),
             phase (e.g. "Phase 2", "Phase 1"), and quest_type ("Main Quest", "Side Quest", or None).
     """
-    session = await _get_session()
-    return await fetch_quests(session, campaign_id, page_id)
+    campaign = settings.campaign(campaign_id)
+    client = await _get_client()
+    return await fetch_quests(
+        client,
+        campaign.campaign_id,
+        page_id or campaign.quest_log_page_id,
+        page_cache=_page_cache,
+    )
 
 
 @mcp.tool(tags={"WikiPage", "Quest"})
@@ -295,8 +339,8 @@ async def create_quest_tool(  # noqa: PLR0913, PLR0917
     phase: str,
     quest_type: QuestType | None,
     status: QuestStatus = "open",
-    campaign_id: str = _CAMPAIGN_ID,
-    page_id: str = _QUEST_LOG_PAGE_ID,
+    campaign_id: str | None = None,
+    page_id: str | None = None,
 ) -> str:
     """
     Add a new quest to the Quest Log wiki page.
@@ -319,19 +363,22 @@ async def create_quest_tool(  # noqa: PLR0913, PLR0917
             that have no subsection headers (e.g. "Future Phases").
         status (str): "open", "completed", or "failed". Determines active vs completed section.
             Defaults to "open".
-        campaign_id (str): The campaign ID — pre-filled, do not supply.
-        page_id (str): The Quest Log wiki page ID — pre-filled, do not supply.
+        campaign_id (str | None): The campaign ID from your instructions; omit for the default campaign.
+        page_id (str | None): The Quest Log wiki page ID — defaults to the campaign's, do not supply.
 
     Returns:
         str: Confirmation message with the quest's location and status.
     """
-    session = await _get_session()
+    campaign = settings.campaign(campaign_id)
+    client = await _get_client()
     await create_quest(
-        session,
-        campaign_id,
-        page_id,
+        client,
+        campaign.campaign_id,
+        page_id or campaign.quest_log_page_id,
         quest=Quest(title=title, content=content, status=status, phase=phase, quest_type=quest_type),
+        page_cache=_page_cache,
     )
+    _page_catalog.invalidate(campaign.campaign_id)
     return f"Quest '{title}' created in {phase} / {quest_type or 'no sub-section'} ({status})."
 
 
@@ -343,8 +390,8 @@ async def update_quest_tool(  # noqa: PLR0913, PLR0917
     new_status: QuestStatus | None = None,
     new_phase: str | None = None,
     new_quest_type: QuestType | None = None,
-    campaign_id: str = _CAMPAIGN_ID,
-    page_id: str = _QUEST_LOG_PAGE_ID,
+    campaign_id: str | None = None,
+    page_id: str | None = None,
 ) -> str:
     """
     Update an existing quest on the Quest Log wiki page, identified by its current title.
@@ -369,27 +416,88 @@ async def update_quest_tool(  # noqa: PLR0913, PLR0917
         new_status (str | None): Change status to "open", "completed", or "failed".
         new_phase (str | None): Move the quest to a different phase section.
         new_quest_type (str | None): Move the quest to "Main Quest" or "Side Quest" subsection.
-        campaign_id (str): The campaign ID — pre-filled, do not supply.
-        page_id (str): The Quest Log wiki page ID — pre-filled, do not supply.
+        campaign_id (str | None): The campaign ID from your instructions; omit for the default campaign.
+        page_id (str | None): The Quest Log wiki page ID — defaults to the campaign's, do not supply.
 
     Returns:
         str: Human-readable summary of the changes applied.
     """
-    session = await _get_session()
+    campaign = settings.campaign(campaign_id)
+    client = await _get_client()
     summary = await update_quest(
-        session,
-        campaign_id,
-        page_id,
+        client,
+        campaign.campaign_id,
+        page_id or campaign.quest_log_page_id,
         title=title,
         new_title=new_title,
         new_content=new_content,
         new_status=new_status,
         new_phase=new_phase,
         new_quest_type=new_quest_type,
+        page_cache=_page_cache,
     )
+    _page_catalog.invalidate(campaign.campaign_id)
     return f"Quest '{title}' updated: {summary}"
 
 
+@mcp.tool(tags={"WikiPage", "Quest"})
+async def update_quests_tool(  # noqa: PLR0917
+    creates: list[Quest] | None = None,
+    updates: list[QuestUpdate] | None = None,
+    campaign_id: str | None = None,
+    page_id: str | None = None,
+) -> str:
+    """
+    Create and update several quests on the Quest Log wiki page in one go.
+
+    Use this instead of repeated `create_quest_tool` / `update_quest_tool` calls when applying more than
+    one quest change: the Quest Log is fetched and saved once. The changes are all-or-nothing: if any
+    create or update is invalid (duplicate title, unknown quest, ...), nothing is saved and the error
+    lists every failing change, so fix them and call the tool again with the whole batch.
+
+    Creates are applied first, then updates, each in the order given. Every create and update follows
+    the same rules as `create_quest_tool` and `update_quest_tool`.
+
+    IMPORTANT: Before calling this tool you MUST first use `fetch_quests_tool` to check existing quests
+    and their exact titles, then show the user ALL planned creates and updates together and ask for
+    explicit confirmation.
+
+    IMPORTANT: Keep quest content concise and avoid repeating information.
+
+    Args:
+        creates (list[Quest] | None): New quests, each with title, content, status ("open", "completed",
+            or "failed"), phase, and quest_type ("Main Quest", "Side Quest", or None).
+        updates (list[QuestUpdate] | None): Changes to existing quests, each with the quest's current
+            exact title and only the new_* fields to change.
+        campaign_id (str | None): The campaign ID from your instructions; omit for the default campaign.
+        page_id (str | None): The Quest Log wiki page ID — defaults to the campaign's, do not supply.
+
+    Returns:
+        str: One line per created or updated quest.
+    """
+    creates = creates or []
+    updates = updates or []
+    campaign = settings.campaign(campaign_id)
+    client = await _get_client()
+    summaries = await update_quests(
+        client,
+        campaign.campaign_id,
+        page_id or campaign.quest_log_page_id,
+        inserts=creates,
+        updates=updates,
+        page_cache=_page_cache,
+    )
+    _page_catalog.invalidate(campaign.campaign_id)
+    lines = [
+        f"Quest '{quest.title}' created in {quest.phase} / {quest.quest_type or 'no sub-section'} ({quest.status})."
+        for quest in creates
+    ]
+    lines.extend(
+        f"Quest '{update.title}' updated: {summary}" for update, summary in zip(updates, summaries, strict=True)
+    )
+    return "\n".join(lines) or "No quest changes were requested."
+
+
 @mcp.tool(tags={"WikiPage", "Calendar"})
 async def fetch_calendar_entries_tool(  # noqa: PLR0913, PLR0917
     start_year: int,
@@ -398,8 +506,8 @@ async def fetch_calendar_entries_tool(  # noqa: PLR0913, PLR0917
     end_year: int | None = None,
     end_month_or_special_day: str | None = None,
     end_day: int | None = None,
-    campaign_id: str = _CAMPAIGN_ID,
-    page_id: str = _CALENDAR_PAGE_ID,
+    campaign_id: str | None = None,
+    page_id: str | None = None,
 ) -> list[tuple[CalendarDate, list[str]]]:
     """
     Fetch adventure log summaries recorded on the campaign calendar.
@@ -429,18 +537,26 @@ async def fetch_calendar_entries_tool(  # noqa: PLR0913, PLR0917
         end_year (int | None): Year of the end date; omit for a single-date query.
         end_month_or_special_day (str | None): Month or special day for the end date; omit for single-date.
         end_day (int | None): Day number for end date if it is a regular month; omit for special days.
-        campaign_id (str): The campaign ID - pre-filled, do not supply.
-        page_id (str): The Calendar wiki page ID - pre-filled, do not supply.
+        campaign_id (str | None): The campaign ID from your instructions; omit for the default campaign.
+        page_id (str | None): The Calendar wiki page ID - defaults to the campaign's, do not supply.
 
     Returns:
         list of (CalendarDate, [summary_titles]) for every date in the range that has entries.
     """
-    session = await _get_session()
+    campaign = settings.campaign(campaign_id)
+    client = await _get_client()
     start = CalendarDate(year=start_year, month_or_special_day=start_month_or_special_day, day=start_day)
     end: CalendarDate | None = None
     if end_year is not None and end_month_or_special_day is not None:
         end = CalendarDate(year=end_year, month_or_special_day=end_month_or_special_day, day=end_day)
-    return await fetch_calendar_entries(session, start, end, campaign_id=campaign_id, page_id=page_id)
+    return await fetch_calendar_entries(
+        client,
+        start,
+        end,
+        campaign_id=campaign.campaign_id,
+        page_id=page_id or campaign.calendar_page_id,
+        page_cache=_page_cache,
+    )
 
 
 @mcp.tool(tags={"WikiPage", "Calendar"})
@@ -449,8 +565,8 @@ async def add_calendar_entry_tool(  # noqa: PLR0913, PLR0917
     summary_title: str,
     day: int | None = None,
     year: int | None = None,
-    campaign_id: str = _CAMPAIGN_ID,
-    page_id: str = _CALENDAR_PAGE_ID,
+    campaign_id: str | None = None,
+    page_id: str | None = None,
 ) -> str:
     """
     Add an adventure log summary link to a specific date on the campaign calendar.
@@ -494,26 +610,83 @@ async def add_calendar_entry_tool(  # noqa: PLR0913, PLR0917
         day (int | None): Day number (1-30) for a regular month; omit for special days.
         year (int | None): Year to add the entry to. If omitted, uses the most recent year
             present in the calendar - only supply when adding to a past year.
-        campaign_id (str): The campaign ID - pre-filled, do not supply.
-        page_id (str): The Calendar wiki page ID - pre-filled, do not supply.
+        campaign_id (str | None): The campaign ID from your instructions; omit for the default campaign.
+        page_id (str | None): The Calendar wiki page ID - defaults to the campaign's, do not supply.
 
     Returns:
         str: Confirmation message with the date the entry was added to.
     """
-    session = await _get_session()
+    campaign = settings.campaign(campaign_id)
+    client = await _get_client()
     resolved_year = await add_calendar_entry(
-        session,
+        client,
         month_or_special_day=month_or_special_day,
         day=day,
         title=summary_title,
         year=year,
-        campaign_id=campaign_id,
-        page_id=page_id,
+        campaign_id=campaign.campaign_id,
+        page_id=page_id or campaign.calendar_page_id,
+        page_cache=_page_cache,
     )
+    _page_catalog.invalidate(campaign.campaign_id)
     day_str = f" {day}" if day is not None else ""
     return f"Added '[[{summary_title} | {summary_title}]]' to {month_or_special_day}{day_str}, {resolved_year}."
 
 
+@mcp.tool(tags={"WikiPage", "Calendar"})
+async def add_calendar_entries_tool(
+    entries: list[CalendarEntryRequest],
+    campaign_id: str | None = None,
+    page_id: str | None = None,
+) -> str:
+    """
+    Add several adventure log summary links to the campaign calendar at once.
+
+    Use this instead of repeated `add_calendar_entry_tool` calls when back-filling more than one
+    summary: the calendar is fetched and saved once for the whole batch. Each entry follows the same
+    rules as `add_calendar_entry_tool` (day 1-30 for a regular month, no day for a special day, year
+    omitted for the most recent year in the calendar, always the first in-game day of the summary).
+
+    IMPORTANT: NEVER ask the user for the in-game dates. Determine each date from the summary's wiki
+    page exactly as described for `add_calendar_entry_tool`, then show the user ONE confirmation list
+    with a line "Add <title> to <month_or_special_day> <day>, <year>" per entry, and only call this
+    tool after an explicit "yes" for the whole list.
+
+    Args:
+        entries (list[CalendarEntryRequest]): The entries to add, each with month_or_special_day,
+            summary_title, and optionally day and year.
+        campaign_id (str | None): The campaign ID from your instructions; omit for the default campaign.
+        page_id (str | None): The Calendar wiki page ID - defaults to the campaign's, do not supply.
+
+    Returns:
+        str: One line per entry, saying the date it was added to or why it could not be added.
+    """
+    campaign = settings.campaign(campaign_id)
+    client = await _get_client()
+    results = await add_calendar_entries(
+        client,
+        entries,
+        campaign_id=campaign.campaign_id,
+        page_id=page_id or campaign.calendar_page_id,
+        page_cache=_page_cache,
+    )
+    _page_catalog.invalidate(campaign.campaign_id)
+    lines: list[str] = []
+    for result in results:
+        day_str = f" {result.day}" if result.day is not None else ""
+        if result.error is None:
+            lines.append(
+                f"Added '[[{result.summary_title} | {result.summary_title}]]' to "
+                f"{result.month_or_special_day}{day_str}, {result.year}.",
+            )
+        else:
+            lines.append(
+                f"Could not add '{result.summary_title}' to {result.month_or_special_day}{day_str}: {result.error}",
+            )
+    added = sum(result.error is None for result in results)
+    return f"Added {added} of {len(results)} entries:\n" + "\n".join(lines)
+
+
 @mcp.tool()
 def ping(message: str = "pong") -> str:
     """Simple connectivity check for the Obsidian Portal MCP."""
@@ -100,6 +100,25 @@ class CharacterRequest(BaseModel):
     tags: list[str] = Field(default_factory=list)
 
 
+class CalendarEntryRequest(BaseModel):
+    """One summary link to add to the calendar; see add_calendar_entries_tool."""
+
+    month_or_special_day: str
+    summary_title: str
+    day: int | None = None
+    year: int | None = None
+
+
+class CalendarEntryResult(BaseModel):
+    """What became of one CalendarEntryRequest; year is resolved, error is None if the entry was added."""
+
+    month_or_special_day: str
+    summary_title: str
+    day: int | None = None
+    year: int | None = None
+    error: str | None = None
+
+
 QuestStatus = Literal["open", "completed", "failed"]
 QuestType = Literal["Main Quest", "Side Quest"]
 
@@ -110,3 +129,14 @@ class Quest(BaseModel):
     status: QuestStatus
     phase: str
     quest_type: QuestType | None = None
+
+
+class QuestUpdate(BaseModel):
+    """Changes to the quest currently titled title; fields left as None are kept."""
+
+    title: str
+    new_title: str | None = None
+    new_content: str | None = None
+    new_status: QuestStatus | None = None
+    new_phase: str | None = None
+    new_quest_type: QuestType | None = None
@@ -0,0 +1,107 @@
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import cast
+
+import httpx
+
+from lorekeeper.obsidian_portal.models import Page
+
+
+@dataclass
+class _CachedPage:
+    page: Page
+    etag: str | None
+    last_modified: str | None
+
+
+@dataclass
+class _ParsedPage:
+    updated_at: str | None  # None until the version we wrote ourselves has been fetched back
+    body: str
+    parsed: object
+
+
+class PageCache:
+    """
+    The last fetched version of wiki pages, by URL, with their validators (ETag and Last-Modified).
+
+    Pass one to fetch_wiki_page for pages that are fetched over and over, like the quest log and the
+    calendar, to send conditional requests: a 304 Not Modified reuses the cached page without
+    transferring or validating its body again. If the Portal ignores the validators and sends the page
+    anyway, the cached Page is still reused as long as its updated_at hasn't changed.
+
+    It also keeps the parsed form of those pages (see api.fetch_parsed_page and api.edit_parsed_page),
+    by page ID and parser, so a page is only parsed again when it changed on the Portal.
+
+    Entries are never evicted, so only use it for a handful of pages.
+    """
+
+    def __init__(self) -> None:
+        self._pages: dict[str, _CachedPage] = {}
+        self._parsed: dict[tuple[str, Callable[[str], object]], _ParsedPage] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    def request_headers(self, url: str) -> dict[str, str]:
+        cached = self._pages.get(url)
+        headers: dict[str, str] = {}
+        if cached is not None and cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached is not None and cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+        return headers
+
+    def resolve(self, url: str, response: httpx.Response) -> Page:
+        """Return the page a response to a (conditional) request for url stands for, and remember it."""
+        cached = self._pages.get(url)
+        if cached is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+            return cached.page
+        raw = response.json()
+        if cached is not None and raw.get("updated_at") == cached.page.updated_at:
+            page = cached.page
+        else:
+            page = Page.model_validate(raw)
+        self._pages[url] = _CachedPage(
+            page=page,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        return page
+
+    def invalidate(self, url: str) -> None:
+        """Forget url, e.g. after writing to it, so the next fetch downloads it in full."""
+        self._pages.pop(url, None)
+
+    def parsed[P](self, page: Page, parse: Callable[[str], P]) -> P:
+        """
+        Return parse(page.body), reusing the result of an earlier call for the same version of the page.
+
+        The result is shared by every caller; change it only through api.edit_parsed_page.
+        """
+        key = (page.id, parse)
+        cached = self._parsed.get(key)
+        if cached is not None and cached.updated_at == page.updated_at:
+            return cast("P", cached.parsed)
+        # After our own write we only know the body we sent, not the updated_at the Portal gave it
+        if cached is not None and cached.updated_at is None and cached.body == page.body:
+            cached.updated_at = page.updated_at
+            return cast("P", cached.parsed)
+        parsed = parse(page.body)
+        self._parsed[key] = _ParsedPage(updated_at=page.updated_at, body=page.body, parsed=parsed)
+        return parsed
+
+    def store_written[P](self, page_id: str, parse: Callable[[str], P], parsed: P, *, body: str) -> None:
+        """Remember parsed as the parsed form of body, which was just saved to the page."""
+        self._parsed[page_id, parse] = _ParsedPage(updated_at=None, body=body, parsed=parsed)
+
+    def discard_parsed(self, page_id: str, parse: Callable[[str], object]) -> None:
+        """Forget the parsed page, e.g. after a change to it could not be saved."""
+        self._parsed.pop((page_id, parse), None)
+
+    def lock(self, page_id: str) -> asyncio.Lock:
+        """
+        Lock held while a page is edited, so concurrent edits of the shared parsed page don't interleave.
+
+        Reads of the parsed page take it too, so they never see changes that are not saved yet.
+        """
+        return self._locks.setdefault(page_id, asyncio.Lock())
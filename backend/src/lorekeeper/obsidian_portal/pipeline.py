@@ -0,0 +1,153 @@
+"""
+Streaming fetch -> embed -> upsert pipeline used by the fetcher.
+
+Documents flow through bounded asyncio queues, so Portal fetches, chunking and embedding (in
+worker threads) and Qdrant upserts run concurrently instead of one stage after another. The queue
+bounds provide backpressure: when a stage falls behind, the stages feeding it wait instead of
+buffering the whole campaign in memory.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Callable, Sequence
+from dataclasses import dataclass, field
+
+from fastembed import SparseTextEmbedding, TextEmbedding
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import PointStruct
+
+from lorekeeper.obsidian_portal.embedding_cache import EmbeddingCache
+from lorekeeper.obsidian_portal.ingest import (
+    ChunkedDocument,
+    StoredDocument,
+    chunk_document,
+    delete_stale_document_points,
+    embed_documents,
+    is_document_unchanged,
+    upsert_points,
+)
+from lorekeeper.obsidian_portal.models import Document
+
+# Embedded batches waiting for upsert; the embedder blocks once this many are queued
+_UPSERT_QUEUE_BATCHES = 2
+
+type _EmbeddedBatch = tuple[list[ChunkedDocument], list[PointStruct]]
+
+
+@dataclass
+class IngestStats:
+    seen_ids: set[str] = field(default_factory=set)  # every document produced by the sources
+    ingested: int = 0  # documents that were new or changed and got re-embedded (empty new ones are skipped)
+    chunks: int = 0
+    embed_seconds: float = 0.0
+
+
+class IngestPipeline:
+    """One ingest run into a single collection; call run() once with the document sources."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        qdrant_client: AsyncQdrantClient,
+        *,
+        collection_name: str,
+        stored: dict[str, StoredDocument],
+        load_embed_model: Callable[[], TextEmbedding],
+        batch_size: int,
+        embedding_cache: EmbeddingCache | None = None,
+        load_sparse_model: Callable[[], SparseTextEmbedding] | None = None,
+    ) -> None:
+        self._qdrant_client = qdrant_client
+        self._collection_name = collection_name
+        self._stored = stored
+        self._load_embed_model = load_embed_model
+        self._batch_size = batch_size
+        self._embedding_cache = embedding_cache
+        self._load_sparse_model = load_sparse_model
+        # Sized in documents; only documents with chunks are queued (see _produce), so it holds a full batch
+        self._doc_queue: asyncio.Queue[ChunkedDocument | None] = asyncio.Queue(maxsize=batch_size)
+        self._upsert_queue: asyncio.Queue[_EmbeddedBatch | None] = asyncio.Queue(maxsize=_UPSERT_QUEUE_BATCHES)
+        self.stats = IngestStats()
+
+    async def run(self, sources: Sequence[AsyncIterator[Document]]) -> IngestStats:
+        """
+        Drain all sources concurrently and ingest every new or changed document.
+
+        If a source or stage fails, the other stages are cancelled (rather than left waiting on the
+        queues) and the error is raised in an ExceptionGroup.
+        """
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(self._produce_all(sources))
+            tg.create_task(self._embed())
+            tg.create_task(self._upsert())
+        return self.stats
+
+    async def _produce_all(self, sources: Sequence[AsyncIterator[Document]]) -> None:
+        async with asyncio.TaskGroup() as tg:
+            for source in sources:
+                tg.create_task(self._produce(source))
+        await self._doc_queue.put(None)
+
+    async def _produce(self, source: AsyncIterator[Document]) -> None:
+        async for doc in source:
+            self.stats.seen_ids.add(doc.id)
+            if not is_document_unchanged(doc, self._stored.get(doc.id)):
+                # Chunking is CPU-bound; on the event loop it would stall the fetches and upserts
+                chunked = await asyncio.to_thread(chunk_document, doc)
+                # A document with no content has no chunks and so never gets a stored entry; queueing it
+                # would re-ingest it on every run. It only goes through when its old points must be deleted.
+                if chunked.chunks or doc.id in self._stored:
+                    await self._doc_queue.put(chunked)
+
+    async def _next_batch(self) -> tuple[list[ChunkedDocument], bool]:
+        """Collect documents until the batch holds batch_size chunks; the flag is True once sources are drained."""
+        batch: list[ChunkedDocument] = []
+        batch_chunks = 0
+        while batch_chunks < self._batch_size:
+            chunked = await self._doc_queue.get()
+            if chunked is None:
+                return batch, True
+            batch.append(chunked)
+            batch_chunks += len(chunked.chunks)
+        return batch, False
+
+    async def _embed(self) -> None:
+        sparse_model: SparseTextEmbedding | None = None
+        drained = False
+        while not drained:
+            batch, drained = await self._next_batch()
+            if not batch:
+                continue
+            # Models are loaded lazily so runs where nothing changed never pay for them; embed_documents
+            # only loads the dense one if some chunks miss the embedding cache
+            if sparse_model is None and self._load_sparse_model is not None:
+                sparse_model = await asyncio.to_thread(self._load_sparse_model)
+            embedded = await asyncio.to_thread(
+                embed_documents,
+                batch,
+                self._load_embed_model,
+                self._batch_size,
+                cache=self._embedding_cache,
+                sparse_model=sparse_model,
+            )
+            self.stats.embed_seconds += embedded.embed_seconds
+            points = [point for doc_points in embedded.points for point in doc_points]
+            print(f"Embedded {len(points)} chunks from {len(batch)} documents")
+            await self._upsert_queue.put((batch, points))
+        await self._upsert_queue.put(None)
+
+    async def _upsert(self) -> None:
+        while (item := await self._upsert_queue.get()) is not None:
+            batch, points = item
+            if points:
+                await upsert_points(self._qdrant_client, collection_name=self._collection_name, points=points)
+            for chunked in batch:
+                if chunked.doc.id in self._stored:
+                    # New points are written first so the document never disappears from search mid-update
+                    await delete_stale_document_points(
+                        self._qdrant_client,
+                        self._collection_name,
+                        doc_id=chunked.doc.id,
+                        total_chunks=len(chunked.chunks),
+                        content_hash=chunked.content_hash,
+                    )
+            self.stats.ingested += len(batch)
+            self.stats.chunks += len(points)
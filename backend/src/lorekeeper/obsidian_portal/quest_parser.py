@@ -12,10 +12,11 @@ Round-trip invariant: render_body(parse_body(raw)) == raw
 
 from __future__ import annotations
 
+import copy
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 
-from lorekeeper.obsidian_portal.models import Quest, QuestStatus, QuestType
+from lorekeeper.obsidian_portal.models import Quest, QuestStatus, QuestType, QuestUpdate
 
 # ── Sentinels ──────────────────────────────────────────────────────────────────
 _HIDDEN_SENTINEL = "\x00HIDDEN\x00"
@@ -422,3 +423,37 @@ def update_quest_data(  # noqa: PLR0913, C901
         old_sub.dirty = True
 
     return "; ".join(changes)
+
+
+def apply_quest_changes(
+    parsed: ParsedBody,
+    *,
+    inserts: list[Quest],
+    updates: list[QuestUpdate],
+) -> list[str]:
+    """
+    Insert and update several quests as one change: all of them are applied, or none.
+
+    Inserts are applied first, then updates, each in order, so an update sees the quests inserted or
+    renamed before it. Returns the change summary of each update.
+
+    Raises ValueError listing every insert and update that failed; parsed is then left as it was.
+    """
+    snapshot = copy.deepcopy(parsed)
+    errors: list[str] = []
+    for quest in inserts:
+        try:
+            insert_quest(parsed, quest)
+        except ValueError as e:
+            errors.append(f"Cannot create quest '{quest.title}': {e}")
+    summaries: list[str] = []
+    for update in updates:
+        try:
+            summaries.append(update_quest_data(parsed, **update.model_dump()))
+        except ValueError as e:
+            errors.append(f"Cannot update quest '{update.title}': {e}")
+    if errors:
+        for f in fields(parsed):
+            setattr(parsed, f.name, getattr(snapshot, f.name))
+        raise ValueError("No quest changes were applied.\n" + "\n".join(errors))
+    return summaries
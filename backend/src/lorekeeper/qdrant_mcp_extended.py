@@ -2,20 +2,57 @@
 
 import asyncio
 import json
-from typing import Annotated
-
-from fastmcp import Context
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from typing import Annotated, Any
+
+from fastembed import SparseTextEmbedding
+from fastmcp import Context, FastMCP
+from mcp_server_qdrant.common.filters import make_indexes
+from mcp_server_qdrant.common.func_tools import make_partial_function
+from mcp_server_qdrant.common.wrap_filters import wrap_filters
+from mcp_server_qdrant.embeddings.base import EmbeddingProvider
+from mcp_server_qdrant.embeddings.fastembed import FastEmbedProvider
 from mcp_server_qdrant.mcp_server import QdrantMCPServer
+from mcp_server_qdrant.qdrant import ArbitraryFilter, Entry, QdrantConnector
 from mcp_server_qdrant.settings import (
     EmbeddingProviderSettings,
     QdrantSettings,
     ToolSettings,
 )
 from pydantic import Field
-from qdrant_client.models import FieldCondition, Filter, MatchValue
+from qdrant_client.models import (
+    FieldCondition,
+    Filter,
+    Fusion,
+    FusionQuery,
+    MatchValue,
+    Prefetch,
+    QueryRequest,
+    Range,
+    SparseVector,
+)
 
-from lorekeeper.config import settings  # noqa: F401 - must instantiate before EmbeddingProviderSettings reads env
+from lorekeeper.config import settings  # must instantiate before EmbeddingProviderSettings reads env
 from lorekeeper.observability import setup_observability
+from lorekeeper.obsidian_portal.chunking import estimate_tokens, merge_chunks, pack_chunks
+from lorekeeper.obsidian_portal.ingest import quantization_search_params
+
+_tracer, _meter = setup_observability("lorekeeper-qdrant-mcp")
+# Candidates fetched per vector type before fusion, relative to the number of results returned
+_PREFETCH_MULTIPLIER = 4
+
+# Every campaign has its own collection; tools search the one of the campaign they are given
+CampaignId = Annotated[
+    str | None,
+    Field(description="The campaign ID from your instructions; omit for the default campaign"),
+]
+
+_query_embedding_cache_counter = _meter.create_counter(
+    "lorekeeper.qdrant_mcp.query_embedding_cache_lookups",
+    description="Query embedding cache lookups, by result (hit/miss)",
+)
 
 # ---------------------------------------------------------------------------
 # Tool descriptions & server instructions
@@ -41,6 +78,29 @@ TOOL_FIND_DESCRIPTION = (
     "  - qdrant-get-document-chunks(document_id=metadata.id) to fetch the entire document."
 )
 
+TOOL_FIND_MANY_DESCRIPTION = (
+    "Run several semantic searches at once, e.g. different phrasings of the same question or "
+    "several entities to cross-reference. Prefer this over repeated qdrant-find calls.\n\n"
+    "Parameters:\n"
+    "  - queries: list of search queries\n\n"
+    "Returns the same <entry> elements as qdrant-find, grouped under a header per query. A chunk "
+    "matching several queries is listed once, under the query it matches best."
+)
+
+TOOL_FIND_DOCUMENTS_DESCRIPTION = (
+    "Semantic search that groups matches by document: returns the best matching documents, each "
+    "with its top matching chunks merged into one passage (overlapping text removed, [...] marking "
+    "skipped parts). Use this instead of qdrant-find when results tend to come from a few long "
+    "pages, to avoid reading the same text several times.\n\n"
+    "Parameters:\n"
+    "  - query: what to search for\n"
+    "  - documents: how many documents to return (default 5)\n"
+    "  - chunks_per_document: how many matching chunks to include per document (default 3)\n\n"
+    "Returns <document> elements with the merged <content>, the <chunk_indices> it was built from "
+    "and the document <metadata> (id, type, total_chunks, ...). Chain into qdrant-expand-context or "
+    "qdrant-get-document-chunks with metadata.id as usual."
+)
+
 TOOL_GET_CHUNK_DESCRIPTION = (
     "Fetch a single chunk by its Qdrant point UUID. Use this when you already have a "
     "point_id from a previous qdrant-expand-context or qdrant-get-document-chunks "
@@ -63,7 +123,9 @@ TOOL_EXPAND_CONTEXT_DESCRIPTION = (
     "  - document_id: the 'id' field from metadata (32-char hex string)\n"
     "  - chunk_index: the 'chunk_index' field from metadata\n"
     "  - before: number of preceding chunks to fetch (default 1, set 0 to skip)\n"
-    "  - after: number of following chunks to fetch (default 1, set 0 to skip)\n\n"
+    "  - after: number of following chunks to fetch (default 1, set 0 to skip)\n"
+    "  - max_tokens: optional budget for the response. When set, chunks closest to chunk_index are kept "
+    "first, overlapping text is removed, metadata is sent once and omitted chunks are listed.\n\n"
     "This is more efficient than multiple qdrant-find queries when you need "
     "contiguous text from a single document."
 )
@@ -74,31 +136,288 @@ TOOL_GET_DOCUMENT_CHUNKS_DESCRIPTION = (
     "character bio).\n\n"
     "Parameters:\n"
     "  - document_id: the 'id' field from metadata (32-char hex string). This is "
-    "the document's own ID, NOT the campaign ID.\n\n"
+    "the document's own ID, NOT the campaign ID.\n"
+    "  - max_tokens: optional budget for the response. When set, chunks are kept from the start of the "
+    "document, overlapping text is removed, metadata is sent once and omitted chunks are listed.\n\n"
     "Prefer qdrant-expand-context when you only need a few neighboring chunks - "
     "this tool fetches everything and may return a large amount of text."
 )
 
 SERVER_INSTRUCTIONS = (
     "Retrieval workflow for campaign lore:\n"
-    "1. Start with qdrant-find to semantically search for relevant chunks.\n"
+    "1. Start with qdrant-find to semantically search for relevant chunks, or qdrant-find-many "
+    "to try several queries in one call. Use qdrant-find-documents instead when matches pile up "
+    "in a few long documents.\n"
     "2. Inspect the metadata of each result (especially id, chunk_index, type).\n"
     "3. Use qdrant-expand-context to fetch surrounding chunks when a result is "
     "relevant but incomplete.\n"
     "4. Use qdrant-get-document-chunks to retrieve a full document when needed.\n"
     "5. Cross-reference information via additional qdrant-find queries with "
     "different search terms.\n"
-    "Always gather sufficient context before answering."
+    "Always gather sufficient context before answering.\n"
+    "Every tool takes an optional campaign_id; pass the campaign ID from your instructions so the "
+    "campaign's own collection is searched."
 )
 
 
+class FastEmbedQueryProvider(FastEmbedProvider):
+    """FastEmbedProvider that can also embed several queries in one model call."""
+
+    async def embed_queries(self, queries: list[str]) -> list[list[float]]:
+        embeddings = await asyncio.to_thread(lambda: list(self.embedding_model.query_embed(queries)))
+        return [embedding.tolist() for embedding in embeddings]
+
+
+class CachedEmbeddingProvider(EmbeddingProvider):
+    """
+    Wraps an embedding provider with an LRU + TTL cache of query embeddings.
+
+    The agent repeats the same lookups (character and place names) within and across sessions,
+    so repeated queries skip the model. Queries are keyed with whitespace collapsed, which the
+    tokenizer ignores anyway. Document embeddings are passed through uncached.
+    """
+
+    def __init__(
+        self,
+        inner: EmbeddingProvider,
+        *,
+        max_size: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._inner = inner
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._cache: OrderedDict[str, tuple[float, list[float]]] = OrderedDict()
+
+    async def embed_documents(self, documents: list[str]) -> list[list[float]]:
+        return await self._inner.embed_documents(documents)
+
+    async def embed_query(self, query: str) -> list[float]:
+        key = " ".join(query.split())
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] > self._clock():
+            self._cache.move_to_end(key)
+            _query_embedding_cache_counter.add(1, {"result": "hit"})
+            return cached[1]
+
+        _query_embedding_cache_counter.add(1, {"result": "miss"})
+        vector = await self._inner.embed_query(key)
+        self._store(key, vector)
+        return vector
+
+    async def embed_queries(self, queries: list[str]) -> list[list[float]]:
+        """Embed several queries, sending all cache misses through the model in one batch."""
+        keys = [" ".join(query.split()) for query in queries]
+        now = self._clock()
+        missing = list(dict.fromkeys(key for key in keys if key not in self._cache or self._cache[key][0] <= now))
+        _query_embedding_cache_counter.add(len(keys) - len(missing), {"result": "hit"})
+        _query_embedding_cache_counter.add(len(missing), {"result": "miss"})
+
+        vectors: dict[str, list[float]] = {}
+        for key in keys:
+            if key not in missing:
+                self._cache.move_to_end(key)
+                vectors[key] = self._cache[key][1]
+
+        if not missing:
+            new_vectors = []
+        elif isinstance(self._inner, FastEmbedQueryProvider):
+            new_vectors = await self._inner.embed_queries(missing)
+        else:
+            new_vectors = list(await asyncio.gather(*(self._inner.embed_query(key) for key in missing)))
+        for key, vector in zip(missing, new_vectors, strict=True):
+            vectors[key] = vector
+            self._store(key, vector)
+        return [vectors[key] for key in keys]
+
+    def _store(self, key: str, vector: list[float]) -> None:
+        if self._max_size <= 0:
+            return
+        self._cache[key] = (self._clock() + self._ttl_seconds, vector)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._max_size:
+            self._cache.popitem(last=False)
+
+    def get_vector_name(self) -> str:
+        return self._inner.get_vector_name()
+
+    def get_vector_size(self) -> int:
+        return self._inner.get_vector_size()
+
+
+def _format_packed_chunks(results: Sequence[dict[str, Any]], priority: list[int], max_tokens: int) -> list[str]:
+    """
+    Format one document's chunks within a token budget: metadata once, overlap stripped, omissions marked.
+
+    results are the chunk dicts built by the retrieval tools; priority lists their chunk indices, most relevant first.
+    """
+    if not results:
+        return []
+    by_index = {result["chunk_index"]: result for result in results}
+    metadata = {key: value for key, value in results[0]["metadata"].items() if key != "chunk_index"}
+    formatted = [f"<metadata>{json.dumps(metadata)}</metadata>"]
+
+    chunks = {index: result["content"] for index, result in by_index.items()}
+    packed = pack_chunks(chunks, priority, max_tokens - estimate_tokens(formatted[0]))
+    formatted.extend(
+        f"<chunk><point_id>{by_index[index]['point_id']}</point_id>"
+        f"<chunk_index>{index}</chunk_index><content>{content}</content></chunk>"
+        for index, content in packed.items()
+    )
+
+    omitted = sorted(chunks.keys() - packed.keys())
+    if omitted:
+        formatted.append(
+            f"<truncated>Omitted chunk_index {_format_index_ranges(omitted)} to stay within max_tokens={max_tokens}. "
+            "Fetch them with qdrant-expand-context or a larger max_tokens.</truncated>",
+        )
+    return formatted
+
+
+def _format_index_ranges(indices: list[int]) -> str:
+    """Format sorted indices compactly, e.g. [0, 1, 2, 5] -> "0-2, 5"."""
+    ranges: list[list[int]] = []
+    for index in indices:
+        if ranges and index == ranges[-1][1] + 1:
+            ranges[-1][1] = index
+        else:
+            ranges.append([index, index])
+    return ", ".join(str(start) if start == end else f"{start}-{end}" for start, end in ranges)
+
+
+class HybridQdrantConnector(QdrantConnector):
+    """
+    QdrantConnector whose searches fuse dense and BM25 sparse results with reciprocal rank fusion.
+
+    Dense vectors alone often miss proper nouns (NPC names, slugs, in-world places) that BM25 matches
+    exactly. Collections built before sparse vectors existed fall back to dense-only search.
+    """
+
+    def __init__(
+        self,
+        qdrant_settings: QdrantSettings,
+        embedding_provider: EmbeddingProvider,
+        sparse_model: SparseTextEmbedding,
+    ) -> None:
+        super().__init__(
+            qdrant_settings.location,
+            qdrant_settings.api_key,
+            qdrant_settings.collection_name,
+            embedding_provider,
+            qdrant_settings.local_path,
+            make_indexes(qdrant_settings.filterable_fields_dict()),
+        )
+        self._sparse_model = sparse_model
+        self._search_params = quantization_search_params(
+            settings.vector_quantization,
+            settings.quantization_oversampling,
+        )
+        # Only positive answers are cached: a collection gains sparse vectors when the fetcher rebuilds it
+        self._hybrid_collections: set[str] = set()
+
+    async def has_sparse_vectors(self, collection_name: str) -> bool:
+        if collection_name in self._hybrid_collections:
+            return True
+        if not await self._client.collection_exists(collection_name):
+            return False
+        sparse_vectors = (await self._client.get_collection(collection_name)).config.params.sparse_vectors
+        if settings.sparse_vector_name not in (sparse_vectors or {}):
+            return False
+        self._hybrid_collections.add(collection_name)
+        return True
+
+    async def embed_sparse_queries(self, queries: list[str]) -> list[SparseVector]:
+        embeddings = await asyncio.to_thread(lambda: list(self._sparse_model.query_embed(queries)))
+        return [
+            SparseVector(indices=embedding.indices.tolist(), values=embedding.values.tolist())
+            for embedding in embeddings
+        ]
+
+    def build_query(
+        self,
+        dense: list[float],
+        sparse: SparseVector | None,
+        *,
+        prefetch_limit: int,
+        query_filter: Filter | None = None,
+    ) -> dict[str, Any]:
+        """Query arguments shared by query_points, QueryRequest and query_points_groups; dense only without sparse."""
+        if sparse is None:
+            # Only collections from before hybrid search get here, and those predate quantization too
+            return {"query": dense, "using": self._embedding_provider.get_vector_name()}
+        return {
+            "prefetch": [
+                Prefetch(
+                    query=dense,
+                    using=self._embedding_provider.get_vector_name(),
+                    filter=query_filter,
+                    params=self._search_params,
+                    limit=prefetch_limit,
+                ),
+                Prefetch(query=sparse, using=settings.sparse_vector_name, filter=query_filter, limit=prefetch_limit),
+            ],
+            "query": FusionQuery(fusion=Fusion.RRF),
+        }
+
+    async def search(
+        self,
+        query: str,
+        *,
+        collection_name: str | None = None,
+        limit: int = 10,
+        query_filter: Filter | None = None,
+    ) -> list[Entry]:
+        collection_name = collection_name or self._default_collection_name
+        assert collection_name is not None
+        if not await self.has_sparse_vectors(collection_name):
+            return await super().search(query, collection_name=collection_name, limit=limit, query_filter=query_filter)
+
+        dense, (sparse,) = await asyncio.gather(
+            self._embedding_provider.embed_query(query),
+            self.embed_sparse_queries([query]),
+        )
+        response = await self._client.query_points(
+            collection_name=collection_name,
+            **self.build_query(dense, sparse, prefetch_limit=limit * _PREFETCH_MULTIPLIER, query_filter=query_filter),
+            query_filter=query_filter,
+            limit=limit,
+        )
+        return [
+            Entry(content=point.payload["document"], metadata=point.payload.get("metadata"))
+            for point in response.points
+            if point.payload is not None
+        ]
+
+
 class ExtendedQdrantMCPServer(QdrantMCPServer):
     """Extended Qdrant MCP Server with additional tools for chunk retrieval and context expansion."""
 
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        tool_settings: ToolSettings,
+        qdrant_settings: QdrantSettings,
+        embedding_provider: CachedEmbeddingProvider,
+        sparse_model: SparseTextEmbedding,
+        name: str,
+        instructions: str,
+    ) -> None:
+        # What QdrantMCPServer.__init__ does, except that it builds its own embedding provider from settings. It
+        # takes one as an argument from mcp-server-qdrant 0.8.1, which pins pydantic below the 2.12 we need.
+        self.tool_settings = tool_settings
+        self.qdrant_settings = qdrant_settings
+        self.embedding_provider = embedding_provider
+        self.qdrant_connector = HybridQdrantConnector(qdrant_settings, embedding_provider, sparse_model)
+        FastMCP.__init__(self, name=name, instructions=instructions)
+        self.setup_tools()
+
     def setup_tools(self) -> None:
         """Register both base tools and extended tools."""
-        # Register the base tools (qdrant-find, qdrant-store)
+        # Register the base tools (qdrant-find, qdrant-store); qdrant-find is replaced by a campaign-aware one below
         super().setup_tools()
+        self.local_provider.remove_tool("qdrant-find")
 
         # Register our extended tools
         self.register_extended_tools()
@@ -106,22 +425,175 @@ class ExtendedQdrantMCPServer(QdrantMCPServer):
     def register_extended_tools(self) -> None:  # noqa: C901, PLR0915
         """Register additional tools for advanced retrieval operations."""
 
+        async def find(  # noqa: PLR0917
+            ctx: Context,
+            query: Annotated[str, Field(description="What to search for")],
+            campaign_id: CampaignId = None,
+            query_filter: ArbitraryFilter | None = None,
+        ) -> list[str]:
+            """
+            Search the collection of a campaign.
+
+            :param ctx: The context for the request.
+            :param query: The query to search for.
+            :param campaign_id: The campaign to search, or None for the default campaign.
+            :param query_filter: The filter to apply to the query, as in the base qdrant-find.
+            :return: The matching entries.
+            """
+            await ctx.debug(f"Query filter: {query_filter}")
+            await ctx.debug(f"Finding results for query {query}")
+            # The campaign is its own collection, so the filter only has to narrow the search within it
+            entries = await self.qdrant_connector.search(
+                query,
+                collection_name=settings.campaign(campaign_id).collection_name,
+                limit=self.qdrant_settings.search_limit,
+                query_filter=Filter(**query_filter) if query_filter else None,
+            )
+            if not entries:
+                return [f"No information found for the query '{query}'"]
+            return [f"Results for the query '{query}'"] + [self.format_entry(entry) for entry in entries]
+
+        async def find_many(
+            ctx: Context,
+            queries: Annotated[list[str], Field(description="The search queries to run")],
+            campaign_id: CampaignId = None,
+        ) -> list[str]:
+            """
+            Run several semantic searches in one batch.
+
+            :param ctx: The context for the request.
+            :param queries: The queries to search for.
+            :param campaign_id: The campaign to search, or None for the default campaign.
+            :return: Entries grouped per query; each chunk is listed once, under the query it scores best for.
+            """
+            queries = list(dict.fromkeys(queries))
+            await ctx.debug(f"Finding results for {len(queries)} queries: {queries}")
+            if not queries:
+                return ["No queries given"]
+
+            connector = self.qdrant_connector
+            collection_name = settings.campaign(campaign_id).collection_name
+            assert isinstance(self.embedding_provider, CachedEmbeddingProvider)
+            assert isinstance(connector, HybridQdrantConnector)
+
+            limit = self.qdrant_settings.search_limit
+            if await connector.has_sparse_vectors(collection_name):
+                vectors, sparse_vectors = await asyncio.gather(
+                    self.embedding_provider.embed_queries(queries),
+                    connector.embed_sparse_queries(queries),
+                )
+            else:
+                vectors, sparse_vectors = await self.embedding_provider.embed_queries(queries), [None] * len(queries)
+            responses = await connector._client.query_batch_points(
+                collection_name=collection_name,
+                requests=[
+                    QueryRequest(
+                        **connector.build_query(vector, sparse, prefetch_limit=limit * _PREFETCH_MULTIPLIER),
+                        limit=limit,
+                        with_payload=True,
+                    )
+                    for vector, sparse in zip(vectors, sparse_vectors, strict=True)
+                ],
+            )
+
+            # Keep each point only under the query it scored highest for
+            best_query: dict[str, tuple[float, int]] = {}  # point ID -> (score, query index)
+            for query_index, response in enumerate(responses):
+                for point in response.points:
+                    point_key = str(point.id)
+                    if point_key not in best_query or point.score > best_query[point_key][0]:
+                        best_query[point_key] = (point.score, query_index)
+
+            content = []
+            for query_index, (query, response) in enumerate(zip(queries, responses, strict=True)):
+                if not response.points:
+                    content.append(f"No information found for the query '{query}'")
+                    continue
+                own_points = [point for point in response.points if best_query[str(point.id)][1] == query_index]
+                if not own_points:
+                    content.append(f"All results for the query '{query}' are listed under other queries")
+                    continue
+                content.append(f"Results for the query '{query}'")
+                for point in own_points:
+                    assert point.payload is not None
+                    entry = Entry(content=point.payload["document"], metadata=point.payload.get("metadata"))
+                    content.append(self.format_entry(entry))
+            return content
+
+        async def find_documents(  # noqa: PLR0917
+            ctx: Context,
+            query: Annotated[str, Field(description="What to search for")],
+            documents: Annotated[int, Field(description="Number of documents to return")] = 5,
+            chunks_per_document: Annotated[int, Field(description="Matching chunks to include per document")] = 3,
+            campaign_id: CampaignId = None,
+        ) -> list[str]:
+            """
+            Search and group the matching chunks by document.
+
+            :param ctx: The context for the request.
+            :param query: The query to search for.
+            :param documents: Number of documents to return.
+            :param chunks_per_document: Number of top matching chunks to merge per document.
+            :param campaign_id: The campaign to search, or None for the default campaign.
+            :return: One entry per document, best match first, with its chunks merged in chunk order.
+            """
+            await ctx.debug(f"Finding documents for query {query}")
+
+            connector = self.qdrant_connector
+            collection_name = settings.campaign(campaign_id).collection_name
+            assert isinstance(connector, HybridQdrantConnector)
+
+            dense = await self.embedding_provider.embed_query(query)
+            sparse = None
+            if await connector.has_sparse_vectors(collection_name):
+                (sparse,) = await connector.embed_sparse_queries([query])
+            # Prefetch enough chunks that documents can fill their groups after fusion
+            prefetch_limit = documents * chunks_per_document * _PREFETCH_MULTIPLIER
+            groups = await connector._client.query_points_groups(
+                collection_name=collection_name,
+                **connector.build_query(dense, sparse, prefetch_limit=prefetch_limit),
+                group_by="metadata.id",
+                limit=documents,
+                group_size=chunks_per_document,
+                with_payload=True,
+            )
+            if not groups.groups:
+                return [f"No information found for the query '{query}'"]
+
+            content = [f"Results for the query '{query}'"]
+            for group in groups.groups:
+                chunks = []
+                for point in group.hits:
+                    assert point.payload is not None
+                    chunks.append((point.payload.get("metadata", {}).get("chunk_index", 0), point.payload["document"]))
+                assert group.hits[0].payload is not None
+                metadata = dict(group.hits[0].payload.get("metadata", {}))
+                metadata.pop("chunk_index", None)
+                chunk_indices = ",".join(str(index) for index in sorted({index for index, _ in chunks}))
+                content.append(
+                    f"<document><content>{merge_chunks(chunks)}</content>"
+                    f"<chunk_indices>{chunk_indices}</chunk_indices>"
+                    f"<metadata>{json.dumps(metadata)}</metadata></document>",
+                )
+            return content
+
         async def get_chunk(
             ctx: Context,
             point_id: Annotated[str, Field(description="The UUID of the point to retrieve")],
+            campaign_id: CampaignId = None,
         ) -> str:
             """
             Retrieve a specific chunk by its point ID.
 
             :param ctx: The context for the request.
             :param point_id: The UUID of the point to retrieve.
+            :param campaign_id: The campaign the point belongs to, or None for the default campaign.
             :return: The chunk content with metadata.
             """
             await ctx.debug(f"Retrieving chunk with point_id: {point_id}")
 
             client = self.qdrant_connector._client
-            collection_name = self.qdrant_settings.collection_name
-            assert collection_name is not None
+            collection_name = settings.campaign(campaign_id).collection_name
 
             points = await client.retrieve(
                 collection_name=collection_name,
@@ -142,7 +614,7 @@ class ExtendedQdrantMCPServer(QdrantMCPServer):
                 f"<metadata>{metadata_str}</metadata></chunk>"
             )
 
-        async def expand_context(  # noqa: PLR0917
+        async def expand_context(  # noqa: PLR0913, PLR0917
             ctx: Context,
             document_id: Annotated[str, Field(description="The document ID from metadata (32-char hex string)")],
             chunk_index: Annotated[int, Field(description="The chunk index of the current chunk")],
@@ -154,6 +626,11 @@ class ExtendedQdrantMCPServer(QdrantMCPServer):
                 int,
                 Field(description="Number of chunks to retrieve after the current chunk"),
             ] = 1,
+            max_tokens: Annotated[
+                int | None,
+                Field(description="Optional budget for the returned text; chunks nearest the current one are kept"),
+            ] = None,
+            campaign_id: CampaignId = None,
         ) -> list[str]:
             """
             Expand context by retrieving adjacent chunks from the same document.
@@ -163,6 +640,8 @@ class ExtendedQdrantMCPServer(QdrantMCPServer):
             :param chunk_index: The chunk index of the current chunk.
             :param before: Number of chunks to retrieve before the current chunk (default: 1). Set to 0 to skip.
             :param after: Number of chunks to retrieve after the current chunk (default: 1). Set to 0 to skip.
+            :param max_tokens: Optional token budget; chunks nearest chunk_index are packed first.
+            :param campaign_id: The campaign the document belongs to, or None for the default campaign.
             :return: List of adjacent chunks including the original, ordered by chunk_index.
             """
             await ctx.debug(
@@ -171,74 +650,65 @@ class ExtendedQdrantMCPServer(QdrantMCPServer):
             )
 
             client = self.qdrant_connector._client
-            collection_name = self.qdrant_settings.collection_name
-            assert collection_name is not None
+            collection_name = settings.campaign(campaign_id).collection_name
+
+            start_index = max(0, chunk_index - before)
 
-            # Get the current chunk to find total_chunks
-            search_results = await client.scroll(
+            # Fetch the whole window in one query; points come back in ID order, not chunk order
+            window, _ = await client.scroll(
                 collection_name=collection_name,
                 scroll_filter=Filter(
                     must=[
                         FieldCondition(key="metadata.id", match=MatchValue(value=document_id)),
-                        FieldCondition(key="metadata.chunk_index", match=MatchValue(value=chunk_index)),
+                        FieldCondition(
+                            key="metadata.chunk_index",
+                            range=Range(gte=start_index, lte=chunk_index + after),
+                        ),
                     ],
                 ),
-                limit=1,
+                limit=max(1, chunk_index + after - start_index + 1),
             )
+            points_by_index = {}
+            for point in window:
+                assert point.payload is not None
+                points_by_index.setdefault(point.payload.get("metadata", {}).get("chunk_index"), point)
 
-            if not search_results[0]:
+            current = points_by_index.get(chunk_index)
+            if current is None:
                 return [f"<error>Chunk not found for document {document_id} at index {chunk_index}</error>"]
 
-            current = search_results[0][0]
             assert current.payload is not None
-            metadata = current.payload.get("metadata", {})
-            total_chunks = metadata.get("total_chunks")
-
-            # Calculate range
-            start_index = max(0, chunk_index - before)
+            total_chunks = current.payload.get("metadata", {}).get("total_chunks")
             end_index = min(
                 total_chunks - 1 if total_chunks else chunk_index + after,
                 chunk_index + after,
             )
 
             await ctx.debug(
-                f"Searching for chunks {start_index} to {end_index} of document {document_id}",
+                f"Found chunks {start_index} to {end_index} of document {document_id}",
             )
 
-            # Search for all chunks in this range
-            results = []
+            results: list[dict[str, Any]] = []
             for idx in range(start_index, end_index + 1):
-                search_results = await client.scroll(
-                    collection_name=collection_name,
-                    scroll_filter=Filter(
-                        must=[
-                            FieldCondition(key="metadata.id", match=MatchValue(value=document_id)),
-                            FieldCondition(key="metadata.chunk_index", match=MatchValue(value=idx)),
-                        ],
-                    ),
-                    limit=1,
-                )
-
-                if search_results[0]:  # search_results is tuple (points, next_offset)
-                    for point in search_results[0]:
-                        assert point.payload is not None
-                        content = point.payload.get("document", "")
-                        metadata = point.payload.get("metadata", {})
-                        metadata_str = json.dumps(metadata) if metadata else ""
-
-                        results.append({
-                            "point_id": point.id,
-                            "content": content,
-                            "metadata_str": metadata_str,
-                            "chunk_index": idx,
-                        })
-
-            # Sort by chunk_index to maintain order
-            results.sort(key=lambda x: x.get("chunk_index", 0))
+                point = points_by_index.get(idx)
+                if point is None:
+                    continue
+                assert point.payload is not None
+                metadata = point.payload.get("metadata", {})
+                results.append({
+                    "point_id": point.id,
+                    "content": point.payload.get("document", ""),
+                    "metadata": metadata,
+                    "metadata_str": json.dumps(metadata) if metadata else "",
+                    "chunk_index": idx,
+                })
 
             formatted_results = [
                 f"Found {len(results)} chunks (indices {start_index} to {end_index}) from document {document_id}",
             ]
+            if max_tokens is not None:
+                priority = sorted((r["chunk_index"] for r in results), key=lambda idx: (abs(idx - chunk_index), idx))
+                return formatted_results + _format_packed_chunks(results, priority, max_tokens)
 
             for result in results:
                 formatted_results.append(
@@ -250,28 +720,34 @@ class ExtendedQdrantMCPServer(QdrantMCPServer):
 
             return formatted_results
 
-        async def get_document_chunks(
+        async def get_document_chunks(  # noqa: PLR0917
             ctx: Context,
             document_id: Annotated[
                 str,
                 Field(description="The document ID (32-char hex string from Obsidian Portal)"),
             ],
+            max_tokens: Annotated[
+                int | None,
+                Field(description="Optional budget for the returned text; chunks are kept from the start"),
+            ] = None,
+            campaign_id: CampaignId = None,
         ) -> list[str]:
             """
             Retrieve all chunks for a specific document.
 
             :param ctx: The context for the request.
             :param document_id: The document ID.
+            :param max_tokens: Optional token budget; chunks are packed from the start of the document.
+            :param campaign_id: The campaign the document belongs to, or None for the default campaign.
             :return: All chunks from the document, ordered by chunk_index.
             """
             await ctx.debug(f"Retrieving all chunks for document_id: {document_id}")
 
             client = self.qdrant_connector._client
-            collection_name = self.qdrant_settings.collection_name
-            assert collection_name is not None
+            collection_name = settings.campaign(campaign_id).collection_name
 
             # Scroll through all points with matching document_id
-            results = []
+            results: list[dict[str, Any]] = []
             offset = None
 
             while True:
@@ -306,6 +782,9 @@ class ExtendedQdrantMCPServer(QdrantMCPServer):
             results.sort(key=lambda x: x.get("chunk_index", 0))
 
             formatted_results = [f"Found {len(results)} chunks for document {document_id}"]
+            if max_tokens is not None:
+                priority = [r["chunk_index"] for r in results]
+                return formatted_results + _format_packed_chunks(results, priority, max_tokens)
 
             for result in results:
                 metadata_str = json.dumps(result["metadata"]) if result["metadata"] else ""
@@ -318,7 +797,18 @@ class ExtendedQdrantMCPServer(QdrantMCPServer):
 
             return formatted_results
 
+        # Expose query_filter like the base qdrant-find does: as the configured filterable fields, as is, or not at all
+        find_tool: Callable[..., Any] = find
+        filterable_conditions = self.qdrant_settings.filterable_fields_dict_with_conditions()
+        if filterable_conditions:
+            find_tool = wrap_filters(find, filterable_conditions)
+        elif not self.qdrant_settings.allow_arbitrary_filter:
+            find_tool = make_partial_function(find, {"query_filter": None})
+
         # Register the extended tools
+        self.tool(find_tool, name="qdrant-find", description=TOOL_FIND_DESCRIPTION)
+        self.tool(find_many, name="qdrant-find-many", description=TOOL_FIND_MANY_DESCRIPTION)
+        self.tool(find_documents, name="qdrant-find-documents", description=TOOL_FIND_DOCUMENTS_DESCRIPTION)
         self.tool(get_chunk, name="qdrant-get-chunk", description=TOOL_GET_CHUNK_DESCRIPTION)
         self.tool(
             expand_context,
@@ -332,16 +822,21 @@ class ExtendedQdrantMCPServer(QdrantMCPServer):
         )
 
 
-setup_observability("lorekeeper-qdrant-mcp")
+def create_server() -> ExtendedQdrantMCPServer:
+    """Build the server, loading the embedding models."""
+    return ExtendedQdrantMCPServer(
+        tool_settings=ToolSettings(**{"TOOL_FIND_DESCRIPTION": TOOL_FIND_DESCRIPTION}),
+        qdrant_settings=QdrantSettings(),
+        embedding_provider=CachedEmbeddingProvider(
+            FastEmbedQueryProvider(EmbeddingProviderSettings().model_name),
+            max_size=settings.query_embedding_cache_size,
+            ttl_seconds=settings.query_embedding_cache_ttl_seconds,
+        ),
+        sparse_model=SparseTextEmbedding(settings.sparse_model_name),
+        name="mcp-server-qdrant-extended",
+        instructions=SERVER_INSTRUCTIONS,
+    )
 
-# Create the server instance
-mcp = ExtendedQdrantMCPServer(
-    tool_settings=ToolSettings(**{"TOOL_FIND_DESCRIPTION": TOOL_FIND_DESCRIPTION}),
-    qdrant_settings=QdrantSettings(),
-    embedding_provider_settings=EmbeddingProviderSettings(),
-    name="mcp-server-qdrant-extended",
-    instructions=SERVER_INSTRUCTIONS,
-)
 
 if __name__ == "__main__":
-    asyncio.run(mcp.run_async(transport="streamable-http", host="0.0.0.0", port=8000))
+    asyncio.run(create_server().run_async(transport="streamable-http", host="0.0.0.0", port=8000))
@@ -88,7 +88,8 @@ def chores_skill(args: str) -> str:
         "Only propose creating a quest if no existing quest covers that thread. "
         "Only propose updating a quest if the session adds meaningful new information not already in it. "
         "If nothing needs to change, state that clearly and skip. "
-        "Otherwise show the user all proposed changes together, wait for approval, then execute.\n\n"
+        "Otherwise show the user all proposed changes together, wait for approval, "
+        "then apply them all in a single `update_quests_tool` call.\n\n"
         "After completing all 5 steps, provide a brief summary of everything that was created or updated. "
         "At the very end of your summary, include the exact text [SKILL_COMPLETE] on its own line."
     )
@@ -0,0 +1,22 @@
+import os
+
+# lorekeeper.config reads these at import; tests never reach the services they point at
+for _name in (
+    "CONSUMER_KEY",
+    "CONSUMER_SECRET",
+    "REQUEST_TOKEN_URL",
+    "ACCESS_TOKEN_URL",
+    "AUTHORIZE_URL",
+    "QDRANT_URL",
+    "OLLAMA_URL",
+    "OPENROUTER_URL",
+    "OPENROUTER_API_KEY",
+    "GROQ_API_URL",
+    "GROQ_API_KEY",
+    "OPENAI_API_KEY",
+):
+    os.environ.setdefault(_name, "test")
+os.environ.setdefault("CAMPAIGN_ID", "campaign")
+os.environ.setdefault("QUEST_LOG_PAGE_ID", "quest-log")
+os.environ.setdefault("CALENDAR_PAGE_ID", "calendar")
+os.environ.setdefault("COLLECTION_NAME", "lore")
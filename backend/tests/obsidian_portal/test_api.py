@@ -0,0 +1,280 @@
+"""Tests for obsidian_portal/api.py, against a fake Obsidian Portal."""
+
+import asyncio
+import json
+from collections.abc import Awaitable, Callable
+
+import httpx
+import pytest
+
+from lorekeeper.config import settings
+from lorekeeper.obsidian_portal.api import _retry_delay, create_quest, fetch_characters, fetch_quests, update_quests
+from lorekeeper.obsidian_portal.calendar_api import add_calendar_entries
+from lorekeeper.obsidian_portal.calendar_parser import CalendarDate, get_entries
+from lorekeeper.obsidian_portal.calendar_parser import parse_body as parse_calendar
+from lorekeeper.obsidian_portal.models import CalendarEntryRequest, Quest, QuestUpdate
+from lorekeeper.obsidian_portal.page_cache import PageCache
+from lorekeeper.obsidian_portal.quest_parser import extract_quests
+from lorekeeper.obsidian_portal.quest_parser import parse_body as parse_quest_log
+from tests.obsidian_portal.test_calendar_parser import _make_minimal_body as _calendar_body
+
+
+def _character(character_id: str) -> dict:
+    return {
+        "id": character_id,
+        "slug": character_id,
+        "name": character_id,
+        "character_url": f"https://example.com/{character_id}",
+        "is_player_character": False,
+        "created_at": "2024-01-01T00:00:00Z",
+        "updated_at": "2024-01-01T00:00:00Z",
+        "is_game_master_only": False,
+        "tags": [],
+    }
+
+
+def test_fetch_characters_stops_enriching_after_a_failure() -> None:
+    character_ids = [f"c{i}" for i in range(10)]
+    requested: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0)
+        if request.url.path.endswith("/characters.json"):
+            return httpx.Response(200, json=[_character(character_id) for character_id in character_ids])
+        character_id = request.url.path.rsplit("/", 1)[-1].removesuffix(".json")
+        requested.append(character_id)
+        if character_id == "c0":
+            raise httpx.ConnectError("Portal is down", request=request)
+        return httpx.Response(200, json=_character(character_id))
+
+    async def run() -> None:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            with pytest.raises(httpx.ConnectError):
+                await fetch_characters(client, "campaign", enrich=True, max_concurrency=1)
+            await asyncio.sleep(0.05)  # give leftover requests the chance to run
+
+    asyncio.run(run())
+    # The next character may already hold the freed slot when the error comes back, but no others run
+    assert requested[0] == "c0"
+    assert len(requested) <= 2
+
+
+def _fetch_enriched(responses: list[httpx.Response], requested: list[str]) -> list[str]:
+    """Fetch the enriched characters from a Portal that has just c0, answering each request for it with the next response."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0)
+        if request.url.path.endswith("/characters.json"):
+            return httpx.Response(200, json=[_character("c0")])
+        requested.append(request.url.path)
+        return responses.pop(0)
+
+    async def run() -> list[str]:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return [character.id for character in await fetch_characters(client, "campaign", enrich=True)]
+
+    return asyncio.run(run())
+
+
+def test_fetch_characters_retries_after_the_rate_limit() -> None:
+    requested: list[str] = []
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(200, json=_character("c0")),
+    ]
+
+    assert _fetch_enriched(responses, requested) == ["c0"]
+    assert len(requested) == 3
+
+
+def test_fetch_characters_gives_up_when_rate_limited_too_often(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "portal_max_retries", 2)
+    monkeypatch.setattr(settings, "portal_retry_backoff_seconds", 0)
+    requested: list[str] = []
+    responses = [httpx.Response(429) for _ in range(3)]
+
+    with pytest.raises(httpx.HTTPStatusError, match="429"):
+        _fetch_enriched(responses, requested)
+    assert len(requested) == 3
+
+
+def test_fetch_characters_raises_http_errors() -> None:
+    responses = [httpx.Response(500, json={"error": "oops"})]
+
+    with pytest.raises(httpx.HTTPStatusError, match="500"):
+        _fetch_enriched(responses, [])
+
+
+@pytest.mark.parametrize(
+    "headers,expected",
+    [
+        pytest.param({"Retry-After": "7"}, 7, id="seconds"),
+        pytest.param({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, 0, id="date-in-the-past"),
+        pytest.param({"Retry-After": "soon"}, 4, id="unparseable"),
+        pytest.param({}, 4, id="missing"),
+    ],
+)
+def test_retry_delay_honours_retry_after(
+    monkeypatch: pytest.MonkeyPatch,
+    headers: dict[str, str],
+    expected: float,
+) -> None:
+    monkeypatch.setattr(settings, "portal_retry_backoff_seconds", 1)
+    assert _retry_delay(httpx.Response(429, headers=headers), attempt=2) == expected
+
+
+# ── Parsed pages ──────────────────────────────────────────────────────────────
+
+_QUEST_LOG = 'h2. Completed Quests\n<div style="visibility: hidden;">template content</div>'
+
+
+class _WikiPage:
+    """The one wiki page of a fake Obsidian Portal; a successful PUT replaces its body."""
+
+    def __init__(self, body: str, *, put_status: int = 200) -> None:
+        self.body = body
+        self.put_status = put_status
+        self.puts: list[str] = []
+        self.put_started = asyncio.Event()
+        self._version = 0
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.method == "PUT":
+            self.puts.append(json.loads(request.content)["wiki_page"]["body"])
+            self.put_started.set()
+            await asyncio.sleep(0.01)
+            if self.put_status == httpx.codes.OK:
+                self.body = self.puts[-1]
+                self._version += 1
+            return httpx.Response(self.put_status, json={})
+        await asyncio.sleep(0)
+        return httpx.Response(
+            200,
+            json={
+                "id": "p",
+                "slug": "page",
+                "type": "WikiPage",
+                "name": "Page",
+                "body": self.body,
+                "wiki_page_url": "https://example.com/page",
+                "created_at": "2024-01-01T00:00:00Z",
+                "updated_at": f"2024-01-01T00:00:{self._version:02d}Z",
+                "is_game_master_only": False,
+                "tags": [],
+            },
+        )
+
+    def run[T](self, call: Callable[[httpx.AsyncClient], Awaitable[T]]) -> T:
+        async def run() -> T:
+            async with httpx.AsyncClient(transport=httpx.MockTransport(self.handler)) as client:
+                return await call(client)
+
+        return asyncio.run(run())
+
+
+def _quest(title: str) -> Quest:
+    return Quest(title=title, content="Find it", status="open", phase="Act I", quest_type="Main Quest")
+
+
+def test_create_quest_saves_the_quest_log_and_keeps_its_parse() -> None:
+    page = _WikiPage(_QUEST_LOG)
+    page_cache = PageCache()
+
+    async def run(client: httpx.AsyncClient) -> list[Quest]:
+        await create_quest(client, "campaign", "p", quest=_quest("The Relic"), page_cache=page_cache)
+        return await fetch_quests(client, "campaign", "p", page_cache=page_cache)
+
+    quests = page.run(run)
+
+    assert [quest.title for quest in quests] == ["The Relic"]
+    assert len(page.puts) == 1
+    assert [quest.title for quest in extract_quests(parse_quest_log(page.body))] == ["The Relic"]
+
+
+def test_fetch_quests_does_not_see_an_edit_being_saved() -> None:
+    page = _WikiPage(_QUEST_LOG, put_status=500)
+    page_cache = PageCache()
+
+    async def run(client: httpx.AsyncClient) -> list[Quest]:
+        edit = asyncio.create_task(
+            create_quest(client, "campaign", "p", quest=_quest("The Relic"), page_cache=page_cache),
+        )
+        await page.put_started.wait()
+        quests = await fetch_quests(client, "campaign", "p", page_cache=page_cache)
+        with pytest.raises(httpx.HTTPStatusError):
+            await edit
+        return quests
+
+    assert page.run(run) == []
+
+
+def test_add_calendar_entries_saves_the_valid_entries_once() -> None:
+    page = _WikiPage(_calendar_body())
+    entries = [
+        CalendarEntryRequest(month_or_special_day="Hammer", day=2, summary_title="Siege of Hammerfast"),
+        CalendarEntryRequest(month_or_special_day="Hammer", day=40, summary_title="Lost Day"),
+    ]
+
+    results = page.run(
+        lambda client: add_calendar_entries(
+            client,
+            entries,
+            campaign_id="campaign",
+            page_id="p",
+            page_cache=PageCache(),
+        ),
+    )
+
+    assert [(result.year, result.error) for result in results] == [
+        (1372, None),
+        (1372, "Day 40 does not exist; Hammer has days 1-30."),
+    ]
+    assert len(page.puts) == 1
+    date = CalendarDate(year=1372, month_or_special_day="Hammer", day=2)
+    assert get_entries(parse_calendar(page.body), date) == [(date, ["Siege of Hammerfast"])]
+
+
+def test_add_calendar_entries_saves_nothing_when_every_entry_fails() -> None:
+    page = _WikiPage(_calendar_body())
+    entries = [
+        CalendarEntryRequest(month_or_special_day="Hammer", day=40, summary_title="Lost Day"),
+        CalendarEntryRequest(month_or_special_day="Shieldmeet", year=1373, summary_title="No Such Day"),
+    ]
+
+    results = page.run(lambda client: add_calendar_entries(client, entries, campaign_id="campaign", page_id="p"))
+
+    assert all(result.error for result in results)
+    assert page.puts == []
+
+
+def test_add_calendar_entries_saves_nothing_when_an_entry_fails_in_a_missing_year() -> None:
+    page = _WikiPage(_calendar_body())
+    entries = [CalendarEntryRequest(month_or_special_day="Kythorn", day=40, year=1380, summary_title="Lost Day")]
+
+    results = page.run(lambda client: add_calendar_entries(client, entries, campaign_id="campaign", page_id="p"))
+
+    assert results[0].error == "Day 40 does not exist; Kythorn has days 1-30."
+    assert page.puts == []
+
+
+def test_update_quests_saves_nothing_and_drops_the_cached_parse_when_a_change_fails() -> None:
+    page = _WikiPage(_QUEST_LOG)
+    page_cache = PageCache()
+
+    async def run(client: httpx.AsyncClient) -> None:
+        await fetch_quests(client, "campaign", "p", page_cache=page_cache)
+        with pytest.raises(ValueError, match="No quest changes were applied"):
+            await update_quests(
+                client,
+                "campaign",
+                "p",
+                inserts=[_quest("The Relic")],
+                updates=[QuestUpdate(title="Missing Quest", new_status="completed")],
+                page_cache=page_cache,
+            )
+
+    page.run(run)
+
+    assert page.puts == []
+    assert page_cache._parsed == {}
@@ -10,6 +10,7 @@ from lorekeeper.obsidian_portal.calendar_parser import (
     _insert_link_in_month,
     _insert_link_in_special_day,
     _new_month_accordion_item,
+    add_entries,
     add_entry,
     get_entries,
     is_leap_year,
@@ -396,6 +397,8 @@ def test_new_month_accordion_item_roundtrip_after_insert() -> None:
         pytest.param(1373, "Shieldmeet", None, "not a leap year", id="shieldmeet-non-leap-year"),
         pytest.param(1372, "Midwinter", 5, "does not have a day number", id="special-day-with-day-number"),
         pytest.param(1372, "Hammer", None, "day number", id="regular-month-without-day"),
+        pytest.param(1372, "Hammer", 31, "has days 1-30", id="day-past-end-of-month"),
+        pytest.param(1372, "Hammer", 0, "has days 1-30", id="day-zero"),
     ],
 )
 def test_add_entry_invalid_date_raises(
@@ -409,6 +412,14 @@ def test_add_entry_invalid_date_raises(
         add_entry(page, CalendarDate(year=year, month_or_special_day=month_or_special_day, day=day), "Event")
 
 
+def test_add_entry_invalid_day_in_missing_year_leaves_page_unchanged() -> None:
+    body = _make_minimal_body(1372)
+    page = parse_body(body)
+    with pytest.raises(ValueError, match="has days 1-30"):
+        add_entry(page, CalendarDate(year=1380, month_or_special_day="Kythorn", day=40), "Event")
+    assert render_body(page) == body
+
+
 def test_add_entry_normal_month_day_insertion() -> None:
     page = parse_body(_make_minimal_body(1372))
     add_entry(page, CalendarDate(year=1372, month_or_special_day="Hammer", day=2), "New Battle")
@@ -478,3 +489,153 @@ def test_add_entry_round_trip_after_mutation() -> None:
     add_entry(page, CalendarDate(year=1372, month_or_special_day="Hammer", day=1), "Test Entry")
     rendered = render_body(page)
     assert render_body(parse_body(rendered)) == rendered
+
+
+# ── CalendarIndex ─────────────────────────────────────────────────────────────
+
+
+def _build_indexed_page_with_entries() -> CalendarPage:
+    return parse_body(_make_minimal_body(1373) + _make_minimal_body(1372), index=True)
+
+
+def test_parse_body_without_index() -> None:
+    assert _build_page_with_entries().index is None
+
+
+def test_parse_body_index_lists_dated_entries_chronologically() -> None:
+    page = _build_indexed_page_with_entries()
+    assert page.index is not None
+    assert [(d.year, d.month_or_special_day, d.day) for d, _ in page.index.entries] == [
+        (1372, "Hammer", 1),
+        (1372, "Midwinter", None),
+        (1373, "Hammer", 1),
+        (1373, "Midwinter", None),
+    ]
+    assert page.index.ordinals == sorted(page.index.ordinals)
+
+
+@pytest.mark.parametrize(
+    "start,end",
+    [
+        pytest.param((1372, "Hammer", 1), None, id="single-date"),
+        pytest.param((1372, "Hammer", 2), None, id="single-date-no-entries"),
+        pytest.param((1372, "Midwinter", None), None, id="special-day"),
+        pytest.param((1372, "Hammer", 30), (1372, "Alturiak", 1), id="special-day-in-range"),
+        pytest.param((1372, "Hammer", 1), (1373, "Hammer", 1), id="multi-year"),
+        pytest.param((1300, "Hammer", 1), (1400, "Nightal", 30), id="everything"),
+        pytest.param((1380, "Hammer", 1), (1390, "Hammer", 1), id="outside-calendar"),
+    ],
+)
+def test_get_entries_with_index_matches_scan(
+    start: tuple[int, str, int | None],
+    end: tuple[int, str, int | None] | None,
+) -> None:
+    start_date = CalendarDate(year=start[0], month_or_special_day=start[1], day=start[2])
+    end_date = CalendarDate(year=end[0], month_or_special_day=end[1], day=end[2]) if end else None
+    expected = get_entries(_build_page_with_entries(), start_date, end_date)
+    assert get_entries(_build_indexed_page_with_entries(), start_date, end_date) == expected
+
+
+def test_get_entries_with_index_start_greater_than_end_raises() -> None:
+    page = _build_indexed_page_with_entries()
+    start = CalendarDate(year=1373, month_or_special_day="Hammer", day=1)
+    end = CalendarDate(year=1372, month_or_special_day="Hammer", day=1)
+    with pytest.raises(ValueError, match="start date"):
+        get_entries(page, start, end)
+
+
+def test_get_entries_with_index_returns_copies() -> None:
+    page = _build_indexed_page_with_entries()
+    date = CalendarDate(year=1372, month_or_special_day="Hammer", day=1)
+    get_entries(page, date)[0][1].append("Tampered")
+    assert get_entries(page, date)[0][1] == ["Battle of Bones"]
+
+
+def test_add_entry_keeps_index_in_sync() -> None:
+    page = _build_indexed_page_with_entries()
+    add_entry(page, CalendarDate(year=1372, month_or_special_day="Hammer", day=1), "Second Event")
+    add_entry(page, CalendarDate(year=1372, month_or_special_day="Hammer", day=2), "New Battle")
+    add_entry(page, CalendarDate(year=1372, month_or_special_day="Midwinter"), "Midwinter Gala")
+    add_entry(page, CalendarDate(year=1372, month_or_special_day="Nightal", day=10), "Winter Solstice")
+    add_entry(page, CalendarDate(year=1400, month_or_special_day="Ches", day=1), "Future Event")
+    add_entry(page, CalendarDate(year=1372, month_or_special_day="Shieldmeet"), "Grand Council")
+    assert page.index == parse_body(render_body(page), index=True).index
+
+
+def test_add_entry_indexed_entry_is_queryable() -> None:
+    page = _build_indexed_page_with_entries()
+    date = CalendarDate(year=1372, month_or_special_day="Hammer", day=2)
+    add_entry(page, date, "New Battle")
+    assert get_entries(page, date) == [(date, ["New Battle"])]
+
+
+# ── add_entries ───────────────────────────────────────────────────────────────
+
+
+def test_add_entries_adds_all_valid_entries() -> None:
+    page = parse_body(_make_minimal_body(1372))
+    errors = add_entries(
+        page,
+        [
+            (CalendarDate(year=1372, month_or_special_day="Hammer", day=2), "New Battle"),
+            (CalendarDate(year=1372, month_or_special_day="Midwinter"), "Midwinter Gala"),
+            (CalendarDate(year=1372, month_or_special_day="Nightal", day=10), "Winter Solstice"),
+        ],
+    )
+    assert errors == [None, None, None]
+    rendered = render_body(page)
+    for title in ("New Battle", "Midwinter Gala", "Winter Solstice"):
+        assert f"[[{title} | {title}]]" in rendered
+
+
+def test_add_entries_matches_sequential_add_entry() -> None:
+    entries = [
+        (CalendarDate(year=1372, month_or_special_day="Hammer", day=1), "Second Event"),
+        (CalendarDate(year=1372, month_or_special_day="Hammer", day=1), "Third Event"),
+        (CalendarDate(year=1400, month_or_special_day="Ches", day=1), "Future Event"),
+    ]
+    batched = parse_body(_make_minimal_body(1372))
+    add_entries(batched, entries)
+    sequential = parse_body(_make_minimal_body(1372))
+    for date, title in entries:
+        add_entry(sequential, date, title)
+    assert render_body(batched) == render_body(sequential)
+
+
+def test_add_entries_reports_invalid_entries_and_keeps_going() -> None:
+    page = parse_body(_make_minimal_body(1373))
+    errors = add_entries(
+        page,
+        [
+            (CalendarDate(year=1373, month_or_special_day="Shieldmeet"), "Bad Council"),
+            (CalendarDate(year=1373, month_or_special_day="Hammer", day=2), "Good Battle"),
+            (CalendarDate(year=1373, month_or_special_day="Hammer"), "No Day"),
+        ],
+    )
+    assert errors[0] is not None
+    assert "not a leap year" in errors[0]
+    assert errors[1] is None
+    assert errors[2] is not None
+    assert "day number" in errors[2]
+    rendered = render_body(page)
+    assert "[[Good Battle | Good Battle]]" in rendered
+    assert "Bad Council" not in rendered
+    assert "No Day" not in rendered
+
+
+def test_add_entries_keeps_index_in_sync() -> None:
+    page = _build_indexed_page_with_entries()
+    add_entries(
+        page,
+        [
+            (CalendarDate(year=1372, month_or_special_day="Hammer", day=2), "New Battle"),
+            (CalendarDate(year=1373, month_or_special_day="Greengrass"), "Spring Fair"),
+        ],
+    )
+    assert page.index == parse_body(render_body(page), index=True).index
+
+
+def test_add_entries_empty_list() -> None:
+    page = parse_body(_make_minimal_body(1372))
+    assert add_entries(page, []) == []
+    assert render_body(page) == _make_minimal_body(1372)
@@ -0,0 +1,154 @@
+"""Tests for obsidian_portal/catalog_cache.py."""
+
+import asyncio
+
+from lorekeeper.obsidian_portal.catalog_cache import CatalogCache
+
+
+class _CountingLoader:
+    def __init__(self, *, delay: float = 0) -> None:
+        self.calls: list[str] = []
+        self.delay = delay
+
+    async def __call__(self, campaign_id: str) -> list[str]:
+        self.calls.append(campaign_id)
+        await asyncio.sleep(self.delay)
+        return [f"{campaign_id}-{len(self.calls)}"]
+
+
+def test_get_loads_once_within_ttl() -> None:
+    load = _CountingLoader()
+    cache = CatalogCache(load, ttl_seconds=60)
+
+    async def run() -> tuple[list[str], list[str]]:
+        return await cache.get("a"), await cache.get("a")
+
+    first, second = asyncio.run(run())
+    assert first == second == ["a-1"]
+    assert load.calls == ["a"]
+
+
+def test_get_keeps_campaigns_separate() -> None:
+    load = _CountingLoader()
+    cache = CatalogCache(load, ttl_seconds=60)
+
+    async def run() -> tuple[list[str], list[str]]:
+        return await cache.get("a"), await cache.get("b")
+
+    assert asyncio.run(run()) == (["a-1"], ["b-2"])
+
+
+def test_get_reloads_after_ttl() -> None:
+    load = _CountingLoader()
+    cache = CatalogCache(load, ttl_seconds=0)
+
+    async def run() -> tuple[list[str], list[str]]:
+        return await cache.get("a"), await cache.get("a")
+
+    assert asyncio.run(run()) == (["a-1"], ["a-2"])
+
+
+def test_invalidate_forces_reload() -> None:
+    load = _CountingLoader()
+    cache = CatalogCache(load, ttl_seconds=60)
+
+    async def run() -> tuple[list[str], list[str]]:
+        first = await cache.get("a")
+        cache.invalidate("a")
+        return first, await cache.get("a")
+
+    assert asyncio.run(run()) == (["a-1"], ["a-2"])
+
+
+def test_concurrent_misses_share_one_load() -> None:
+    load = _CountingLoader(delay=0.01)
+    cache = CatalogCache(load, ttl_seconds=60)
+
+    async def run() -> list[list[str]]:
+        return await asyncio.gather(*(cache.get("a") for _ in range(5)))
+
+    assert asyncio.run(run()) == [["a-1"]] * 5
+    assert load.calls == ["a"]
+
+
+def test_load_overlapping_invalidate_is_not_cached() -> None:
+    load = _CountingLoader(delay=0.01)
+    cache = CatalogCache(load, ttl_seconds=60)
+
+    async def run() -> tuple[list[str], list[str]]:
+        pending = asyncio.create_task(cache.get("a"))
+        await asyncio.sleep(0)  # let the load start
+        cache.invalidate("a")
+        return await pending, await cache.get("a")
+
+    assert asyncio.run(run()) == (["a-1"], ["a-2"])
+
+
+def test_background_refresh_serves_stale_catalog_while_reloading() -> None:
+    load = _CountingLoader()
+    cache = CatalogCache(load, ttl_seconds=0.01, refresh_in_background=True)
+
+    async def run() -> tuple[list[str], list[str], list[str]]:
+        first = await cache.get("a")
+        await asyncio.sleep(0.02)  # let it expire
+        stale = await cache.get("a")
+        await asyncio.sleep(0.01)  # let the refresh finish
+        return first, stale, cache._entries["a"][1]
+
+    assert asyncio.run(run()) == (["a-1"], ["a-1"], ["a-2"])
+
+
+def test_background_refresh_without_ttl_loads_every_read() -> None:
+    load = _CountingLoader()
+    cache = CatalogCache(load, ttl_seconds=0, refresh_in_background=True)
+
+    async def run() -> tuple[list[str], list[str]]:
+        return await cache.get("a"), await cache.get("a")
+
+    assert asyncio.run(run()) == (["a-1"], ["a-2"])
+
+
+def test_failed_background_refresh_keeps_old_catalog() -> None:
+    load = _CountingLoader()
+    cache = CatalogCache(load, ttl_seconds=0.01, refresh_in_background=True)
+
+    async def run() -> list[str]:
+        await cache.get("a")
+        await asyncio.sleep(0.02)  # let it expire
+
+        async def fail(campaign_id: str) -> list[str]:
+            await asyncio.sleep(0)
+            raise RuntimeError(campaign_id)
+
+        cache._load = fail
+        await cache.get("a")
+        await asyncio.sleep(0.01)
+        return await cache.get("a")
+
+    assert asyncio.run(run()) == ["a-1"]
+
+
+def test_update_changes_cached_catalog_in_place() -> None:
+    load = _CountingLoader()
+    cache = CatalogCache(load, ttl_seconds=60)
+
+    async def run() -> list[str]:
+        await cache.get("a")
+        cache.update("a", lambda catalog: catalog.append("new"))
+        return await cache.get("a")
+
+    assert asyncio.run(run()) == ["a-1", "new"]
+    assert load.calls == ["a"]
+
+
+def test_load_overlapping_update_is_not_cached() -> None:
+    load = _CountingLoader(delay=0.01)
+    cache = CatalogCache(load, ttl_seconds=60)
+
+    async def run() -> tuple[list[str], list[str]]:
+        pending = asyncio.create_task(cache.get("a"))
+        await asyncio.sleep(0)
+        cache.update("a", lambda catalog: catalog.append("new"))
+        return await pending, await cache.get("a")
+
+    assert asyncio.run(run()) == (["a-1"], ["a-2"])
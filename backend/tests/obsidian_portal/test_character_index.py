@@ -0,0 +1,61 @@
+"""Tests for obsidian_portal/character_index.py."""
+
+import pytest
+
+from lorekeeper.obsidian_portal.character_index import CharacterIndex
+from lorekeeper.obsidian_portal.models import CharacterCatalog
+
+
+def _character(name: str, slug: str | None = None) -> CharacterCatalog:
+    return CharacterCatalog(
+        id=name.lower().replace(" ", "")[:32],
+        slug=slug or name.lower().replace(" ", "-"),
+        name=name,
+        is_player_character=False,
+    )
+
+
+_CHARACTERS = [
+    _character("Allandra Grey"),
+    _character("Greyhawk the Elder"),
+    _character("Tobin Underhill"),
+    _character("Mira", slug="mira-the-red"),
+]
+
+
+def _naive_search(characters: list[CharacterCatalog], text: str) -> list[CharacterCatalog]:
+    needle = text.lower()
+    return [c for c in characters if needle in c.name.lower() or needle in c.slug.lower()]
+
+
+@pytest.mark.parametrize("text", ["grey", "GREY", "a", "hill", "Allandra Grey", "the", "-", "zzz", "mira-the"])
+def test_search_matches_substring_scan(text: str) -> None:
+    assert CharacterIndex(_CHARACTERS).search(text) == _naive_search(_CHARACTERS, text)
+
+
+def test_search_returns_each_character_once_in_catalog_order() -> None:
+    index = CharacterIndex(_CHARACTERS)
+    assert [c.name for c in index.search("e")] == ["Allandra Grey", "Greyhawk the Elder", "Tobin Underhill", "Mira"]
+
+
+def test_search_matches_slug() -> None:
+    assert [c.name for c in CharacterIndex(_CHARACTERS).search("red")] == ["Mira"]
+
+
+def test_add_makes_character_searchable() -> None:
+    index = CharacterIndex(_CHARACTERS)
+    index.add(_character("Grey Warden"))
+    assert [c.name for c in index.search("grey")] == ["Allandra Grey", "Greyhawk the Elder", "Grey Warden"]
+    assert index.characters[-1].name == "Grey Warden"
+
+
+def test_characters_returns_a_copy() -> None:
+    index = CharacterIndex(_CHARACTERS)
+    index.characters.clear()
+    assert len(index.characters) == len(_CHARACTERS)
+
+
+def test_empty_index() -> None:
+    index = CharacterIndex([])
+    assert index.characters == []
+    assert index.search("grey") == []
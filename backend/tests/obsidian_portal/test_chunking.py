@@ -0,0 +1,87 @@
+"""Tests for chunk_text() and the overlap-aware merge helpers in obsidian_portal/chunking.py."""
+
+import pytest
+
+from lorekeeper.obsidian_portal.chunking import (
+    GAP_MARKER,
+    TRUNCATION_MARKER,
+    chunk_text,
+    estimate_tokens,
+    merge_chunks,
+    pack_chunks,
+    strip_overlap,
+)
+
+
+def _paragraphs(count: int, length: int) -> str:
+    return "\n".join(f"Paragraph {i}: " + "lorem ipsum " * (length // 12) for i in range(count))
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        pytest.param(_paragraphs(20, 200), id="many-short-paragraphs"),
+        pytest.param(_paragraphs(5, 900), id="paragraphs-longer-than-a-chunk"),
+        pytest.param(_paragraphs(40, 60), id="tiny-paragraphs"),
+    ],
+)
+def test_merge_all_chunks_restores_text(text: str) -> None:
+    chunks = chunk_text(text)
+    assert len(chunks) > 1
+    assert merge_chunks(list(enumerate(chunks))) == "\n".join(line.strip() for line in text.split("\n"))
+
+
+def test_merge_single_chunk_returns_it_unchanged() -> None:
+    assert merge_chunks([(3, "only chunk")]) == "only chunk"
+
+
+def test_merge_empty_returns_empty_string() -> None:
+    assert merge_chunks([]) == ""
+
+
+def test_merge_orders_by_chunk_index() -> None:
+    chunks = chunk_text(_paragraphs(20, 200))
+    shuffled = [(2, chunks[2]), (0, chunks[0]), (1, chunks[1])]
+    assert merge_chunks(shuffled) == merge_chunks([(0, chunks[0]), (1, chunks[1]), (2, chunks[2])])
+
+
+def test_merge_marks_gaps_between_non_consecutive_chunks() -> None:
+    chunks = chunk_text(_paragraphs(20, 200))
+    merged = merge_chunks([(0, chunks[0]), (3, chunks[3])])
+    assert merged == f"{chunks[0]}\n{GAP_MARKER}\n{chunks[3]}"
+
+
+def test_merge_ignores_duplicate_indices() -> None:
+    chunks = chunk_text(_paragraphs(20, 200))
+    assert merge_chunks([(0, chunks[0]), (0, chunks[0]), (1, chunks[1])]) == merge_chunks([
+        (0, chunks[0]),
+        (1, chunks[1]),
+    ])
+
+
+def test_strip_overlap_leaves_unrelated_chunk_unchanged() -> None:
+    assert strip_overlap("The end of one page.", "A different page.") == "A different page."
+
+
+# ── pack_chunks ───────────────────────────────────────────────────────────────
+
+
+def test_pack_keeps_everything_within_budget_and_strips_overlap() -> None:
+    chunks = dict(enumerate(chunk_text(_paragraphs(20, 200))))
+    packed = pack_chunks(chunks, priority=list(chunks), max_tokens=100_000)
+    assert list(packed) == list(chunks)
+    assert "\n".join(packed.values()) == merge_chunks(list(chunks.items()))
+
+
+def test_pack_follows_priority_and_returns_chunk_order() -> None:
+    chunks = dict(enumerate(chunk_text(_paragraphs(20, 200))))
+    budget = estimate_tokens(chunks[5]) + estimate_tokens(chunks[4]) + 10
+    packed = pack_chunks(chunks, priority=[5, 4, 6, 3, 7], max_tokens=budget)
+    assert list(packed) == [4, 5]
+    assert packed[5] == strip_overlap(chunks[4], chunks[5])
+
+
+def test_pack_truncates_first_chunk_when_nothing_fits() -> None:
+    chunks = {0: "a" * 400, 1: "b" * 400}
+    packed = pack_chunks(chunks, priority=[1, 0], max_tokens=10)
+    assert packed == {1: "b" * 40 + TRUNCATION_MARKER}
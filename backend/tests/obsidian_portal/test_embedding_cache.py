@@ -0,0 +1,61 @@
+"""Tests for obsidian_portal/embedding_cache.py."""
+
+from pathlib import Path
+
+import numpy as np
+
+from lorekeeper.obsidian_portal.embedding_cache import EmbeddingCache
+
+
+def _vector(value: float) -> np.ndarray:
+    return np.full(4, value, dtype=np.float32)
+
+
+def _cache(path: Path, *, model_name: str = "model", chunking_version: int = 1) -> EmbeddingCache:
+    return EmbeddingCache(path / "cache.sqlite3", model_name=model_name, chunking_version=chunking_version)
+
+
+def test_put_chunks_hit_and_others_miss(tmp_path: Path) -> None:
+    cache = _cache(tmp_path)
+    cache.put_many(["a", "b"], [_vector(1), _vector(2)])
+
+    vectors = cache.get_many(["b", "c", "a"])
+
+    assert vectors[0] is not None
+    assert vectors[2] is not None
+    np.testing.assert_array_equal(vectors[0], _vector(2))
+    assert vectors[1] is None
+    np.testing.assert_array_equal(vectors[2], _vector(1))
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_other_model_misses(tmp_path: Path) -> None:
+    _cache(tmp_path).put_many(["a"], [_vector(1)])
+    assert _cache(tmp_path, model_name="other-model").get_many(["a"]) == [None]
+
+
+def test_other_chunking_version_misses(tmp_path: Path) -> None:
+    _cache(tmp_path).put_many(["a"], [_vector(1)])
+    assert _cache(tmp_path, chunking_version=2).get_many(["a"]) == [None]
+
+
+def test_embeddings_persist_across_instances(tmp_path: Path) -> None:
+    cache = _cache(tmp_path)
+    cache.put_many(["a"], [_vector(1)])
+    cache.close()
+
+    reopened = _cache(tmp_path)
+    [vector] = reopened.get_many(["a"])
+    assert vector is not None
+    np.testing.assert_array_equal(vector, _vector(1))
+
+
+def test_lookups_are_batched_below_the_parameter_limit(tmp_path: Path) -> None:
+    cache = _cache(tmp_path)
+    chunks = [f"chunk {i}" for i in range(1200)]
+    cache.put_many(chunks, [_vector(i) for i in range(1200)])
+
+    vectors = cache.get_many(chunks)
+
+    assert all(vector is not None for vector in vectors)
+    assert cache.hits == 1200
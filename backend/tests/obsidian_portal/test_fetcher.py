@@ -0,0 +1,144 @@
+"""Tests for the collection versioning in obsidian_portal/fetcher.py, against a fake Qdrant."""
+
+import asyncio
+from typing import cast
+
+import pytest
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import (
+    AliasDescription,
+    CollectionDescription,
+    CollectionsAliasesResponse,
+    CollectionsResponse,
+    CreateAliasOperation,
+    DeleteAliasOperation,
+)
+
+from lorekeeper.config import settings
+from lorekeeper.obsidian_portal import fetcher
+
+_ALIAS = "lore"
+
+
+def _version(n: int) -> str:
+    return f"{_ALIAS}_2024010100000{n}"
+
+
+class _FakeQdrant:
+    """Collections and aliases, with just the calls the fetcher's versioning makes."""
+
+    def __init__(self, collections: list[str], *, live: str | None = None) -> None:
+        self.collections = set(collections)
+        self.aliases = {_ALIAS: live} if live is not None else {}
+        self.deleted: list[str] = []
+
+    async def get_aliases(self) -> CollectionsAliasesResponse:
+        await asyncio.sleep(0)
+        return CollectionsAliasesResponse(
+            aliases=[AliasDescription(alias_name=alias, collection_name=name) for alias, name in self.aliases.items()],
+        )
+
+    async def collection_exists(self, collection_name: str) -> bool:
+        await asyncio.sleep(0)
+        return collection_name in self.collections
+
+    async def get_collections(self) -> CollectionsResponse:
+        await asyncio.sleep(0)
+        return CollectionsResponse(collections=[CollectionDescription(name=name) for name in self.collections])
+
+    async def delete_collection(self, collection_name: str) -> bool:
+        await asyncio.sleep(0)
+        self.collections.discard(collection_name)
+        self.deleted.append(collection_name)
+        return True
+
+    async def update_collection_aliases(
+        self,
+        *,
+        change_aliases_operations: list[CreateAliasOperation | DeleteAliasOperation],
+    ) -> bool:
+        await asyncio.sleep(0)
+        for operation in change_aliases_operations:
+            if isinstance(operation, DeleteAliasOperation):
+                del self.aliases[operation.delete_alias.alias_name]
+            else:
+                assert operation.create_alias.alias_name not in self.collections
+                self.aliases[operation.create_alias.alias_name] = operation.create_alias.collection_name
+        return True
+
+
+def _prune(qdrant: _FakeQdrant, *, previous_collection: str | None) -> None:
+    client = cast("AsyncQdrantClient", qdrant)
+    asyncio.run(fetcher._prune_collection_versions(client, _ALIAS, previous_collection=previous_collection))
+
+
+@pytest.mark.parametrize("keep", [1, 2])
+def test_prune_deletes_versions_beyond_the_ones_to_keep(monkeypatch: pytest.MonkeyPatch, keep: int) -> None:
+    monkeypatch.setattr(settings, "collection_versions_to_keep", keep)
+    qdrant = _FakeQdrant([_version(n) for n in range(1, 5)], live=_version(4))
+
+    _prune(qdrant, previous_collection=_version(3))
+
+    assert sorted(qdrant.collections) == [_version(n) for n in range(4 - keep, 5)]
+
+
+@pytest.mark.parametrize("keep", [3, 4])
+def test_prune_keeps_every_version_when_there_are_fewer_than_to_keep(
+    monkeypatch: pytest.MonkeyPatch,
+    keep: int,
+) -> None:
+    monkeypatch.setattr(settings, "collection_versions_to_keep", keep)
+    qdrant = _FakeQdrant([_version(n) for n in range(1, 4)], live=_version(3))
+
+    _prune(qdrant, previous_collection=_version(2))
+
+    assert qdrant.deleted == []
+
+
+def test_prune_without_versions_to_keep_deletes_all_but_the_live_one(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "collection_versions_to_keep", 0)
+    qdrant = _FakeQdrant([_version(n) for n in range(1, 4)], live=_version(3))
+
+    _prune(qdrant, previous_collection=_version(2))
+
+    assert qdrant.collections == {_version(3)}
+
+
+def test_prune_keeps_the_version_rolled_back_to_over_newer_ones(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "collection_versions_to_keep", 1)
+    # Version 2 was live after a rollback from 3; the rebuild just made 4 live
+    qdrant = _FakeQdrant([_version(n) for n in range(1, 5)], live=_version(4))
+
+    _prune(qdrant, previous_collection=_version(2))
+
+    assert qdrant.collections == {_version(2), _version(4)}
+
+
+def test_switch_alias_moves_the_alias_to_the_new_version() -> None:
+    qdrant = _FakeQdrant([_version(1), _version(2)], live=_version(1))
+
+    asyncio.run(fetcher._switch_alias(cast("AsyncQdrantClient", qdrant), _ALIAS, _version(2)))
+
+    assert qdrant.aliases == {_ALIAS: _version(2)}
+    assert qdrant.deleted == []
+
+
+def test_switch_alias_replaces_a_pre_alias_collection() -> None:
+    qdrant = _FakeQdrant([_ALIAS, _version(1)])
+
+    asyncio.run(fetcher._switch_alias(cast("AsyncQdrantClient", qdrant), _ALIAS, _version(1)))
+
+    assert qdrant.aliases == {_ALIAS: _version(1)}
+    assert qdrant.deleted == [_ALIAS]
+
+
+def test_rollback_points_the_alias_at_the_previous_version(monkeypatch: pytest.MonkeyPatch) -> None:
+    qdrant = _FakeQdrant([_version(n) for n in range(1, 4)], live=_version(3))
+    monkeypatch.setattr(fetcher, "AsyncQdrantClient", lambda **_: qdrant)
+
+    asyncio.run(fetcher.rollback())
+    assert qdrant.aliases == {_ALIAS: _version(2)}
+    asyncio.run(fetcher.rollback())
+    assert qdrant.aliases == {_ALIAS: _version(1)}
+    with pytest.raises(RuntimeError, match="No collection version older"):
+        asyncio.run(fetcher.rollback())
@@ -0,0 +1,87 @@
+"""Tests for obsidian_portal/ingest.py."""
+
+from pathlib import Path
+from typing import cast
+
+import numpy as np
+from fastembed import TextEmbedding
+
+from lorekeeper.obsidian_portal.embedding_cache import EmbeddingCache
+from lorekeeper.obsidian_portal.ingest import ChunkedDocument, chunk_document, embed_documents
+from lorekeeper.obsidian_portal.models import Page
+
+
+class _FakeModel:
+    def __init__(self) -> None:
+        self.embedded: list[str] = []
+
+    def embed(self, chunks: list[str], batch_size: int = 256) -> list[np.ndarray]:
+        self.embedded.extend(chunks)
+        return [np.full(4, len(chunk), dtype=np.float32) for chunk in chunks]
+
+
+class _ModelLoader:
+    def __init__(self) -> None:
+        self.model = _FakeModel()
+        self.loads = 0
+
+    def __call__(self) -> TextEmbedding:
+        self.loads += 1
+        return cast("TextEmbedding", self.model)
+
+
+def _chunked(doc_id: str, body: str) -> ChunkedDocument:
+    return chunk_document(
+        Page.model_validate({
+            "id": doc_id,
+            "slug": doc_id,
+            "type": "WikiPage",
+            "name": doc_id,
+            "body": body,
+            "wiki_page_url": f"https://example.com/{doc_id}",
+            "created_at": "2024-01-01T00:00:00Z",
+            "updated_at": "2024-01-01T00:00:00Z",
+            "is_game_master_only": False,
+            "tags": [],
+        }),
+    )
+
+
+def _cache(tmp_path: Path) -> EmbeddingCache:
+    return EmbeddingCache(tmp_path / "cache.sqlite3", model_name="model", chunking_version=1)
+
+
+def test_embed_documents_returns_points_per_document() -> None:
+    load = _ModelLoader()
+    docs = [_chunked("a", "First page"), _chunked("b", "Second page")]
+
+    embedded = embed_documents(docs, load)
+
+    assert [[point.payload["metadata"]["id"] for point in points if point.payload] for points in embedded.points] == [
+        ["a"],
+        ["b"],
+    ]
+    assert load.model.embedded == ["First page", "Second page"]
+
+
+def test_embed_documents_only_embeds_cache_misses(tmp_path: Path) -> None:
+    cache = _cache(tmp_path)
+    embed_documents([_chunked("a", "First page")], _ModelLoader(), cache=cache)
+    load = _ModelLoader()
+
+    embed_documents([_chunked("a", "First page"), _chunked("b", "Second page")], load, cache=cache)
+
+    assert load.model.embedded == ["Second page"]
+
+
+def test_embed_documents_does_not_load_model_when_every_chunk_hits(tmp_path: Path) -> None:
+    cache = _cache(tmp_path)
+    docs = [_chunked("a", "First page"), _chunked("b", "Second page")]
+    embed_documents(docs, _ModelLoader(), cache=cache)
+    load = _ModelLoader()
+
+    embedded = embed_documents(docs, load, cache=cache)
+
+    assert load.loads == 0
+    assert embedded.embed_seconds == 0
+    assert [len(points) for points in embedded.points] == [1, 1]
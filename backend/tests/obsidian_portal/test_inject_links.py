@@ -125,3 +125,85 @@ def test_partial_word_mention_not_linked() -> None:
     assert new_body == body
     assert applied == []
     assert "goblin" in skipped
+
+
+# ── Mentions interacting with each other ──────────────────────────────────────
+
+
+def test_earlier_mention_takes_precedence_over_overlapping_one() -> None:
+    body = "Allandra Grey waved. Later, Grey left."
+    new_body, applied, _ = inject_links(body, {"Allandra Grey": ":allandra-grey", "Grey": "Grey Wardens"})
+    assert new_body == "[[:allandra-grey | Allandra Grey]] waved. Later, [[Grey Wardens | Grey]] left."
+    assert applied == ["Allandra Grey", "Grey"]
+
+
+def test_mention_inside_earlier_mention_is_skipped_without_other_occurrence() -> None:
+    body = "The Steel Dragon inn was quiet."
+    new_body, applied, skipped = inject_links(body, {"Steel Dragon": "Steel Dragon inn, the", "Dragon": "Dragons"})
+    assert new_body == "The [[Steel Dragon inn, the | Steel Dragon]] inn was quiet."
+    assert applied == ["Steel Dragon"]
+    assert skipped == ["Dragon"]
+
+
+def test_target_linked_by_earlier_mention_is_skipped() -> None:
+    body = "Allandra, also called Lady Grey, arrived."
+    new_body, applied, skipped = inject_links(body, {"Allandra": ":allandra-grey", "Lady Grey": ":allandra-grey"})
+    assert new_body == "[[:allandra-grey | Allandra]], also called Lady Grey, arrived."
+    assert applied == ["Allandra"]
+    assert skipped == ["Lady Grey"]
+
+
+def test_links_are_placed_by_position_not_mention_order() -> None:
+    body = "Brandis met Allandra."
+    new_body, applied, _ = inject_links(body, {"Allandra": ":allandra-grey", "Brandis": ":brandis-springvale"})
+    assert new_body == "[[:brandis-springvale | Brandis]] met [[:allandra-grey | Allandra]]."
+    assert applied == ["Allandra", "Brandis"]
+
+
+def test_mention_overlapping_an_earlier_link_does_not_hide_its_next_occurrence() -> None:
+    body = "Allandra Grey Grey Grey"
+    new_body, applied, _ = inject_links(body, {"Allandra Grey": ":allandra-grey", "Grey Grey": "Grey Grey"})
+    assert new_body == "[[:allandra-grey | Allandra Grey]] [[Grey Grey | Grey Grey]]"
+    assert applied == ["Allandra Grey", "Grey Grey"]
+
+
+def test_whitespace_mentions_match_text_next_to_earlier_links() -> None:
+    new_body, applied, _ = inject_links("a   b", {" ": "x", "  ": "y"})
+    assert new_body == "a[[x |  ]][[y |   ]]b"
+    assert applied == [" ", "  "]
+
+
+def test_link_closing_an_unclosed_link_protects_the_text_before_it() -> None:
+    # The inserted link ends the [[ left open before it, so Brandis is then inside a link
+    body = "See [[notes about Brandis and Allandra"
+    new_body, applied, skipped = inject_links(body, {"Allandra": ":allandra-grey", "Brandis": ":brandis-springvale"})
+    assert new_body == "See [[notes about Brandis and [[:allandra-grey | Allandra]]"
+    assert applied == ["Allandra"]
+    assert skipped == ["Brandis"]
+
+
+def test_target_with_a_pipe_is_matched_whole() -> None:
+    body = "[[Grey | Wardens | the Wardens]] met Grey."
+    new_body, applied, _ = inject_links(body, {"Grey": "Grey"})
+    assert new_body == "[[Grey | Wardens | the Wardens]] met Grey."
+    assert applied == []
+
+
+@pytest.mark.parametrize(
+    ("body", "entity_links", "expected_body"),
+    # Sigma (\u03c3), final sigma (\u03c2) and capital sigma (\u03a3) all match each other
+    [
+        ("\u03c2", {"\u03c3": "x"}, "[[x | \u03c3]]"),
+        ("\u03a3", {"\u03c2": "x"}, "[[x | \u03c2]]"),
+        ("[[\u03a3 | y]] \u03c3", {"\u03c3": "\u03c2"}, "[[\u03a3 | y]] \u03c3"),
+        ("is\u03a3", {"is\u03c3": "x"}, "[[x | is\u03c3]]"),
+        ("İstanbul", {"istanbul": "x"}, "[[x | istanbul]]"),
+    ],
+)
+def test_mentions_match_case_insensitively_like_a_regex(
+    body: str,
+    entity_links: dict[str, str],
+    expected_body: str,
+) -> None:
+    new_body, _, _ = inject_links(body, entity_links)
+    assert new_body == expected_body
@@ -0,0 +1,123 @@
+"""Tests for obsidian_portal/page_cache.py."""
+
+import httpx
+
+from lorekeeper.obsidian_portal.models import Page
+from lorekeeper.obsidian_portal.page_cache import PageCache
+
+_URL = "https://api.obsidianportal.com/v1/campaigns/c/wikis/p.json"
+
+
+def _page(body: str = "Quest log", updated_at: str = "2024-01-01T00:00:00Z") -> dict:
+    return {
+        "id": "p",
+        "slug": "quest-log",
+        "type": "WikiPage",
+        "name": "Quest Log",
+        "body": body,
+        "wiki_page_url": "https://example.com/quest-log",
+        "created_at": "2023-01-01T00:00:00Z",
+        "updated_at": updated_at,
+        "is_game_master_only": False,
+        "tags": [],
+    }
+
+
+def _response(status_code: int = 200, *, json: dict | None = None, headers: dict | None = None) -> httpx.Response:
+    return httpx.Response(status_code, json=json, headers=headers)
+
+
+def test_no_validators_before_first_fetch() -> None:
+    assert PageCache().request_headers(_URL) == {}
+
+
+def test_sends_validators_of_cached_page() -> None:
+    cache = PageCache()
+    cache.resolve(_URL, _response(json=_page(), headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024"}))
+    assert cache.request_headers(_URL) == {"If-None-Match": '"v1"', "If-Modified-Since": "Mon, 01 Jan 2024"}
+
+
+def test_not_modified_returns_cached_page() -> None:
+    cache = PageCache()
+    page = cache.resolve(_URL, _response(json=_page(), headers={"ETag": '"v1"'}))
+    assert cache.resolve(_URL, _response(304)) is page
+
+
+def test_unchanged_updated_at_reuses_cached_page_when_validators_are_ignored() -> None:
+    cache = PageCache()
+    page = cache.resolve(_URL, _response(json=_page()))
+    assert cache.resolve(_URL, _response(json=_page())) is page
+
+
+def test_changed_page_replaces_cached_one() -> None:
+    cache = PageCache()
+    cache.resolve(_URL, _response(json=_page(), headers={"ETag": '"v1"'}))
+    page = cache.resolve(_URL, _response(json=_page("New", "2024-02-01T00:00:00Z"), headers={"ETag": '"v2"'}))
+    assert page.body == "New"
+    assert cache.request_headers(_URL) == {"If-None-Match": '"v2"'}
+
+
+def test_invalidate_forgets_page() -> None:
+    cache = PageCache()
+    page = cache.resolve(_URL, _response(json=_page(), headers={"ETag": '"v1"'}))
+    cache.invalidate(_URL)
+    assert cache.request_headers(_URL) == {}
+    assert cache.resolve(_URL, _response(json=_page())) is not page
+
+
+class _CountingParser:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, body: str) -> list[str]:
+        self.calls += 1
+        return body.split()
+
+
+def _page_model(body: str = "Quest log", updated_at: str = "2024-01-01T00:00:00Z") -> Page:
+    return Page.model_validate(_page(body, updated_at))
+
+
+def test_parsed_reuses_result_for_same_version() -> None:
+    cache, parse = PageCache(), _CountingParser()
+    first = cache.parsed(_page_model(), parse)
+    assert cache.parsed(_page_model(), parse) is first
+    assert parse.calls == 1
+
+
+def test_parsed_parses_again_when_page_changed() -> None:
+    cache, parse = PageCache(), _CountingParser()
+    cache.parsed(_page_model(), parse)
+    assert cache.parsed(_page_model("New log", "2024-02-01T00:00:00Z"), parse) == ["New", "log"]
+    assert parse.calls == 2
+
+
+def test_parsed_is_kept_per_parser() -> None:
+    cache, parse, other_parse = PageCache(), _CountingParser(), _CountingParser()
+    cache.parsed(_page_model(), parse)
+    cache.parsed(_page_model(), other_parse)
+    assert (parse.calls, other_parse.calls) == (1, 1)
+
+
+def test_written_parse_is_adopted_when_written_body_is_fetched_back() -> None:
+    cache, parse = PageCache(), _CountingParser()
+    parsed = cache.parsed(_page_model(), parse)
+    parsed.append("edited")
+    cache.store_written("p", parse, parsed, body="Quest log edited")
+    assert cache.parsed(_page_model("Quest log edited", "2024-02-01T00:00:00Z"), parse) is parsed
+    assert cache.parsed(_page_model("Quest log edited", "2024-02-01T00:00:00Z"), parse) is parsed
+    assert parse.calls == 1
+
+
+def test_written_parse_is_not_used_when_someone_else_changed_the_page() -> None:
+    cache, parse = PageCache(), _CountingParser()
+    cache.store_written("p", parse, ["Quest", "log", "edited"], body="Quest log edited")
+    assert cache.parsed(_page_model("Other edit", "2024-02-01T00:00:00Z"), parse) == ["Other", "edit"]
+
+
+def test_discard_parsed_forces_parse() -> None:
+    cache, parse = PageCache(), _CountingParser()
+    cache.parsed(_page_model(), parse)
+    cache.discard_parsed("p", parse)
+    cache.parsed(_page_model(), parse)
+    assert parse.calls == 2
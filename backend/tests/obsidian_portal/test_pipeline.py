@@ -0,0 +1,172 @@
+"""Tests for obsidian_portal/pipeline.py."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import cast
+
+import numpy as np
+import pytest
+from fastembed import TextEmbedding
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import Filter, PointStruct
+
+from lorekeeper.obsidian_portal.ingest import StoredDocument, document_hash
+from lorekeeper.obsidian_portal.models import Document, Page
+from lorekeeper.obsidian_portal.pipeline import IngestPipeline
+
+
+class _FakeModel:
+    model_name = "fake"
+
+    @staticmethod
+    def embed(chunks: list[str], batch_size: int = 256) -> list[np.ndarray]:
+        return [np.full(4, len(chunk), dtype=np.float32) for chunk in chunks]
+
+
+class _FakeQdrant:
+    def __init__(self, *, fail: bool = False) -> None:
+        self.upserted: list[str] = []  # document IDs, in upsert order
+        self.delete_requests = 0  # deletions of stale points of updated documents
+        self.fail = fail
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def upsert(self, *, collection_name: str, points: list[PointStruct]) -> None:
+        await self.release.wait()
+        if self.fail:
+            raise RuntimeError("Qdrant is down")
+        for point in points:
+            assert point.payload is not None
+            if point.payload["metadata"]["chunk_index"] == 0:
+                self.upserted.append(point.payload["metadata"]["id"])
+
+    async def delete(self, *, collection_name: str, points_selector: Filter) -> None:
+        await asyncio.sleep(0)
+        self.delete_requests += 1
+
+
+def _page(doc_id: str, body: str | None = None) -> Page:
+    return Page.model_validate({
+        "id": doc_id,
+        "slug": doc_id,
+        "type": "WikiPage",
+        "name": doc_id,
+        "body": body if body is not None else f"Body of {doc_id}",
+        "wiki_page_url": f"https://example.com/{doc_id}",
+        "created_at": "2024-01-01T00:00:00Z",
+        "updated_at": "2024-01-01T00:00:00Z",
+        "is_game_master_only": False,
+        "tags": [],
+    })
+
+
+async def _source(doc_ids: list[str], produced: list[str] | None = None) -> AsyncIterator[Document]:
+    for doc_id in doc_ids:
+        await asyncio.sleep(0)  # like a Portal request
+        if produced is not None:
+            produced.append(doc_id)
+        yield _page(doc_id)
+
+
+def _pipeline(
+    qdrant: _FakeQdrant,
+    *,
+    batch_size: int = 2,
+    stored: dict[str, StoredDocument] | None = None,
+) -> IngestPipeline:
+    return IngestPipeline(
+        cast("AsyncQdrantClient", qdrant),
+        collection_name="lore",
+        stored=stored or {},
+        load_embed_model=lambda: cast("TextEmbedding", _FakeModel()),
+        batch_size=batch_size,
+    )
+
+
+def test_documents_are_upserted_in_source_order() -> None:
+    qdrant = _FakeQdrant()
+    doc_ids = [f"doc-{i}" for i in range(7)]
+
+    stats = asyncio.run(_pipeline(qdrant).run([_source(doc_ids)]))
+
+    assert qdrant.upserted == doc_ids
+    assert stats.seen_ids == set(doc_ids)
+    assert stats.ingested == stats.chunks == len(doc_ids)
+
+
+def test_only_new_and_changed_documents_are_ingested() -> None:
+    qdrant = _FakeQdrant()
+    unchanged, changed = _page("unchanged"), _page("changed")
+    stored = {
+        "unchanged": StoredDocument(updated_at=unchanged.updated_at, content_hash=document_hash(unchanged)),
+        "changed": StoredDocument(updated_at=changed.updated_at, content_hash=document_hash(_page("changed", "Old"))),
+    }
+
+    stats = asyncio.run(_pipeline(qdrant, stored=stored).run([_source(["unchanged", "changed", "new"])]))
+
+    assert qdrant.upserted == ["changed", "new"]
+    assert qdrant.delete_requests == 1  # the stale points of the changed document only
+    assert stats.seen_ids == {"unchanged", "changed", "new"}
+    assert stats.ingested == 2
+
+
+def test_empty_documents_are_skipped_unless_they_have_stale_points() -> None:
+    qdrant = _FakeQdrant()
+    emptied = _page("emptied")
+    old_hash = document_hash(_page("emptied", "Old"))
+    stored = {"emptied": StoredDocument(updated_at=emptied.updated_at, content_hash=old_hash)}
+
+    async def source() -> AsyncIterator[Document]:
+        for page in [_page("empty", ""), _page("emptied", " "), _page("full")]:
+            await asyncio.sleep(0)
+            yield page
+
+    stats = asyncio.run(_pipeline(qdrant, batch_size=1, stored=stored).run([source()]))
+
+    assert qdrant.upserted == ["full"]
+    assert qdrant.delete_requests == 1  # the old points of the emptied document
+    assert stats.seen_ids == {"empty", "emptied", "full"}
+    assert stats.ingested == 2
+
+
+def test_slow_upserts_hold_back_the_sources() -> None:
+    qdrant = _FakeQdrant()
+    qdrant.release.clear()
+    pipeline = _pipeline(qdrant)
+    produced: list[str] = []
+
+    async def run() -> None:
+        task = asyncio.create_task(pipeline.run([_source([f"doc-{i}" for i in range(100)], produced)]))
+        await asyncio.sleep(0.2)  # let every stage fill up behind the blocked upsert
+        assert pipeline._doc_queue.qsize() <= pipeline._doc_queue.maxsize
+        assert pipeline._upsert_queue.qsize() <= pipeline._upsert_queue.maxsize
+        # One batch being upserted, two queued, one waiting to be queued, a full document queue and
+        # the document waiting to get into it
+        assert len(produced) <= 4 * 2 + pipeline._doc_queue.maxsize + 1
+        qdrant.release.set()
+        await asyncio.wait_for(task, timeout=5)
+
+    asyncio.run(run())
+    assert len(qdrant.upserted) == 100
+
+
+def test_failing_source_cancels_the_other_stages() -> None:
+    async def failing_source() -> AsyncIterator[Document]:
+        yield _page("doc-0")
+        await asyncio.sleep(0)
+        raise RuntimeError("Portal is down")
+
+    qdrant = _FakeQdrant()
+    endless = _source([f"doc-{i}" for i in range(10_000)])
+
+    with pytest.raises(ExceptionGroup) as excinfo:
+        asyncio.run(asyncio.wait_for(_pipeline(qdrant).run([failing_source(), endless]), timeout=5))
+    assert excinfo.group_contains(RuntimeError, match="Portal is down")
+
+
+def test_failing_upsert_cancels_the_other_stages() -> None:
+    qdrant = _FakeQdrant(fail=True)
+
+    with pytest.raises(ExceptionGroup) as excinfo:
+        asyncio.run(asyncio.wait_for(_pipeline(qdrant).run([_source([f"doc-{i}" for i in range(100)])]), timeout=5))
+    assert excinfo.group_contains(RuntimeError, match="Qdrant is down")
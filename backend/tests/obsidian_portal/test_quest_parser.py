@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import pytest
 
-from lorekeeper.obsidian_portal.models import Quest, QuestStatus, QuestType
+from lorekeeper.obsidian_portal.models import Quest, QuestStatus, QuestType, QuestUpdate
 from lorekeeper.obsidian_portal.quest_parser import (
     ParsedBody,
     PhaseBlock,
@@ -14,6 +14,7 @@ from lorekeeper.obsidian_portal.quest_parser import (
     _parse_half,
     _parse_items,
     _protect_regions,
+    apply_quest_changes,
     extract_quests,
     insert_quest,
     parse_body,
@@ -557,3 +558,72 @@ def test_get_or_create_sub_creates_new_without_type() -> None:
     assert result.quest_type is None
     assert result.header_html is None
     assert len(phase.sub_sections) == 1
+
+
+# ── apply_quest_changes ───────────────────────────────────────────────────────
+
+
+def test_apply_quest_changes_applies_inserts_and_updates() -> None:
+    parsed = _parsed_with_quest("My Quest")
+    summaries = apply_quest_changes(
+        parsed,
+        inserts=[_make_quest(title="New Quest", phase="Act II")],
+        updates=[QuestUpdate(title="My Quest", new_status="completed")],
+    )
+    assert summaries == ["status: open → completed"]
+    quests = {q.title: q for q in extract_quests(parsed)}
+    assert quests["New Quest"].phase == "Act II"
+    assert quests["My Quest"].status == "completed"
+
+
+def test_apply_quest_changes_matches_sequential_calls() -> None:
+    inserts = [_make_quest(title="New Quest"), _make_quest(title="Side Job", quest_type="Side Quest")]
+    updates = [
+        QuestUpdate(title="My Quest", new_content="more"),
+        QuestUpdate(title="New Quest", new_title="Renamed Quest", new_phase="Act II"),
+    ]
+    batched = _parsed_with_quest("My Quest")
+    apply_quest_changes(batched, inserts=inserts, updates=updates)
+    sequential = _parsed_with_quest("My Quest")
+    for quest in inserts:
+        insert_quest(sequential, quest)
+    for update in updates:
+        update_quest_data(sequential, **update.model_dump())
+    assert render_body(batched) == render_body(sequential)
+
+
+def test_apply_quest_changes_updates_see_earlier_changes() -> None:
+    parsed = _parsed_with_quest("My Quest")
+    apply_quest_changes(
+        parsed,
+        inserts=[],
+        updates=[
+            QuestUpdate(title="My Quest", new_title="Renamed"),
+            QuestUpdate(title="Renamed", new_content="new content"),
+        ],
+    )
+    assert [(q.title, q.content) for q in extract_quests(parsed)] == [("Renamed", "new content")]
+
+
+def test_apply_quest_changes_is_all_or_nothing() -> None:
+    parsed = _parsed_with_quest("My Quest")
+    before = render_body(parsed)
+    with pytest.raises(ValueError, match="No quest changes were applied") as exc_info:
+        apply_quest_changes(
+            parsed,
+            inserts=[_make_quest(title="New Quest"), _make_quest(title="My Quest")],
+            updates=[QuestUpdate(title="My Quest", new_status="failed"), QuestUpdate(title="Missing")],
+        )
+    message = str(exc_info.value)
+    assert "Cannot create quest 'My Quest'" in message
+    assert "Cannot update quest 'Missing'" in message
+    assert "New Quest" not in message
+    assert render_body(parsed) == before
+    assert [q.title for q in extract_quests(parsed)] == ["My Quest"]
+
+
+def test_apply_quest_changes_empty_batch() -> None:
+    parsed = _parsed_with_quest("My Quest")
+    before = render_body(parsed)
+    assert apply_quest_changes(parsed, inserts=[], updates=[]) == []
+    assert render_body(parsed) == before
@@ -0,0 +1,264 @@
+"""Tests for qdrant_mcp_extended.py."""
+
+import asyncio
+from typing import cast
+
+import pytest
+from fastembed import SparseTextEmbedding
+from fastmcp import Context
+from fastmcp.tools import FunctionTool
+from mcp_server_qdrant.embeddings.base import EmbeddingProvider
+from mcp_server_qdrant.qdrant import Entry
+from mcp_server_qdrant.settings import FilterableField, QdrantSettings, ToolSettings
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.http.models import QueryResponse
+from qdrant_client.models import FieldCondition, Filter, MatchValue, QueryRequest, ScoredPoint
+
+from lorekeeper.qdrant_mcp_extended import CachedEmbeddingProvider, ExtendedQdrantMCPServer
+
+
+class _StubProvider(EmbeddingProvider):
+    def __init__(self) -> None:
+        self.queries: list[str] = []
+
+    async def embed_documents(self, documents: list[str]) -> list[list[float]]:
+        return [await self.embed_query(document) for document in documents]
+
+    async def embed_query(self, query: str) -> list[float]:
+        await asyncio.sleep(0)
+        self.queries.append(query)
+        return [float(len(query))]
+
+    def get_vector_name(self) -> str:  # noqa: PLR6301
+        return "dense"
+
+    def get_vector_size(self) -> int:  # noqa: PLR6301
+        return 1
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _cached(
+    inner: EmbeddingProvider,
+    *,
+    max_size: int = 10,
+    ttl_seconds: float = 60,
+    clock: _Clock | None = None,
+) -> CachedEmbeddingProvider:
+    return CachedEmbeddingProvider(inner, max_size=max_size, ttl_seconds=ttl_seconds, clock=clock or _Clock())
+
+
+def _embed(provider: CachedEmbeddingProvider, *queries: str) -> None:
+    async def run() -> None:
+        for query in queries:
+            await provider.embed_query(query)
+
+    asyncio.run(run())
+
+
+def test_repeated_query_skips_the_model() -> None:
+    inner = _StubProvider()
+    _embed(_cached(inner), "Allandra", "Allandra", "  Allandra ")
+    assert inner.queries == ["Allandra"]
+
+
+def test_least_recently_used_query_is_evicted_first() -> None:
+    inner = _StubProvider()
+    provider = _cached(inner, max_size=2)
+    _embed(provider, "a", "b", "a", "c")  # "a" was used after "b", so "b" makes room for "c"
+    inner.queries.clear()
+
+    _embed(provider, "a", "c", "b")
+
+    assert inner.queries == ["b"]
+
+
+def test_query_expires_after_ttl() -> None:
+    inner = _StubProvider()
+    clock = _Clock()
+    provider = _cached(inner, ttl_seconds=10, clock=clock)
+    _embed(provider, "a")
+
+    clock.now = 9.9
+    _embed(provider, "a")
+    assert inner.queries == ["a"]
+
+    clock.now = 10
+    _embed(provider, "a")
+    assert inner.queries == ["a", "a"]
+
+
+def test_zero_size_disables_the_cache() -> None:
+    inner = _StubProvider()
+    _embed(_cached(inner, max_size=0), "a", "a")
+    assert inner.queries == ["a", "a"]
+
+
+def test_embed_queries_only_embeds_missing_queries_once() -> None:
+    inner = _StubProvider()
+    provider = _cached(inner)
+    _embed(provider, "a")
+    inner.queries.clear()
+
+    vectors = asyncio.run(provider.embed_queries(["a", "bb", "bb", "ccc"]))
+
+    assert vectors == [[1.0], [2.0], [2.0], [3.0]]
+    assert sorted(inner.queries) == ["bb", "ccc"]
+
+
+# ── Tools ─────────────────────────────────────────────────────────────────────
+
+
+class _StubQdrantClient:
+    """Answers every query_batch_points request with the next canned response; has no sparse vectors."""
+
+    def __init__(self, responses: list[list[tuple[str, float]]]) -> None:
+        self.responses = responses
+
+    async def collection_exists(self, collection_name: str) -> bool:  # noqa: PLR6301
+        await asyncio.sleep(0)
+        return False
+
+    async def query_batch_points(self, *, collection_name: str, requests: list[QueryRequest]) -> list[QueryResponse]:
+        await asyncio.sleep(0)
+        assert len(requests) == len(self.responses)
+        return [
+            QueryResponse(
+                points=[
+                    ScoredPoint(id=point_id, version=0, score=score, payload={"document": point_id, "metadata": {}})
+                    for point_id, score in hits
+                ],
+            )
+            for hits in self.responses
+        ]
+
+
+class _StubContext:
+    async def debug(self, message: str) -> None:
+        pass
+
+
+def _server(qdrant_settings: QdrantSettings | None = None) -> ExtendedQdrantMCPServer:
+    return ExtendedQdrantMCPServer(
+        tool_settings=ToolSettings(),
+        qdrant_settings=qdrant_settings or QdrantSettings(),
+        embedding_provider=_cached(_StubProvider()),
+        sparse_model=cast("SparseTextEmbedding", None),  # only used for collections with sparse vectors
+        name="test",
+        instructions="",
+    )
+
+
+def _call_tool(server: ExtendedQdrantMCPServer, name: str, **arguments: object) -> list[str]:
+    async def run() -> list[str]:
+        tool = await server.get_tool(name)
+        assert isinstance(tool, FunctionTool)
+        return await tool.fn(ctx=cast("Context", _StubContext()), **arguments)
+
+    return asyncio.run(run())
+
+
+def _find_many(responses: list[list[tuple[str, float]]], queries: list[str]) -> list[str]:
+    server = _server()
+    server.qdrant_connector._client = cast("AsyncQdrantClient", _StubQdrantClient(responses))
+    return _call_tool(server, "qdrant-find-many", queries=queries)
+
+
+def _point_id(n: int) -> str:
+    return f"00000000-0000-0000-0000-{n:012d}"
+
+
+def test_find_many_lists_each_chunk_under_its_best_query() -> None:
+    a, b, c = _point_id(1), _point_id(2), _point_id(3)
+
+    content = _find_many([[(a, 0.9), (b, 0.5)], [(b, 0.8), (c, 0.7)]], ["Allandra", "Brandis"])
+
+    assert content == [
+        "Results for the query 'Allandra'",
+        f"<entry><content>{a}</content><metadata></metadata></entry>",
+        "Results for the query 'Brandis'",
+        f"<entry><content>{b}</content><metadata></metadata></entry>",
+        f"<entry><content>{c}</content><metadata></metadata></entry>",
+    ]
+
+
+def test_find_many_notes_queries_whose_results_are_all_listed_elsewhere() -> None:
+    a = _point_id(1)
+
+    content = _find_many([[(a, 0.9)], [(a, 0.4)], []], ["Allandra", "Grey", "Brandis"])
+
+    assert content == [
+        "Results for the query 'Allandra'",
+        f"<entry><content>{a}</content><metadata></metadata></entry>",
+        "All results for the query 'Grey' are listed under other queries",
+        "No information found for the query 'Brandis'",
+    ]
+
+
+def _record_search_filters(server: ExtendedQdrantMCPServer, monkeypatch: pytest.MonkeyPatch) -> list[Filter | None]:
+    query_filters: list[Filter | None] = []
+
+    async def search(
+        query: str,
+        *,
+        collection_name: str | None = None,
+        limit: int = 10,
+        query_filter: Filter | None = None,
+    ) -> list[Entry]:
+        await asyncio.sleep(0)
+        query_filters.append(query_filter)
+        return [Entry(content=query)]
+
+    monkeypatch.setattr(server.qdrant_connector, "search", search)
+    return query_filters
+
+
+def test_find_passes_an_arbitrary_query_filter_on_when_allowed(monkeypatch: pytest.MonkeyPatch) -> None:
+    server = _server(QdrantSettings.model_validate({"QDRANT_ALLOW_ARBITRARY_FILTER": True}))
+    query_filters = _record_search_filters(server, monkeypatch)
+    query_filter = {"must": [{"key": "metadata.type", "match": {"value": "character"}}]}
+
+    content = _call_tool(server, "qdrant-find", query="Allandra", query_filter=query_filter)
+
+    assert content == [
+        "Results for the query 'Allandra'",
+        "<entry><content>Allandra</content><metadata></metadata></entry>",
+    ]
+    assert query_filters == [Filter(must=[FieldCondition(key="metadata.type", match=MatchValue(value="character"))])]
+
+
+def test_find_hides_the_query_filter_unless_allowed(monkeypatch: pytest.MonkeyPatch) -> None:
+    server = _server()
+    query_filters = _record_search_filters(server, monkeypatch)
+
+    async def parameters() -> dict[str, object]:
+        tool = await server.get_tool("qdrant-find")
+        assert tool is not None
+        return tool.parameters["properties"]
+
+    assert "query_filter" not in asyncio.run(parameters())
+    _call_tool(server, "qdrant-find", query="Allandra")
+    assert query_filters == [None]
+
+
+def test_find_builds_the_query_filter_from_filterable_fields(monkeypatch: pytest.MonkeyPatch) -> None:
+    server = _server(
+        QdrantSettings(
+            filterable_fields=[
+                FilterableField(name="category", description="", field_type="keyword", condition="=="),
+            ],
+        ),
+    )
+    query_filters = _record_search_filters(server, monkeypatch)
+
+    _call_tool(server, "qdrant-find", query="Allandra", category="character")
+
+    assert query_filters == [
+        Filter(must=[FieldCondition(key="metadata.category", match=MatchValue(value="character"))], must_not=[]),
+    ]